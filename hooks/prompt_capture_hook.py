@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""UserPromptSubmit hook that captures prompts for retrospective analysis.
+
+Logging is enabled per architecture project by a `.prompt-log-enabled` marker
+in docs/architecture/active/<project>/ (see /cs:log). Each prompt is filtered
+(secrets, then profanity) before anything touches disk, and appended as one
+compact NDJSON line to PROMPT_LOG.json in that project directory.
+
+Writing never makes the prompt wait:
+
+- An entry is a single O_APPEND write: no lock, no fsync. Concurrent hooks
+  never interleave partial lines. Entries are not batched in the hook: each
+  prompt runs a new process, so nothing outlives the call to hold a batch,
+  and the kernel page cache already coalesces the writes to disk.
+- Once PROMPT_LOG.json grows past a size limit it is rotated into a numbered
+  segment. Indexing (and optional gzip compression) of the segment runs in a
+  detached child process, once per segment instead of once per prompt.
+- PROMPT_LOG.index.json records which sessions and dates each segment holds,
+  so queries for one session or day only read matching segments.
+
+Query captured prompts:
+    prompt_capture_hook.py --query PROJECT_DIR [--session ID] [--date YYYY-MM-DD]
+
+Configuration (environment):
+    PROMPT_CAPTURE_MAX_BYTES  Rotate PROMPT_LOG.json above this size (default 262144)
+    PROMPT_CAPTURE_COMPRESS   Set to 1 to gzip rotated segments
+    PROMPT_CAPTURE_DISABLE    Set to 1 to capture nothing
+
+See: docs/architecture/completed/2025-12-12-prompt-capture-log/ARCHITECTURE.md
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows: rotation is skipped, appends still work
+    fcntl = None
+
+MARKER_FILE = '.prompt-log-enabled'
+LOG_FILE = 'PROMPT_LOG.json'
+INDEX_FILE = 'PROMPT_LOG.index.json'
+LOCK_FILE = '.prompt-log.lock'
+ACTIVE_PROJECTS = os.path.join('docs', 'architecture', 'active')
+
+MAX_BYTES_ENV = 'PROMPT_CAPTURE_MAX_BYTES'
+COMPRESS_ENV = 'PROMPT_CAPTURE_COMPRESS'
+DISABLE_ENV = 'PROMPT_CAPTURE_DISABLE'
+
+DEFAULT_MAX_BYTES = 256 * 1024
+INDEX_VERSION = 1
+
+# Longest prompt stored; longer prompts are truncated
+MAX_CONTENT_CHARS = 50_000
+
+SEGMENT_RE = re.compile(r'^PROMPT_LOG\.(\d+)\.json(\.gz)?$')
+
+# Priority patterns based on gitleaks (filtered before profanity, see ADR-004)
+SECRET_PATTERNS = {
+    'aws_access_key': re.compile(r'\b(?:AKIA|ASIA|ABIA|ACCA)[A-Z2-7]{16}\b'),
+    'github_token': re.compile(r'gh[pousr]_[A-Za-z0-9_]{36,}'),
+    'openai_key': re.compile(r'sk-[a-zA-Z0-9]{20,}T3BlbkFJ[a-zA-Z0-9]{20,}'),
+    'anthropic_key': re.compile(r'sk-ant-api\d{2}-[a-zA-Z0-9_\-]{80,}'),
+    'bearer_token': re.compile(r'Bearer\s+[a-zA-Z0-9\-_.~+/]+=*'),
+    'password_assign': re.compile(
+        r'(?:password|passwd|pwd)\s*[:=]\s*[\'"][^\'"]{8,}[\'"]', re.IGNORECASE
+    ),
+    'connection_string': re.compile(r'(?:mongodb|postgres|mysql|redis)://[^\s\'"]+'),
+    'private_key': re.compile(
+        r'-----BEGIN\s+(?:RSA|DSA|EC|OPENSSH|PGP)?\s*PRIVATE KEY-----'
+    ),
+}
+
+# Optional word lists next to this script, one word per line
+PROFANITY_FILES = ['profanity_words.txt', 'profanity_words_custom.txt']
+
+ARCH_COMMAND_RE = re.compile(r'^\s*(/arch:[a-z]+)\b')
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _load_profanity() -> Optional[re.Pattern]:
+    """Compile the profanity word lists, or None if there are none."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    words = []
+    for name in PROFANITY_FILES:
+        path = os.path.join(script_dir, 'filters', name)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                words.extend(line.strip() for line in f if line.strip()
+                             and not line.startswith('#'))
+        except OSError:
+            continue
+    if not words:
+        return None
+    # "*" in a word matches any run of letters (f*ck matches variations)
+    alternatives = (re.escape(w).replace(r'\*', r'[a-z]*') for w in words)
+    return re.compile(r'\b(?:' + '|'.join(alternatives) + r')\b', re.IGNORECASE)
+
+
+def filter_content(text: str) -> Dict[str, Any]:
+    """Mask secrets, then profanity.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Dict with filtered_text, secret_count, secret_types, profanity_count
+    """
+    secret_types = []
+    secret_count = 0
+    for name, pattern in SECRET_PATTERNS.items():
+        text, count = pattern.subn(f'[SECRET:{name}]', text)
+        if count:
+            secret_count += count
+            secret_types.append(name)
+
+    profanity_count = 0
+    profanity = _load_profanity()
+    if profanity is not None:
+        text, profanity_count = profanity.subn('[FILTERED]', text)
+
+    return {
+        'filtered_text': text,
+        'secret_count': secret_count,
+        'secret_types': secret_types,
+        'profanity_count': profanity_count,
+    }
+
+
+def find_enabled_projects(cwd: str) -> List[str]:
+    """Return active architecture projects with logging enabled.
+
+    Args:
+        cwd: Session working directory
+
+    Returns:
+        Project directories containing the toggle marker
+    """
+    pattern = os.path.join(cwd, ACTIVE_PROJECTS, '*', MARKER_FILE)
+    return sorted(os.path.dirname(path) for path in glob.glob(pattern))
+
+
+def build_entry(input_data: Dict[str, Any], prompt: str) -> Dict[str, Any]:
+    """Build a log entry (schema from the architecture doc).
+
+    Args:
+        input_data: Hook input JSON
+        prompt: Raw user prompt
+
+    Returns:
+        Entry dict with filtered content
+    """
+    truncated = len(prompt) > MAX_CONTENT_CHARS
+    filtered = filter_content(prompt[:MAX_CONTENT_CHARS])
+    command = ARCH_COMMAND_RE.match(prompt)
+    entry = {
+        'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'session_id': input_data.get('session_id') or 'unknown',
+        'type': 'user_input',
+        'command': command.group(1) if command else None,
+        'content': filtered['filtered_text'],
+        'filter_applied': {
+            'profanity_count': filtered['profanity_count'],
+            'secret_count': filtered['secret_count'],
+            'secret_types': filtered['secret_types'],
+        },
+        'metadata': {
+            'content_length': len(prompt),
+            'cwd': input_data.get('cwd', ''),
+        },
+    }
+    if truncated:
+        entry['metadata']['truncated'] = True
+    return entry
+
+
+def append_entry(project_dir: str, entry: Dict[str, Any]) -> int:
+    """Append one entry to the active log with a single unsynced write.
+
+    Args:
+        project_dir: Architecture project directory
+        entry: Log entry
+
+    Returns:
+        Size of the active log after the write
+    """
+    line = json.dumps(entry, separators=(',', ':'), ensure_ascii=False) + '\n'
+    path = os.path.join(project_dir, LOG_FILE)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode('utf-8'))
+        return os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+
+def rotate_if_needed(project_dir: str, size: int, background: bool = True) -> Optional[str]:
+    """Move an oversized active log into a new segment and index it.
+
+    Only one process rotates at a time (non-blocking lock); others skip.
+
+    Args:
+        project_dir: Architecture project directory
+        size: Current size of the active log
+        background: Index and compress in a detached child process
+
+    Returns:
+        Path of the new segment, or None if no rotation happened
+    """
+    max_bytes = _env_int(MAX_BYTES_ENV, DEFAULT_MAX_BYTES)
+    if max_bytes <= 0 or size <= max_bytes or fcntl is None:
+        return None
+
+    lock_fd = os.open(os.path.join(project_dir, LOCK_FILE), os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            # Another hook is rotating
+            return None
+
+        path = os.path.join(project_dir, LOG_FILE)
+        try:
+            if os.stat(path).st_size <= max_bytes:
+                return None
+        except FileNotFoundError:
+            return None
+        segment = os.path.join(project_dir, f'PROMPT_LOG.{_next_segment(project_dir):04d}.json')
+        os.rename(path, segment)
+    finally:
+        os.close(lock_fd)
+
+    compress = os.environ.get(COMPRESS_ENV) == '1'
+    if background and hasattr(os, 'fork'):
+        _detach(lambda: finish_segment(project_dir, segment, compress))
+    else:
+        finish_segment(project_dir, segment, compress)
+    return segment
+
+
+def _next_segment(project_dir: str) -> int:
+    """Return the next unused segment number."""
+    numbers = [int(m.group(1)) for m in
+               (SEGMENT_RE.match(name) for name in os.listdir(project_dir)) if m]
+    return max(numbers, default=0) + 1
+
+
+def _detach(work):
+    """Run work in a grandchild process so the hook can exit immediately."""
+    pid = os.fork()
+    if pid:
+        # Reap the intermediate child; the grandchild is reparented to init
+        os.waitpid(pid, 0)
+        return
+    try:
+        os.setsid()
+        if os.fork() == 0:
+            # Release the hook's stdio so Claude Code is not kept waiting
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            try:
+                work()
+            finally:
+                os._exit(0)
+    finally:
+        os._exit(0)
+
+
+def finish_segment(project_dir: str, segment: str, compress: bool = False) -> str:
+    """Index a rotated segment and optionally gzip it.
+
+    Args:
+        project_dir: Architecture project directory
+        segment: Path of the uncompressed segment
+        compress: Replace the segment with a .gz copy
+
+    Returns:
+        Final segment path
+    """
+    final = segment
+    if compress:
+        final = segment + '.gz'
+        # A hook that opened the log before the rename may still append to
+        # it: recompress until the segment stops growing
+        while True:
+            size = os.stat(segment).st_size
+            with open(segment, 'rb') as src, gzip.open(final + '.tmp', 'wb') as dst:
+                dst.write(src.read(size))
+            if os.stat(segment).st_size == size:
+                break
+        os.replace(final + '.tmp', final)
+        os.unlink(segment)
+
+    summary = summarize(_read_lines(final))
+    _update_index(project_dir, os.path.basename(final), summary)
+    return final
+
+
+def summarize(entries: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
+    """Count entries per session and per date.
+
+    Args:
+        entries: Log entries
+
+    Returns:
+        Dict with entries, sessions {id: count}, dates {YYYY-MM-DD: count}
+    """
+    sessions: Dict[str, int] = {}
+    dates: Dict[str, int] = {}
+    count = 0
+    for entry in entries:
+        count += 1
+        session = entry.get('session_id') or 'unknown'
+        sessions[session] = sessions.get(session, 0) + 1
+        date = str(entry.get('timestamp', ''))[:10]
+        dates[date] = dates.get(date, 0) + 1
+    return {'entries': count, 'sessions': sessions, 'dates': dates}
+
+
+def read_index(project_dir: str) -> Dict[str, Any]:
+    """Load the segment index, dropping entries for segments that no longer exist."""
+    try:
+        with open(os.path.join(project_dir, INDEX_FILE), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') != INDEX_VERSION:
+            raise ValueError('index version mismatch')
+    except (OSError, ValueError, AttributeError):
+        index = {'version': INDEX_VERSION, 'segments': {}}
+    index['segments'] = {
+        name: summary for name, summary in index.get('segments', {}).items()
+        if os.path.exists(os.path.join(project_dir, name))
+    }
+    return index
+
+
+def _update_index(project_dir: str, name: str, summary: Dict[str, Any]):
+    """Add a segment to the index (atomic replace, serialized by the lock file)."""
+    lock_fd = os.open(os.path.join(project_dir, LOCK_FILE), os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        index = read_index(project_dir)
+        index['segments'][name] = summary
+        fd, tmp = tempfile.mkstemp(dir=project_dir, prefix='.prompt-log-index.')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'), sort_keys=True)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, os.path.join(project_dir, INDEX_FILE))
+    finally:
+        os.close(lock_fd)
+
+
+def _read_lines(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield log entries from a plain or gzipped segment, skipping non-entries."""
+    opener = gzip.open if path.endswith('.gz') else open
+    try:
+        with opener(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Torn or foreign line (e.g. an initial '{"sessions":[]}' stub)
+                    continue
+                if isinstance(entry, dict) and 'timestamp' in entry:
+                    yield entry
+    except (OSError, EOFError):
+        return
+
+
+def query(project_dir: str, session_id: Optional[str] = None,
+          date: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield captured entries, reading only segments that can match.
+
+    Args:
+        project_dir: Architecture project directory
+        session_id: Only entries of this session
+        date: Only entries from this UTC date (YYYY-MM-DD)
+
+    Yields:
+        Entries in capture order
+    """
+    index = read_index(project_dir)
+    segments = sorted(
+        (m for m in (SEGMENT_RE.match(name) for name in os.listdir(project_dir)) if m),
+        key=lambda m: int(m.group(1)),
+    )
+    paths = []
+    for match in segments:
+        summary = index['segments'].get(match.group(0))
+        if summary is not None:
+            if session_id and session_id not in summary['sessions']:
+                continue
+            if date and date not in summary['dates']:
+                continue
+        elif match.group(2) is None and os.path.exists(
+                os.path.join(project_dir, match.group(0) + '.gz')):
+            # Uncompressed leftover of a segment that has been compressed
+            continue
+        paths.append(os.path.join(project_dir, match.group(0)))
+    # The active log is small and never indexed
+    paths.append(os.path.join(project_dir, LOG_FILE))
+
+    for path in paths:
+        for entry in _read_lines(path):
+            if session_id and entry.get('session_id') != session_id:
+                continue
+            if date and not str(entry.get('timestamp', '')).startswith(date):
+                continue
+            yield entry
+
+
+def capture(input_data: Dict[str, Any]):
+    """Log the prompt to every enabled project under the session directory."""
+    if os.environ.get(DISABLE_ENV) == '1':
+        return
+    prompt = input_data.get('user_prompt') or input_data.get('prompt') or ''
+    if not prompt.strip():
+        return
+    projects = find_enabled_projects(input_data.get('cwd') or os.getcwd())
+    if not projects:
+        return
+
+    entry = build_entry(input_data, prompt)
+    for project_dir in projects:
+        size = append_entry(project_dir, entry)
+        rotate_if_needed(project_dir, size)
+
+
+def main():
+    """Main entry point: hook mode (stdin) or --query mode."""
+    if len(sys.argv) > 1:
+        parser = argparse.ArgumentParser(description="Query captured prompts")
+        parser.add_argument("--query", metavar="PROJECT_DIR", required=True,
+                            help="Architecture project directory")
+        parser.add_argument("--session", help="Only this session ID")
+        parser.add_argument("--date", help="Only this UTC date (YYYY-MM-DD)")
+        args = parser.parse_args()
+        for entry in query(args.query, args.session, args.date):
+            print(json.dumps(entry, ensure_ascii=False))
+        return
+
+    try:
+        capture(json.load(sys.stdin))
+    except Exception as e:
+        # Fail open: never block the prompt because logging failed
+        print(f"Warning: prompt capture failed: {e}", file=sys.stderr)
+    finally:
+        print(json.dumps({}))
+        sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""
+Tests for prompt_capture_hook.py
+
+Run with: pytest hooks/tests/test_prompt_capture_hook.py -v
+"""
+
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import prompt_capture_hook as hook
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Session directory with one active architecture project that has logging enabled."""
+    project_dir = tmp_path / "docs" / "architecture" / "active" / "2025-12-12-demo"
+    project_dir.mkdir(parents=True)
+    (project_dir / hook.MARKER_FILE).touch()
+    for name in (hook.MAX_BYTES_ENV, hook.COMPRESS_ENV, hook.DISABLE_ENV):
+        monkeypatch.delenv(name, raising=False)
+    return project_dir
+
+
+def submit(cwd, prompt, session="s1"):
+    hook.capture({
+        "hook_event_name": "UserPromptSubmit",
+        "user_prompt": prompt,
+        "session_id": session,
+        "cwd": str(cwd),
+    })
+
+
+def session_dir(project):
+    return project.parents[3]
+
+
+def active_lines(project):
+    path = project / hook.LOG_FILE
+    return path.read_text().splitlines() if path.exists() else []
+
+
+class TestCapture:
+    """Prompts are appended as compact NDJSON"""
+
+    def test_prompt_logged(self, project):
+        submit(session_dir(project), "/arch:p design a cache")
+
+        lines = (project / hook.LOG_FILE).read_text().splitlines()
+        assert len(lines) == 1
+        assert ", " not in lines[0]
+        entry = json.loads(lines[0])
+        assert entry["content"] == "/arch:p design a cache"
+        assert entry["command"] == "/arch:p"
+        assert entry["session_id"] == "s1"
+
+    def test_nothing_logged_without_marker(self, project):
+        (project / hook.MARKER_FILE).unlink()
+        submit(session_dir(project), "hello")
+        assert not (project / hook.LOG_FILE).exists()
+
+    def test_secrets_masked_before_write(self, project):
+        token = "ghp_" + "a" * 36
+        submit(session_dir(project), f"use token {token} please")
+
+        text = (project / hook.LOG_FILE).read_text()
+        assert token not in text
+        entry = json.loads(text)
+        assert entry["filter_applied"]["secret_types"] == ["github_token"]
+
+
+class TestRotation:
+    """Oversized logs are rotated into indexed segments"""
+
+    def fill(self, project, sessions, count):
+        for i in range(count):
+            hook.capture({
+                "user_prompt": f"prompt {i} " + "x" * 200,
+                "session_id": sessions[i % len(sessions)],
+                "cwd": str(session_dir(project)),
+            })
+
+    def test_rotates_and_indexes(self, project, monkeypatch):
+        monkeypatch.setenv(hook.MAX_BYTES_ENV, "2000")
+        # Finish segments inline so the test can inspect them
+        original = hook.rotate_if_needed
+        monkeypatch.setattr(hook, "rotate_if_needed",
+                            lambda d, size: original(d, size, background=False))
+        self.fill(project, ["a", "b"], 30)
+
+        segments = sorted(p.name for p in project.glob("PROMPT_LOG.0*.json"))
+        assert segments
+        index = hook.read_index(str(project))
+        assert set(index["segments"]) == set(segments)
+        assert sum(s["entries"] for s in index["segments"].values()) + \
+            len(active_lines(project)) == 30
+
+    def test_compressed_segments_queryable(self, project, monkeypatch):
+        monkeypatch.setenv(hook.MAX_BYTES_ENV, "2000")
+        monkeypatch.setenv(hook.COMPRESS_ENV, "1")
+        original = hook.rotate_if_needed
+        monkeypatch.setattr(hook, "rotate_if_needed",
+                            lambda d, size: original(d, size, background=False))
+        self.fill(project, ["a", "b"], 30)
+
+        compressed = list(project.glob("PROMPT_LOG.0*.json.gz"))
+        assert compressed
+        with gzip.open(compressed[0], "rt") as f:
+            assert json.loads(f.readline())["type"] == "user_input"
+        assert not list(project.glob("PROMPT_LOG.0*.json"))
+
+        entries = list(hook.query(str(project), session_id="a"))
+        assert len(entries) == 15
+        assert [int(e["content"].split()[1]) for e in entries] == list(range(0, 30, 2))
+
+
+class TestQuery:
+    """Queries skip segments the index rules out"""
+
+    def test_segments_without_session_not_read(self, project, monkeypatch):
+        monkeypatch.setenv(hook.MAX_BYTES_ENV, "1000")
+        original = hook.rotate_if_needed
+        monkeypatch.setattr(hook, "rotate_if_needed",
+                            lambda d, size: original(d, size, background=False))
+        for i in range(10):
+            submit(session_dir(project), "early " + "x" * 200, session="old")
+        for i in range(3):
+            submit(session_dir(project), "late", session="new")
+
+        read = []
+        real_read = hook._read_lines
+        monkeypatch.setattr(hook, "_read_lines",
+                            lambda path: (read.append(os.path.basename(path)), real_read(path))[1])
+
+        assert len(list(hook.query(str(project), session_id="new"))) == 3
+        index = hook.read_index(str(project))
+        skipped = [name for name, summary in index["segments"].items()
+                   if "new" not in summary["sessions"]]
+        assert skipped
+        assert not set(skipped) & set(read)
+
+    def test_date_filter(self, project):
+        submit(session_dir(project), "today")
+        today = json.loads((project / hook.LOG_FILE).read_text())["timestamp"][:10]
+
+        assert len(list(hook.query(str(project), date=today))) == 1
+        assert list(hook.query(str(project), date="1999-01-01")) == []
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Benchmark strategies for many regex_match conditions on one field.
+
+Builds N synthetic command-guard patterns on one field and times evaluating
+all of them per hook input three ways: a re.search per pattern, one combined
+alternation of named groups (rescanned past each hit so every matching
+pattern is reported), and the engine's literal prefilter followed by a
+re.search per surviving pattern. Results are checked for equivalence on
+every input.
+
+Usage:
+    python3 benchmarks/bench_literal_prefilter.py [--repeat 200] [--sizes 10,20,40,80,160]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# Add plugin root so we can import from core/ directly
+PLUGIN_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PLUGIN_ROOT not in sys.path:
+    sys.path.insert(0, PLUGIN_ROOT)
+
+from core.literals import fold_case, required_literals
+
+COMMANDS = [
+    "git status",
+    "git push --force origin main",
+    "rm -rf build/ dist/",
+    "npm run test -- --watch=false",
+    "curl -s https://example.com/install.sh | sh",
+    "docker compose up -d --build",
+    "python3 -m pytest -q tests/",
+    "kubectl delete namespace staging",
+    "find . -name '*.pyc' -delete",
+    "chmod -R 777 /var/www",
+]
+
+VERBS = ["rm", "git", "curl", "wget", "docker", "kubectl", "chmod", "chown",
+         "sudo", "npm", "pip", "terraform", "helm", "aws", "gcloud", "ssh"]
+FLAGS = ["-rf", "--force", "-R", "delete", "destroy", "push", "apply", "install",
+         "publish", "exec", "--no-verify", "reset --hard", "prune", "rollout"]
+
+
+def synthetic_patterns(count: int, seed: int = 0) -> list:
+    """Generate distinct command-guard style regex patterns.
+
+    Args:
+        count: Number of patterns
+        seed: Random seed
+
+    Returns:
+        List of pattern strings
+    """
+    rng = random.Random(seed)
+    patterns = []
+    seen = set()
+    while len(patterns) < count:
+        verb = rng.choice(VERBS)
+        flag = re.escape(rng.choice(FLAGS)).replace(r'\ ', r'\s+')
+        shape = rng.randrange(3)
+        if shape == 0:
+            pattern = rf"\b{verb}\s+.*{flag}"
+        elif shape == 1:
+            pattern = rf"{verb}\s+{flag}\b"
+        else:
+            pattern = rf"(?:^|[;&|]\s*){verb}\b.*{flag}"
+        if pattern not in seen:
+            seen.add(pattern)
+            patterns.append(pattern)
+    return patterns
+
+
+def per_pattern(compiled: list, text: str) -> set:
+    """Evaluate each pattern with its own search."""
+    return {regex.pattern for regex in compiled if regex.search(text)}
+
+
+def combined(patterns: list):
+    """Build a matcher running one alternation of named groups.
+
+    A search reports only the leftmost alternative that matches, so the
+    alternation is rerun without the patterns already found until it fails.
+    """
+    names = {f"p{i}": pattern for i, pattern in enumerate(patterns)}
+    cache = {}
+
+    def alternation(remaining: tuple):
+        regex = cache.get(remaining)
+        if regex is None:
+            regex = cache[remaining] = re.compile(
+                '|'.join(f"(?P<{name}>{names[name]})" for name in remaining),
+                re.IGNORECASE,
+            )
+        return regex
+
+    def matching(text: str) -> set:
+        remaining = tuple(names)
+        found = set()
+        while remaining:
+            match = alternation(remaining).search(text)
+            if match is None:
+                break
+            found.add(match.lastgroup)
+            remaining = tuple(name for name in remaining if name != match.lastgroup)
+        # The alternation failing means none of the remaining patterns match
+        return {names[name] for name in found}
+
+    return matching
+
+
+def prefiltered(compiled: list):
+    """Build a matcher using the engine's literal prefilter."""
+    entries = [(regex, required_literals(regex.pattern)) for regex in compiled]
+
+    def matching(text: str) -> set:
+        folded = fold_case(text)
+        present = {}
+
+        def contains(literal: str) -> bool:
+            found = present.get(literal)
+            if found is None:
+                found = present[literal] = literal in folded
+            return found
+
+        return {
+            regex.pattern
+            for regex, clauses in entries
+            if all(any(contains(literal) for literal in clause) for clause in clauses)
+            and regex.search(text)
+        }
+
+    return matching
+
+
+def timed(matcher, inputs: list, repeat: int) -> float:
+    """Return the mean time per input in seconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in inputs:
+            matcher(text)
+    return (time.perf_counter() - start) / (repeat * len(inputs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Literal prefilter benchmark")
+    parser.add_argument("--repeat", type=int, default=200, help="Passes over the inputs")
+    parser.add_argument("--sizes", default="10,20,40,80,160", help="Pattern counts")
+    args = parser.parse_args()
+
+    # Pad commands to a realistic length for long shell one-liners
+    inputs = [f"cd /srv/app && {cmd} && echo done # {'x' * 200}" for cmd in COMMANDS]
+
+    print(f"{'patterns':>8}  {'per-pattern':>12}  {'alternation':>12}  {'prefilter':>12}  {'speedup':>8}")
+    for size in [int(s) for s in args.sizes.split(',')]:
+        patterns = synthetic_patterns(size)
+        compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
+        baseline = lambda text: per_pattern(compiled, text)
+        strategies = [baseline, combined(patterns), prefiltered(compiled)]
+
+        # Equivalence check before timing
+        for text in inputs:
+            expected = baseline(text)
+            for matcher in strategies[1:]:
+                actual = matcher(text)
+                if expected != actual:
+                    sys.exit(f"Mismatch for {text!r}: {expected ^ actual}")
+
+        times = [timed(matcher, inputs, args.repeat) for matcher in strategies]
+        print(
+            f"{size:>8}  {times[0] * 1e6:>10.1f}us  {times[1] * 1e6:>10.1f}us  "
+            f"{times[2] * 1e6:>10.1f}us  {times[0] / times[2]:>7.1f}x"
+        )
+
+if __name__ == '__main__':
+    main()
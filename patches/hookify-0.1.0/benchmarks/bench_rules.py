@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark rule evaluation throughput for growing rule sets.
+
+Replays the same synthetic session against 10, 100 and 1000 synthetic rules
+and prints throughput and latency percentiles per size. Results can be saved
+and later compared against, so a change that slows evaluation down is caught
+before it ships.
+
+Usage:
+    python3 benchmarks/bench_rules.py [--inputs 2000] [--sizes 10,100,1000]
+    python3 benchmarks/bench_rules.py --save baseline.json
+    python3 benchmarks/bench_rules.py --baseline baseline.json [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Add plugin root so we can import from core/ directly
+PLUGIN_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PLUGIN_ROOT not in sys.path:
+    sys.path.insert(0, PLUGIN_ROOT)
+
+from core.rule_engine import RuleEngine
+
+from replay import percentile, replay
+from synthetic import synthetic_inputs, synthetic_rules
+
+
+def bench(size: int, inputs: list, seed: int) -> dict:
+    """Replay inputs against size rules and summarize latency.
+
+    Args:
+        size: Number of rules
+        inputs: Hook inputs
+        seed: Random seed for the rule set
+
+    Returns:
+        Dict with throughput_per_s, mean_us, p50_us, p99_us
+    """
+    engine = RuleEngine()
+    rules = synthetic_rules(size, seed)
+    # Warm-up pass: compiles indexes and regexes, like a long-lived server
+    replay(rules, inputs[:100], engine)
+    stats = replay(rules, inputs, engine)
+
+    latencies = sorted(value for values in stats.latencies.values() for value in values)
+    return {
+        'throughput_per_s': stats.inputs / stats.elapsed if stats.elapsed else 0.0,
+        'mean_us': sum(latencies) / len(latencies) * 1e6,
+        'p50_us': percentile(latencies, 50) * 1e6,
+        'p99_us': percentile(latencies, 99) * 1e6,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Return descriptions of sizes whose mean latency regressed beyond tolerance."""
+    regressions = []
+    for size, result in results.items():
+        previous = baseline.get(size)
+        if not previous:
+            continue
+        limit = previous['mean_us'] * (1 + tolerance)
+        if result['mean_us'] > limit:
+            regressions.append(
+                f"{size} rules: mean {result['mean_us']:.0f}us vs baseline "
+                f"{previous['mean_us']:.0f}us (+{result['mean_us'] / previous['mean_us'] - 1:.0%})"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hookify rule evaluation")
+    parser.add_argument("--inputs", type=int, default=2000, help="Hook inputs per run")
+    parser.add_argument("--sizes", default="10,100,1000", help="Comma-separated rule counts")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--save", metavar="FILE", help="Write results as JSON")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against saved results")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed mean latency increase over baseline (default 0.25)")
+    args = parser.parse_args()
+
+    inputs = synthetic_inputs(args.inputs, args.seed)
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    print(f"{'rules':>6} {'inputs/s':>10} {'mean':>9} {'p50':>9} {'p99':>9}")
+    results = {}
+    for size in sizes:
+        result = results[str(size)] = bench(size, inputs, args.seed)
+        print(f"{size:>6} {result['throughput_per_s']:>10.0f} {result['mean_us']:>7.0f}us "
+              f"{result['p50_us']:>7.0f}us {result['p99_us']:>7.0f}us")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nFAILED - slower than baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nPASSED - within tolerance of baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Replay recorded hook inputs through RuleEngine in one process.
+
+Reads a JSONL stream of hook inputs (one hook input JSON per line, or server
+requests of the form {"event": ..., "input": {...}}), evaluates each against a
+rule set exactly as the hook scripts would, and reports per-rule hit counts,
+per-event latency percentiles and total throughput.
+
+Usage:
+    python3 benchmarks/replay.py session.jsonl --rules /path/to/project
+    python3 benchmarks/replay.py --synthetic-inputs 5000 --synthetic-rules 100
+    python3 benchmarks/replay.py session.jsonl --rules . --json > report.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Add plugin root so we can import from core/ directly
+PLUGIN_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PLUGIN_ROOT not in sys.path:
+    sys.path.insert(0, PLUGIN_ROOT)
+
+from core.config_loader import Rule
+from core.rule_engine import RuleEngine
+
+PERCENTILES = (50, 90, 99)
+
+
+def rule_event(input_data: Dict[str, Any]) -> Optional[str]:
+    """Return the load_rules event filter the hook scripts use for an input.
+
+    Args:
+        input_data: Hook input JSON
+
+    Returns:
+        "bash", "file", "stop", "prompt" or None (all rules)
+    """
+    hook_event = input_data.get('hook_event_name', '')
+    if hook_event == 'Stop':
+        return 'stop'
+    if hook_event == 'UserPromptSubmit':
+        return 'prompt'
+    tool_name = input_data.get('tool_name', '')
+    if tool_name == 'Bash':
+        return 'bash'
+    if tool_name in ['Edit', 'Write', 'MultiEdit']:
+        return 'file'
+    return None
+
+
+def read_inputs(path: str) -> Iterator[Dict[str, Any]]:
+    """Read hook inputs from a JSONL file ("-" for stdin).
+
+    Lines that are not JSON objects with a hook_event_name (directly or under
+    "input") are skipped with a warning.
+
+    Args:
+        path: JSONL file path
+
+    Yields:
+        Hook input dicts
+    """
+    stream = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    skipped = 0
+    try:
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError:
+                skipped += 1
+                continue
+            if isinstance(data, dict) and isinstance(data.get('input'), dict):
+                data = data['input']
+            if not isinstance(data, dict) or 'hook_event_name' not in data:
+                skipped += 1
+                continue
+            yield data
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    if skipped:
+        print(f"Warning: skipped {skipped} lines that are not hook inputs", file=sys.stderr)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class ReplayStats:
+    """Hit counts and latencies collected during a replay."""
+
+    def __init__(self, rules: List[Rule]):
+        self.rules = rules
+        self.hits: Counter = Counter()
+        self.latencies: Dict[str, List[float]] = {}
+        self.inputs = 0
+        self.elapsed = 0.0
+
+    def record(self, label: str, seconds: float, matched: Iterable[Rule]):
+        self.inputs += 1
+        self.elapsed += seconds
+        self.latencies.setdefault(label, []).append(seconds)
+        for rule in matched:
+            self.hits[rule.name] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the report as JSON-serializable data (latencies in microseconds)."""
+        events = {}
+        for label, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            entry = {'count': len(values),
+                     'mean_us': sum(values) / len(values) * 1e6,
+                     'max_us': values[-1] * 1e6}
+            for pct in PERCENTILES:
+                entry[f'p{pct}_us'] = percentile(values, pct) * 1e6
+            events[label] = entry
+        return {
+            'rules': len(self.rules),
+            'inputs': self.inputs,
+            'elapsed_s': self.elapsed,
+            'throughput_per_s': self.inputs / self.elapsed if self.elapsed else 0.0,
+            'events': events,
+            'hits': {rule.name: self.hits.get(rule.name, 0) for rule in self.rules},
+        }
+
+    def format(self, top: int = 20) -> str:
+        """Format a human-readable report."""
+        data = self.to_dict()
+        lines = [
+            f"Replayed {data['inputs']} inputs against {data['rules']} rules "
+            f"in {data['elapsed_s']:.3f}s ({data['throughput_per_s']:.0f} inputs/s)",
+            "",
+            f"{'event':<24} {'count':>7} {'mean':>9} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}",
+        ]
+        for label, entry in data['events'].items():
+            lines.append(
+                f"{label:<24} {entry['count']:>7} {entry['mean_us']:>7.0f}us "
+                f"{entry['p50_us']:>7.0f}us {entry['p90_us']:>7.0f}us "
+                f"{entry['p99_us']:>7.0f}us {entry['max_us']:>7.0f}us"
+            )
+
+        ranked = sorted(data['hits'].items(), key=lambda item: (-item[1], item[0]))
+        lines += ["", f"{'rule':<40} {'hits':>7}"]
+        for name, count in ranked[:top]:
+            lines.append(f"{name:<40} {count:>7}")
+        never = sum(1 for _, count in ranked if count == 0)
+        if never:
+            lines.append(f"({never} rules never matched)")
+        return "\n".join(lines)
+
+
+def replay(rules: List[Rule], inputs: Iterable[Dict[str, Any]],
+           engine: Optional[RuleEngine] = None) -> ReplayStats:
+    """Evaluate every input and collect statistics.
+
+    Each input is timed through evaluate_rules() with the rules the hook
+    script would load for it; hits are collected with matching_rules()
+    outside the timed section.
+
+    Args:
+        rules: All enabled rules (filtered per input like load_rules(event))
+        inputs: Hook input dicts
+        engine: Engine to use (default: a new RuleEngine)
+
+    Returns:
+        ReplayStats
+    """
+    engine = engine or RuleEngine()
+    stats = ReplayStats(rules)
+    indexes = {}
+
+    for input_data in inputs:
+        event = rule_event(input_data)
+        index = indexes.get(event)
+        if index is None:
+            selected = [r for r in rules if not event or r.event in ('all', event)]
+            index = indexes[event] = engine.compile_rules(selected)
+
+        start = time.perf_counter()
+        engine.evaluate_rules(index, input_data)
+        seconds = time.perf_counter() - start
+
+        matched = [rule for rule, _ in engine.matching_rules(index, input_data)]
+        label = input_data.get('hook_event_name', '?')
+        if input_data.get('tool_name'):
+            label += f":{input_data['tool_name']}"
+        stats.record(label, seconds, matched)
+
+    return stats
+
+
+def load_project_rules(project_dir: str) -> List[Rule]:
+    """Load all enabled rules from a project's .claude directory."""
+    from core.config_loader import load_rules
+
+    previous = os.getcwd()
+    os.chdir(project_dir)
+    try:
+        return load_rules()
+    finally:
+        os.chdir(previous)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay hook inputs through the hookify rule engine")
+    parser.add_argument("inputs", nargs="?", help="JSONL file of hook inputs ('-' for stdin)")
+    parser.add_argument("--rules", metavar="DIR", help="Project directory containing .claude/hookify.*.local.md")
+    parser.add_argument("--synthetic-rules", type=int, metavar="N", help="Use N synthetic rules")
+    parser.add_argument("--synthetic-inputs", type=int, metavar="N", help="Replay N synthetic inputs")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic data")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the stream this many times")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if args.rules:
+        rules = load_project_rules(args.rules)
+    elif args.synthetic_rules:
+        from synthetic import synthetic_rules
+        rules = synthetic_rules(args.synthetic_rules, args.seed)
+    else:
+        parser.error("give --rules DIR or --synthetic-rules N")
+
+    if args.inputs:
+        inputs = list(read_inputs(args.inputs))
+    elif args.synthetic_inputs:
+        from synthetic import synthetic_inputs
+        inputs = synthetic_inputs(args.synthetic_inputs, args.seed)
+    else:
+        parser.error("give an input file or --synthetic-inputs N")
+
+    stats = replay(rules, (data for _ in range(args.repeat) for data in inputs))
+    if args.json:
+        print(json.dumps(stats.to_dict(), indent=2))
+    else:
+        print(stats.format())
+
+
+if __name__ == '__main__':
+    main()
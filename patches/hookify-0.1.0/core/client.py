@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Thin client used by hookify hook scripts.
+
+Forwards hook input to a running hookify evaluation server (see core/server.py)
+over a Unix domain socket. If no server is running, or it does not answer in
+time, rules are loaded and evaluated in-process exactly as before.
+
+This module is imported on every hook call, so it must stay cheap to import:
+only the standard library modules needed to talk to the socket are loaded
+up front, and the rule engine is imported lazily on fallback.
+
+With HOOKIFY_METRICS set, each call also emits a timing record (see
+core/metrics.py).
+"""
+
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
+import json
+import os
+import socket
+import stat
+import struct
+from typing import Dict, Any, Optional
+
+from core import metrics
+
+# Environment variables controlling the client
+SOCKET_ENV = 'HOOKIFY_SOCKET'
+DISABLE_ENV = 'HOOKIFY_NO_DAEMON'
+TIMEOUT_ENV = 'HOOKIFY_DAEMON_TIMEOUT'
+
+# Seconds to wait for the server before falling back to in-process evaluation
+DEFAULT_TIMEOUT = 3.0
+
+# Upper bound on a single response, protects the hook from a misbehaving peer
+MAX_RESPONSE_BYTES = 16 * 1024 * 1024
+
+# Time spent importing this module and its dependencies
+IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
+
+def is_private_dir(path: str) -> bool:
+    """Check that a directory belongs to the current user and nobody else can use it.
+
+    Args:
+        path: Directory path (symlinks are not followed)
+
+    Returns:
+        True for a real directory owned by the current user with mode 0700 or stricter
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid()
+            and not st.st_mode & 0o077)
+
+
+def get_runtime_dir() -> Optional[str]:
+    """Return the private per-user directory for the server socket and scan state.
+
+    The directory ($TMPDIR/hookify-<uid>) is created with mode 0700. Another
+    local user can create that path first, so it is only used if it passes
+    is_private_dir().
+
+    Returns:
+        Directory path, or None if it cannot be created or is not private
+    """
+    tmp_dir = os.environ.get('TMPDIR') or '/tmp'
+    path = os.path.join(tmp_dir, f'hookify-{os.getuid()}')
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+    return path if is_private_dir(path) else None
+
+
+def get_socket_path() -> Optional[str]:
+    """Return the Unix socket path shared by the hook client and server.
+
+    Returns:
+        $HOOKIFY_SOCKET if set, otherwise server.sock in the private runtime
+        directory (None if that directory is not usable)
+    """
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    runtime_dir = get_runtime_dir()
+    if runtime_dir is None:
+        return None
+    return os.path.join(runtime_dir, 'server.sock')
+
+
+def _is_own_socket(path: str) -> bool:
+    """Check that a socket file exists and was created by the current user."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def _peer_is_current_user(sock: socket.socket) -> bool:
+    """Check the uid of the process serving a connected Unix socket.
+
+    Uses SO_PEERCRED where the platform has it (Linux); elsewhere the
+    ownership of the socket file, checked before connecting, has to do.
+    """
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return True
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED,
+                            struct.calcsize('3i'))
+    _pid, uid, _gid = struct.unpack('3i', creds)
+    return uid == os.getuid()
+
+
+def evaluate_remote(event: Optional[str], input_data: Dict[str, Any],
+                    socket_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Evaluate hook input on the hookify server.
+
+    Args:
+        event: Rule event filter ("bash", "file", "stop", "prompt" or None)
+        input_data: Hook input JSON
+        socket_path: Override for the server socket path
+
+    Returns:
+        Hook response dict, or None if the server is unavailable
+    """
+    if os.environ.get(DISABLE_ENV):
+        return None
+
+    # Only trust a server run by the current user: anyone else answering on
+    # the socket could allow or deny tool calls at will
+    path = socket_path or get_socket_path()
+    if not path or not _is_own_socket(path):
+        return None
+
+    try:
+        timeout = float(os.environ.get(TIMEOUT_ENV, DEFAULT_TIMEOUT))
+    except ValueError:
+        timeout = DEFAULT_TIMEOUT
+
+    request = {
+        'event': event,
+        'cwd': os.getcwd(),
+        'input': input_data,
+    }
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            if not _peer_is_current_user(sock):
+                return None
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+
+            chunks = []
+            received = 0
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                received += len(chunk)
+                if chunk.endswith(b'\n') or received > MAX_RESPONSE_BYTES:
+                    break
+
+        response = json.loads(b''.join(chunks).decode('utf-8'))
+        if isinstance(response, dict):
+            return response
+    except (OSError, ValueError):
+        # Server gone, timed out or sent garbage - evaluate locally instead
+        pass
+
+    return None
+
+
+def evaluate_local(event: Optional[str], input_data: Dict[str, Any],
+                   measure: Optional[metrics.HookMetrics] = None) -> Dict[str, Any]:
+    """Load and evaluate rules in the current process.
+
+    Args:
+        event: Rule event filter ("bash", "file", "stop", "prompt" or None)
+        input_data: Hook input JSON
+        measure: Records phase timings if given
+
+    Returns:
+        Hook response dict
+    """
+    started = time.perf_counter()
+    try:
+        from core import rule_cache
+        from core.rule_cache import load_rules
+        from core.rule_engine import RuleEngine
+    except ImportError as e:
+        return {"systemMessage": f"Hookify import error: {e}"}
+
+    if measure is None:
+        rules = load_rules(event=event)
+        engine = RuleEngine()
+        return engine.evaluate_rules(rules, input_data)
+
+    loading = time.perf_counter()
+    measure.add_time('import_engine', loading - started)
+    rules = load_rules(event=event)
+    measure.add_time('load', time.perf_counter() - loading)
+    measure.rules_loaded = len(rules)
+    measure.rule_cache = rule_cache.last_load
+    engine = RuleEngine()
+    return engine.evaluate_rules(rules, input_data, stats=measure.new_stats())
+
+
+def evaluate(event: Optional[str], input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Evaluate hook input, preferring the warm server when it is running.
+
+    Args:
+        event: Rule event filter ("bash", "file", "stop", "prompt" or None)
+        input_data: Hook input JSON
+
+    Returns:
+        Hook response dict
+    """
+    measure = metrics.start('remote', event, input_data)
+    if measure is None:
+        result = evaluate_remote(event, input_data)
+        if result is None:
+            result = evaluate_local(event, input_data)
+        return result
+
+    measure.add_time('import', IMPORT_SECONDS)
+    result = evaluate_remote(event, input_data)
+    if result is None:
+        measure.record['mode'] = 'local'
+        result = evaluate_local(event, input_data, measure)
+    measure.emit(result)
+    return result
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Literal prefilters for regex_match conditions in hookify plugin.
+
+Most guard patterns can only match text containing some fixed substring
+("rm", "--force", "push"). required_literals() derives those substrings from
+the parsed pattern so the engine can reject a condition with a str.find-speed
+substring test on one case-folded copy of the field, without running the
+regex. A literal check can only rule out patterns that could not have
+matched, so results are identical to running re.search.
+
+Python's re module has no multi-pattern automaton: a combined alternation of
+named groups still tries each alternative at every position and measured
+slower than separate searches (see benchmarks/bench_literal_prefilter.py),
+so patterns that pass the prefilter are confirmed one by one.
+"""
+
+import re
+from typing import FrozenSet, List, Optional
+
+try:
+    # Python 3.11+
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+# Literals shorter than this rule out too little to be worth checking
+MIN_LITERAL_LENGTH = 2
+
+# Non-ASCII characters that re.IGNORECASE treats as equal to an ASCII letter
+# (dotted/dotless I, long s, Kelvin sign). Mapped before lower() so folded
+# text contains every ASCII literal the regex engine could match.
+_ASCII_CASE_EQUIVALENTS = str.maketrans({
+    'İ': 'i',
+    'ı': 'i',
+    'ſ': 's',
+    'K': 'k',
+})
+
+_REPEATS = {
+    sre_constants.MAX_REPEAT,
+    sre_constants.MIN_REPEAT,
+}
+if hasattr(sre_constants, 'POSSESSIVE_REPEAT'):
+    _REPEATS.add(sre_constants.POSSESSIVE_REPEAT)
+
+_ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)
+
+
+def fold_case(text: str) -> str:
+    """Case-fold text for literal prefiltering of re.IGNORECASE patterns.
+
+    Args:
+        text: Text that will be searched
+
+    Returns:
+        Lowercased text in which every ASCII literal a case-insensitive
+        regex could match appears as a plain substring
+    """
+    if not text.isascii():
+        text = text.translate(_ASCII_CASE_EQUIVALENTS)
+    return text.lower()
+
+
+def required_literals(pattern: str) -> List[FrozenSet[str]]:
+    """Derive literal substrings that every match of pattern must contain.
+
+    Args:
+        pattern: Regex pattern (interpreted with re.IGNORECASE)
+
+    Returns:
+        List of clauses; each clause is a set of lowercase ASCII literals of
+        which at least one appears in any matching text. Empty if nothing can
+        be derived (or the pattern does not parse).
+    """
+    try:
+        parsed = sre_parse.parse(pattern, re.IGNORECASE)
+    except (re.error, RecursionError, OverflowError):
+        return []
+    return _clauses(parsed)
+
+
+def _clauses(sequence) -> List[FrozenSet[str]]:
+    """Collect literal clauses from a parsed regex sequence."""
+    clauses = []
+    run = []
+
+    def flush():
+        if len(run) >= MIN_LITERAL_LENGTH:
+            clauses.append(frozenset([''.join(run).lower()]))
+        run.clear()
+
+    for op, av in sequence:
+        if op is sre_constants.LITERAL and av < 128:
+            run.append(chr(av))
+            continue
+
+        flush()
+        if op is sre_constants.SUBPATTERN:
+            clauses.extend(_clauses(av[-1]))
+        elif op is _ATOMIC_GROUP:
+            clauses.extend(_clauses(av))
+        elif op in _REPEATS:
+            low, _, item = av
+            if low >= 1:
+                clauses.extend(_clauses(item))
+        elif op is sre_constants.BRANCH:
+            clause = _branch_clause(av[1])
+            if clause:
+                clauses.append(clause)
+        # Anything else (classes, anchors, lookarounds, backrefs) only ends the run
+
+    flush()
+    return clauses
+
+
+def _branch_clause(branches) -> Optional[FrozenSet[str]]:
+    """Combine alternatives into one "any of these literals" clause.
+
+    Every alternative must contribute a clause, otherwise a match could
+    contain none of the literals.
+    """
+    alternatives = set()
+    for branch in branches:
+        branch_clauses = _clauses(branch)
+        if not branch_clauses:
+            return None
+        # The most selective clause: the one whose shortest literal is longest
+        best = max(branch_clauses, key=lambda clause: min(map(len, clause)))
+        alternatives |= best
+    return frozenset(alternatives)
+
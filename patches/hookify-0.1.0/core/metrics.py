@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""Opt-in latency instrumentation for hookify plugin.
+
+When HOOKIFY_METRICS is set, every hook call emits one JSON record with wall
+times for its phases (imports, rule loading, field extraction, matching),
+how many rules were considered and which matched, the slowest rules,
+whether the parsed-rule cache was used, and hits/misses of the guarded
+regex compile cache (compile_guarded). Records go to:
+
+- a JSONL file, rotated by size:   HOOKIFY_METRICS=/path/to/hookify.jsonl
+- a local datagram socket:         HOOKIFY_METRICS=unix:/path/to/collector.sock
+
+Nothing is measured, imported or written when the variable is unset. Like
+core/client.py this module is imported on every hook call and only loads
+standard library modules.
+
+Configuration (environment):
+    HOOKIFY_METRICS            Sink (unset = off)
+    HOOKIFY_METRICS_MAX_BYTES  Rotate the file above this size (default 5 MiB)
+    HOOKIFY_METRICS_BACKUPS    Rotated files to keep (default 3)
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+METRICS_ENV = 'HOOKIFY_METRICS'
+MAX_BYTES_ENV = 'HOOKIFY_METRICS_MAX_BYTES'
+BACKUPS_ENV = 'HOOKIFY_METRICS_BACKUPS'
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+
+SOCKET_PREFIX = 'unix:'
+
+# Rules listed in a record's slowest_rules
+SLOWEST_RULES = 10
+
+
+def get_sink() -> Optional[str]:
+    """Return the configured metrics sink, or None if instrumentation is off."""
+    return os.environ.get(METRICS_ENV) or None
+
+
+class EvaluationStats:
+    """Counters and timings collected by RuleEngine for one evaluation."""
+
+    def __init__(self):
+        """Initialize empty stats."""
+        # Seconds per phase: "extract", "transcript", "match"
+        self.timings: Dict[str, float] = {}
+        self.rules_considered = 0
+        self.rules_matched: List[str] = []
+        # Seconds spent checking each considered rule (includes lazy field
+        # extraction and shared regex scans triggered by that rule)
+        self.rule_times: Dict[str, float] = {}
+        self.regex_searches = 0
+        # Lookups in the compile_guarded() cache used by field regex conditions
+        self.regex_cache_hits = 0
+        self.regex_cache_misses = 0
+
+    def add_time(self, phase: str, seconds: float):
+        """Accumulate time spent in a phase."""
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    def add_rule_time(self, name: str, seconds: float):
+        """Accumulate time spent checking a rule."""
+        self.rule_times[name] = self.rule_times.get(name, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the stats as JSON-serializable data (times in milliseconds)."""
+        slowest = sorted(self.rule_times.items(), key=lambda item: -item[1])[:SLOWEST_RULES]
+        return {
+            'ms': {phase: round(seconds * 1000, 3) for phase, seconds in self.timings.items()},
+            'rules_considered': self.rules_considered,
+            'rules_matched': self.rules_matched,
+            'slowest_rules': [[name, round(seconds * 1000, 3)] for name, seconds in slowest],
+            'regex': {
+                'searches': self.regex_searches,
+                'compile_cache_hits': self.regex_cache_hits,
+                'compile_cache_misses': self.regex_cache_misses,
+            },
+        }
+
+
+class HookMetrics:
+    """Timings for one hook call, emitted as a single record."""
+
+    def __init__(self, sink: str, mode: str, event: Optional[str],
+                 input_data: Dict[str, Any], started: Optional[float] = None):
+        """Start measuring.
+
+        Args:
+            sink: File path or "unix:" socket path (see get_sink())
+            mode: "local", "remote" or "server"
+            event: Rule event filter
+            input_data: Hook input JSON
+            started: perf_counter() value the call started at (default: now)
+        """
+        self.sink = sink
+        self.started = time.perf_counter() if started is None else started
+        self.timings: Dict[str, float] = {}
+        self.stats: Optional[EvaluationStats] = None
+        self.rules_loaded: Optional[int] = None
+        # "hit", "miss", "off" (core/rule_cache.py) or "memory" (server)
+        self.rule_cache: Optional[str] = None
+        self.record: Dict[str, Any] = {
+            'ts': time.time(),
+            'pid': os.getpid(),
+            'mode': mode,
+            'hook': input_data.get('hook_event_name', ''),
+            'event': event,
+            'tool': input_data.get('tool_name', ''),
+            'session': input_data.get('session_id'),
+        }
+
+    def add_time(self, phase: str, seconds: float):
+        """Record time spent in a phase ("import", "load", ...)."""
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    def new_stats(self) -> EvaluationStats:
+        """Create the EvaluationStats to pass to RuleEngine.evaluate_rules()."""
+        self.stats = EvaluationStats()
+        return self.stats
+
+    def finish(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Complete the record with the total time and outcome.
+
+        Args:
+            response: Hook response that was produced
+
+        Returns:
+            The record
+        """
+        record = self.record
+        ms = {phase: round(seconds * 1000, 3) for phase, seconds in self.timings.items()}
+        if self.stats is not None:
+            stats = self.stats.to_dict()
+            ms.update(stats.pop('ms'))
+            record.update(stats)
+        ms['total'] = round((time.perf_counter() - self.started) * 1000, 3)
+        record['ms'] = ms
+        if self.rules_loaded is not None:
+            record['rules_loaded'] = self.rules_loaded
+        if self.rule_cache is not None:
+            record['rule_cache'] = self.rule_cache
+
+        specific = response.get('hookSpecificOutput') or {}
+        if response.get('decision') == 'block' or specific.get('permissionDecision') == 'deny':
+            record['outcome'] = 'block'
+        elif response.get('systemMessage'):
+            record['outcome'] = 'warn'
+        else:
+            record['outcome'] = 'allow'
+        return record
+
+    def emit(self, response: Dict[str, Any]):
+        """Finish the record and write it to the sink; errors are reported, never raised."""
+        write_record(self.finish(response), self.sink)
+
+
+def start(mode: str, event: Optional[str], input_data: Dict[str, Any],
+          started: Optional[float] = None) -> Optional[HookMetrics]:
+    """Begin measuring a hook call if instrumentation is enabled.
+
+    Args:
+        mode: "local", "remote" or "server"
+        event: Rule event filter
+        input_data: Hook input JSON
+        started: perf_counter() value the call started at (default: now)
+
+    Returns:
+        HookMetrics, or None if HOOKIFY_METRICS is unset
+    """
+    sink = get_sink()
+    if sink is None:
+        return None
+    return HookMetrics(sink, mode, event, input_data, started)
+
+
+def write_record(record: Dict[str, Any], sink: str):
+    """Write one record as a JSON line to a file or datagram socket.
+
+    Args:
+        record: JSON-serializable record
+        sink: File path, or "unix:" followed by a socket path
+    """
+    line = json.dumps(record, separators=(',', ':')) + '\n'
+    try:
+        if sink.startswith(SOCKET_PREFIX):
+            _send_datagram(line.encode('utf-8'), sink[len(SOCKET_PREFIX):])
+        else:
+            _append_rotating(line.encode('utf-8'), sink)
+    except OSError as e:
+        print(f"Warning: Could not write hookify metrics to {sink}: {e}", file=sys.stderr)
+
+
+def _send_datagram(data: bytes, path: str):
+    """Send a datagram without waiting; dropped if no collector is listening."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        sock.setblocking(False)
+        try:
+            sock.sendto(data, path)
+        except (FileNotFoundError, ConnectionRefusedError, BlockingIOError):
+            pass
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _append_rotating(data: bytes, path: str):
+    """Append one line to path, rotating it first if it has grown too large.
+
+    Lines are written with a single O_APPEND write, so concurrent hook
+    processes never interleave partial records.
+    """
+    max_bytes = _env_int(MAX_BYTES_ENV, DEFAULT_MAX_BYTES)
+    if max_bytes > 0:
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            size = 0
+        if size and size + len(data) > max_bytes:
+            _rotate(path, _env_int(BACKUPS_ENV, DEFAULT_BACKUPS))
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _rotate(path: str, backups: int):
+    """Shift path -> path.1 -> ... -> path.N, dropping the oldest."""
+    if backups <= 0:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        return
+    for i in range(backups - 1, 0, -1):
+        try:
+            os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+        except FileNotFoundError:
+            pass
+    try:
+        os.replace(path, f"{path}.1")
+    except FileNotFoundError:
+        # Another hook process rotated it first
+        pass
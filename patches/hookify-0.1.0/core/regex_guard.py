@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""Bounded-time regex evaluation for hookify plugin.
+
+A Write of a multi-megabyte generated file is matched against every
+regex_match condition, and a pattern with nested quantifiers can backtrack
+for seconds on such input, stalling the agent. RegexGuard bounds this:
+
+- Fields longer than a size cap are not regex-matched at all.
+- Patterns with catastrophic-backtracking shapes (nested unbounded
+  quantifiers, repeated overlapping alternatives) are detected at compile
+  time and run on a linear-time engine (re2) when one is installed.
+- Every other search runs under a time budget enforced with SIGALRM;
+  Python's re module checks for signals while matching, so a runaway
+  search is interrupted. The shape check cannot catch every exponential
+  pattern (e.g. "(.*a){8}x" on short input), so the timer does not depend
+  on it. Timers only work in the main thread; elsewhere searches run
+  unbounded.
+
+Skipped and timed-out searches raise RegexSkipped so the engine can report
+them instead of silently treating them as non-matches.
+
+Configuration (environment):
+    HOOKIFY_REGEX_MAX_INPUT  Size cap in characters (default 2000000, 0 = none)
+    HOOKIFY_REGEX_TIMEOUT    Budget per search in seconds (default 1.0, 0 = none)
+"""
+
+import os
+import re
+import signal
+import threading
+from functools import lru_cache
+from typing import Optional
+
+try:
+    # Python 3.11+
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+try:
+    # Optional linear-time engine (google-re2 / pyre2)
+    import re2
+except ImportError:
+    re2 = None
+
+MAX_INPUT_ENV = 'HOOKIFY_REGEX_MAX_INPUT'
+TIMEOUT_ENV = 'HOOKIFY_REGEX_TIMEOUT'
+
+DEFAULT_MAX_INPUT = 2_000_000
+DEFAULT_TIMEOUT = 1.0
+
+_REPEATS = {
+    sre_constants.MAX_REPEAT,
+    sre_constants.MIN_REPEAT,
+}
+if hasattr(sre_constants, 'POSSESSIVE_REPEAT'):
+    _REPEATS.add(sre_constants.POSSESSIVE_REPEAT)
+
+_ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)
+
+# First-character marker meaning "could be any character"
+_ANY_CHAR = None
+
+
+class RegexSkipped(Exception):
+    """A regex search was not run to completion (input too large or timed out)."""
+
+
+class _Deadline(Exception):
+    """Raised by the SIGALRM handler to interrupt a search."""
+
+
+def backtracking_risk(pattern: str) -> Optional[str]:
+    """Detect pattern shapes prone to catastrophic backtracking.
+
+    Args:
+        pattern: Regex pattern
+
+    Returns:
+        Short description of the risky construct, or None
+    """
+    try:
+        parsed = sre_parse.parse(pattern, re.IGNORECASE)
+    except (re.error, RecursionError, OverflowError):
+        return None
+    return _risk(parsed)
+
+
+def _risk(sequence) -> Optional[str]:
+    """Walk a parsed pattern looking for risky repeats."""
+    for op, av in sequence:
+        if op in _REPEATS:
+            low, high, item = av
+            if high == sre_constants.MAXREPEAT:
+                item_low, item_high = item.getwidth()
+                if item_low != item_high and _has_repeat(item):
+                    return "nested quantifiers"
+                if _has_overlapping_branch(item):
+                    return "repeated overlapping alternatives"
+            found = _risk(item)
+        elif op is sre_constants.SUBPATTERN:
+            found = _risk(av[-1])
+        elif op is _ATOMIC_GROUP:
+            found = _risk(av)
+        elif op is sre_constants.BRANCH:
+            found = next(filter(None, (_risk(branch) for branch in av[1])), None)
+        elif op is sre_constants.ASSERT or op is sre_constants.ASSERT_NOT:
+            found = _risk(av[1])
+        else:
+            found = None
+        if found:
+            return found
+    return None
+
+
+def _has_repeat(sequence) -> bool:
+    """Check whether a parsed sequence contains a variable-count repeat."""
+    for op, av in sequence:
+        if op in _REPEATS:
+            if av[0] != av[1]:
+                return True
+            if _has_repeat(av[2]):
+                return True
+        elif op is sre_constants.SUBPATTERN:
+            if _has_repeat(av[-1]):
+                return True
+        elif op is sre_constants.BRANCH:
+            if any(_has_repeat(branch) for branch in av[1]):
+                return True
+    return False
+
+
+def _has_overlapping_branch(sequence) -> bool:
+    """Check for an alternation whose alternatives can start with the same character."""
+    for op, av in sequence:
+        if op is sre_constants.SUBPATTERN:
+            return _has_overlapping_branch(av[-1])
+        if op is not sre_constants.BRANCH:
+            return False
+        seen = set()
+        for branch in av[1]:
+            first = _first_char(branch)
+            if first is _ANY_CHAR or first in seen:
+                return True
+            seen.add(first)
+        return False
+    return False
+
+
+def _first_char(sequence):
+    """Return the lowercased first literal of a sequence, or _ANY_CHAR."""
+    for op, av in sequence:
+        if op is sre_constants.LITERAL:
+            return chr(av).lower()
+        if op is sre_constants.SUBPATTERN:
+            return _first_char(av[-1])
+        return _ANY_CHAR
+    return _ANY_CHAR
+
+
+class GuardedRegex:
+    """A compiled pattern with its risk assessment and optional linear-time twin."""
+
+    __slots__ = ('pattern', 'regex', 'risk', 'linear')
+
+    def __init__(self, pattern: str):
+        """Compile pattern with re.IGNORECASE, as regex conditions always are.
+
+        Raises:
+            re.error: If the pattern is invalid
+        """
+        self.pattern = pattern
+        self.regex = re.compile(pattern, re.IGNORECASE)
+        self.risk = backtracking_risk(pattern)
+        self.linear = None
+        if self.risk and re2 is not None:
+            try:
+                self.linear = re2.compile('(?i)' + pattern)
+            except Exception:
+                # Syntax re2 does not support (backreferences, lookaround)
+                self.linear = None
+
+
+@lru_cache(maxsize=256)
+def compile_guarded(pattern: str) -> GuardedRegex:
+    """Compile a pattern for guarded searching, with caching.
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return GuardedRegex(pattern)
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Installing a signal handler costs more than most searches, so the SIGALRM
+# handler stays installed between searches. It only interrupts while a
+# guarded search is armed and otherwise acts like the handler it replaced.
+_previous_handler = None
+_deadline_armed = False
+
+
+def _on_alarm(signum, frame):
+    if _deadline_armed:
+        raise _Deadline()
+    previous = _previous_handler
+    signal.signal(signal.SIGALRM, previous)
+    if callable(previous):
+        previous(signum, frame)
+    elif previous == signal.SIG_DFL:
+        os.kill(os.getpid(), signal.SIGALRM)
+
+
+def _install_alarm_handler():
+    global _previous_handler
+    current = signal.getsignal(signal.SIGALRM)
+    if current is not _on_alarm:
+        # None: installed outside Python and cannot be restored; use the default
+        _previous_handler = signal.SIG_DFL if current is None else current
+        signal.signal(signal.SIGALRM, _on_alarm)
+
+
+class RegexGuard:
+    """Runs regex searches under a size cap and a time budget."""
+
+    def __init__(self, max_input: Optional[int] = None, timeout: Optional[float] = None):
+        """Initialize guard.
+
+        Args:
+            max_input: Size cap in characters, 0 for none (default: from environment)
+            timeout: Seconds per search, 0 for none (default: from environment)
+        """
+        if max_input is None:
+            max_input = int(_env_number(MAX_INPUT_ENV, DEFAULT_MAX_INPUT))
+        if timeout is None:
+            timeout = _env_number(TIMEOUT_ENV, DEFAULT_TIMEOUT)
+        self.max_input = max_input
+        self.timeout = timeout
+
+    def search(self, guarded: GuardedRegex, text: str) -> bool:
+        """Check whether the pattern matches somewhere in text.
+
+        Args:
+            guarded: Pattern from compile_guarded()
+            text: Text to search
+
+        Returns:
+            True if the pattern matches
+
+        Raises:
+            RegexSkipped: If text exceeds the size cap or the search timed out
+        """
+        if self.max_input and len(text) > self.max_input:
+            raise RegexSkipped(
+                f"field is {len(text)} characters (limit {self.max_input})"
+            )
+
+        if guarded.linear is not None:
+            return guarded.linear.search(text) is not None
+
+        if self.timeout > 0 and _can_use_timer():
+            return self._search_with_deadline(guarded, text)
+
+        return guarded.regex.search(text) is not None
+
+    def _search_with_deadline(self, guarded: GuardedRegex, text: str) -> bool:
+        """Search with SIGALRM interrupting it after the time budget."""
+        global _deadline_armed
+        _install_alarm_handler()
+        _deadline_armed = True
+        try:
+            signal.setitimer(signal.ITIMER_REAL, self.timeout)
+            try:
+                return guarded.regex.search(text) is not None
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        except _Deadline:
+            reason = f"timed out after {self.timeout:g}s"
+            if guarded.risk:
+                reason += f" (pattern has {guarded.risk})"
+            raise RegexSkipped(reason) from None
+        finally:
+            _deadline_armed = False
+
+
+def _can_use_timer() -> bool:
+    """SIGALRM timers work only in the main thread, and must not clobber another timer."""
+    return (
+        hasattr(signal, 'setitimer')
+        and threading.current_thread() is threading.main_thread()
+        and signal.getitimer(signal.ITIMER_REAL)[0] == 0
+    )
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Persistent parsed-rule cache for hookify plugin.
+
+load_rules() parses every .claude/hookify.*.local.md file on every hook
+call. This module stores the parsed rules as JSON in the project's .claude
+directory, keyed by the name, mtime and size of each rule file, so warm hook
+runs skip markdown and frontmatter parsing entirely. Any added, removed or
+modified rule file invalidates the cache.
+
+The cache is plain JSON (not pickle) so a cache file checked into a project
+can never execute code.
+"""
+
+import dataclasses
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.config_loader import Rule, Condition, load_rule_file
+
+# Rule files, relative to the project directory (matches config_loader)
+RULE_FILE_PATTERN = os.path.join('.claude', 'hookify.*.local.md')
+
+# Cache file, relative to the project directory
+CACHE_FILE = os.path.join('.claude', 'hookify-rules.cache.json')
+
+# Set to disable the cache and always parse rule files
+DISABLE_ENV = 'HOOKIFY_NO_RULE_CACHE'
+
+CACHE_VERSION = 1
+
+# Files modified this recently may still change within the same mtime tick,
+# so a cache built from them is not written
+RACY_SECONDS = 2.0
+
+Signature = Tuple[Tuple[str, int, int], ...]
+
+# How the last load_rules() call got its rules: "hit" (read from the cache),
+# "miss" (rule files parsed) or "off" (cache disabled); reported in metrics
+last_load: Optional[str] = None
+
+
+def rule_files_signature() -> Signature:
+    """Snapshot name, mtime and size of the rule files in the current directory.
+
+    Returns:
+        Sorted tuple of (path, mtime_ns, size) entries
+    """
+    entries = []
+    for path in glob.glob(RULE_FILE_PATTERN):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(sorted(entries))
+
+
+def load_rules(event: Optional[str] = None) -> List[Rule]:
+    """Load rules like config_loader.load_rules, using the cache when valid.
+
+    Args:
+        event: Optional event filter ("bash", "file", "stop", etc.)
+
+    Returns:
+        List of enabled Rule objects matching the event
+    """
+    global last_load
+    if os.environ.get(DISABLE_ENV):
+        from core.config_loader import load_rules as parse_rules
+        last_load = 'off'
+        return parse_rules(event=event)
+
+    signature = rule_files_signature()
+    rules = read_cache(signature)
+    last_load = 'hit'
+    if rules is None:
+        rules = parse_rule_files(signature)
+        last_load = 'miss'
+
+    return [rule for rule in rules if rule.enabled and _matches_event(rule, event)]
+
+
+def _matches_event(rule: Rule, event: Optional[str]) -> bool:
+    """Apply config_loader's event filter."""
+    return not event or rule.event == 'all' or rule.event == event
+
+
+def parse_rule_files(signature: Signature) -> List[Rule]:
+    """Parse every rule file and write the cache if all of them parsed.
+
+    Args:
+        signature: Rule file signature taken before parsing
+
+    Returns:
+        All parsed rules (enabled and disabled) in file order
+    """
+    rules = []
+    complete = True
+    for path in glob.glob(RULE_FILE_PATTERN):
+        # Same handling as config_loader.load_rules: warn and skip the file
+        try:
+            rule = load_rule_file(path)
+        except (IOError, OSError, PermissionError) as e:
+            print(f"Warning: Failed to read {path}: {e}", file=sys.stderr)
+            rule = None
+        except (ValueError, KeyError, AttributeError, TypeError) as e:
+            print(f"Warning: Failed to parse {path}: {e}", file=sys.stderr)
+            rule = None
+        except Exception as e:
+            print(f"Warning: Unexpected error loading {path} ({type(e).__name__}): {e}",
+                  file=sys.stderr)
+            rule = None
+        if rule is None:
+            # Don't cache: warnings for broken files should show on every run
+            complete = False
+            continue
+        rules.append(rule)
+
+    if complete and rule_files_signature() == signature:
+        write_cache(signature, rules)
+    return rules
+
+
+def read_cache(signature: Signature) -> Optional[List[Rule]]:
+    """Return cached rules if the cache matches the current rule files.
+
+    Args:
+        signature: Current rule file signature
+
+    Returns:
+        All cached rules, or None if the cache is missing, stale or unreadable
+    """
+    if not signature:
+        # No rule files: nothing to parse, and no cache needed
+        return []
+
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+        return None
+    if [tuple(entry) for entry in data.get('files', [])] != list(signature):
+        return None
+
+    try:
+        return [_rule_from_dict(entry) for entry in data['rules']]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def write_cache(signature: Signature, rules: List[Rule]):
+    """Atomically write the cache; failures are ignored (next run re-parses).
+
+    Args:
+        signature: Rule file signature the rules were parsed from
+        rules: All parsed rules
+    """
+    if not signature:
+        return
+    racy_after = (time.time() - RACY_SECONDS) * 1e9
+    if any(mtime_ns > racy_after for _, mtime_ns, _ in signature):
+        return
+
+    data = {
+        'version': CACHE_VERSION,
+        'files': [list(entry) for entry in signature],
+        'rules': [dataclasses.asdict(rule) for rule in rules],
+    }
+    cache_dir = os.path.dirname(CACHE_FILE)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.hookify-rules.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, CACHE_FILE)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _rule_from_dict(data: Dict[str, Any]) -> Rule:
+    """Rebuild a Rule (and its Conditions) from dataclasses.asdict output."""
+    values = dict(data)
+    values['conditions'] = [Condition(**condition) for condition in values.get('conditions', [])]
+    return Rule(**values)
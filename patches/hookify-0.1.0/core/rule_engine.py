@@ -1,27 +1,22 @@
 #!/usr/bin/env python3
 """Rule evaluation engine for hookify plugin."""
 
+import os
 import re
 import sys
-from functools import lru_cache
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
 
 # Import from local module (use relative import for sibling module)
 from core.config_loader import Rule, Condition
+from core.metrics import EvaluationStats
+from core.regex_guard import RegexGuard, RegexSkipped, compile_guarded
+from core.literals import fold_case
+from core.rule_index import RuleIndex
+from core.transcript import TranscriptScanner
 
-
-# Cache compiled regexes (max 128 patterns)
-@lru_cache(maxsize=128)
-def compile_regex(pattern: str) -> re.Pattern:
-    """Compile regex pattern with caching.
-
-    Args:
-        pattern: Regex pattern string
-
-    Returns:
-        Compiled regex pattern
-    """
-    return re.compile(pattern, re.IGNORECASE)
+# Set to "per-edit" to evaluate MultiEdit edits one by one instead of joined
+MULTIEDIT_MODE_ENV = 'HOOKIFY_MULTIEDIT'
 
 
 class RuleEngine:
@@ -29,37 +24,189 @@ class RuleEngine:
 
     def __init__(self):
         """Initialize rule engine."""
-        # No need for instance cache anymore - using global lru_cache
-        pass
+        # Compiled index for the most recently evaluated rule list
+        self._index: Optional[RuleIndex] = None
+        self._index_rules: List[Rule] = []
+        # Incremental transcript scans, kept across Stop events
+        self._transcripts = TranscriptScanner()
+        # Size cap and time budget for regex searches
+        self._regex_guard = RegexGuard()
+        # Match MultiEdit edit fields per edit rather than on the joined text
+        self.multiedit_per_edit = os.environ.get(MULTIEDIT_MODE_ENV) == 'per-edit'
+
+    def compile_rules(self, rules: List[Rule]) -> RuleIndex:
+        """Compile a rule list into an index keyed by event and tool name.
 
-    def evaluate_rules(self, rules: List[Rule], input_data: Dict[str, Any]) -> Dict[str, Any]:
+        Args:
+            rules: List of Rule objects
+
+        Returns:
+            RuleIndex that can be passed to evaluate_rules in place of the list
+        """
+        return RuleIndex(rules)
+
+    def _get_index(self, rules) -> RuleIndex:
+        """Return a compiled index for rules, reusing it while the list is unchanged."""
+        if isinstance(rules, RuleIndex):
+            return rules
+
+        cached = self._index_rules
+        if (self._index is None or len(cached) != len(rules)
+                or any(a is not b for a, b in zip(cached, rules))):
+            self._index = self.compile_rules(rules)
+            self._index_rules = list(rules)
+        return self._index
+
+    def evaluate_rules(self, rules, input_data: Dict[str, Any],
+                       stats: Optional[EvaluationStats] = None) -> Dict[str, Any]:
         """Evaluate all rules and return combined results.
 
         Checks all rules and accumulates matches. Blocking rules take priority
         over warning rules. All matching rule messages are combined.
 
+        Only rules whose tool matcher accepts the input's tool are visited,
+        each field referenced by a condition is extracted at most once, and a
+        rule's conditions are checked cheapest first.
+
         Args:
-            rules: List of Rule objects to evaluate
+            rules: List of Rule objects, or a RuleIndex from compile_rules()
             input_data: Hook input JSON (tool_name, tool_input, etc.)
+            stats: Filled with timings and counters if given (see core/metrics.py)
 
         Returns:
             Response dict with systemMessage, hookSpecificOutput, etc.
             Empty dict {} if no rules match.
         """
         hook_event = input_data.get('hook_event_name', '')
+        index = self._get_index(rules)
+        tool_name = input_data.get('tool_name', '')
+        fields = FieldValues(self, tool_name, input_data.get('tool_input', {}), input_data)
+
+        if stats is None:
+            matches = self._match(index, fields)
+        else:
+            matches = self._match_measured(index, fields, stats)
+
         blocking_rules = []
         warning_rules = []
+        for rule, edit_index in matches:
+            if rule.action == 'block':
+                blocking_rules.append((rule, edit_index))
+            else:
+                warning_rules.append((rule, edit_index))
 
-        for rule in rules:
-            if self._rule_matches(rule, input_data):
-                if rule.action == 'block':
-                    blocking_rules.append(rule)
-                else:
-                    warning_rules.append(rule)
+        response = self._build_response(hook_event, blocking_rules, warning_rules)
+        if fields.skipped:
+            response = self._add_skip_warnings(response, fields.skipped, index, tool_name)
+        return response
 
+    def matching_rules(self, rules, input_data: Dict[str, Any]) -> List[Tuple[Rule, Optional[int]]]:
+        """Return the rules that match an input, without building a response.
+
+        Args:
+            rules: List of Rule objects, or a RuleIndex from compile_rules()
+            input_data: Hook input JSON (tool_name, tool_input, etc.)
+
+        Returns:
+            (rule, edit index) pairs in rule order; the edit index is set when
+            a single MultiEdit edit triggered the rule (per-edit mode)
+        """
+        index = self._get_index(rules)
+        tool_name = input_data.get('tool_name', '')
+        fields = FieldValues(self, tool_name, input_data.get('tool_input', {}), input_data)
+        return self._match(index, fields)
+
+    def _match(self, index: RuleIndex, fields: 'FieldValues') -> List[Tuple[Rule, Optional[int]]]:
+        """Check every candidate rule against the extracted fields.
+
+        Args:
+            index: Compiled rule index
+            fields: Extracted field values for the input
+
+        Returns:
+            (rule, edit index) pairs for matching rules, in rule order
+        """
+        # Per-edit views of a MultiEdit, shared by every rule that needs them
+        edit_views = None
+        if self.multiedit_per_edit and fields.tool_name == 'MultiEdit':
+            edit_views = fields.edit_views()
+
+        matches = []
+        for compiled in index.candidates(fields.tool_name):
+            matched, edit_index = self._match_rule(compiled, fields, edit_views, index)
+            if matched:
+                matches.append((compiled.rule, edit_index))
+        return matches
+
+    def _match_measured(self, index: RuleIndex, fields: 'FieldValues',
+                        stats: EvaluationStats) -> List[Tuple[Rule, Optional[int]]]:
+        """Same as _match, recording timings and counters into stats.
+
+        Extraction and transcript scanning are timed where they happen (in
+        FieldValues); "match" is the remaining time spent checking conditions.
+        """
+        fields.stats = stats
+        cache_before = compile_guarded.cache_info()
+        started = time.perf_counter()
+
+        edit_views = None
+        if self.multiedit_per_edit and fields.tool_name == 'MultiEdit':
+            edit_views = fields.edit_views()
+
+        matches = []
+        for compiled in index.candidates(fields.tool_name):
+            rule_started = time.perf_counter()
+            matched, edit_index = self._match_rule(compiled, fields, edit_views, index)
+            stats.add_rule_time(compiled.rule.name, time.perf_counter() - rule_started)
+            stats.rules_considered += 1
+            if matched:
+                matches.append((compiled.rule, edit_index))
+                stats.rules_matched.append(compiled.rule.name)
+
+        elapsed = time.perf_counter() - started
+        stats.add_time('match', elapsed - stats.timings.get('extract', 0.0)
+                       - stats.timings.get('transcript', 0.0))
+        cache_after = compile_guarded.cache_info()
+        stats.regex_cache_hits += cache_after.hits - cache_before.hits
+        stats.regex_cache_misses += cache_after.misses - cache_before.misses
+        return matches
+
+    def _match_rule(self, compiled, fields: 'FieldValues',
+                    edit_views: Optional[List['FieldValues']],
+                    index: RuleIndex) -> Tuple[bool, Optional[int]]:
+        """Check one compiled rule.
+
+        Returns:
+            (matched, edit index); the edit index is set when the rule was
+            checked per MultiEdit edit
+        """
+        if edit_views is not None and compiled.uses_edit_fields:
+            edit_index = next((
+                i for i, view in enumerate(edit_views)
+                if all(self._check_indexed(condition, view, index)
+                       for condition in compiled.conditions)
+            ), None)
+            return edit_index is not None, edit_index
+        return all(self._check_indexed(condition, fields, index)
+                   for condition in compiled.conditions), None
+
+    def _build_response(self, hook_event: str,
+                        blocking_rules: List[Tuple[Rule, Optional[int]]],
+                        warning_rules: List[Tuple[Rule, Optional[int]]]) -> Dict[str, Any]:
+        """Build the hook response for the matched rules.
+
+        Args:
+            hook_event: Hook event name from the input
+            blocking_rules: Matched (rule, edit index) pairs with action "block"
+            warning_rules: Other matched (rule, edit index) pairs; the edit
+                index is set when a single MultiEdit edit triggered the rule
+
+        Returns:
+            Response dict, {} if no rules matched
+        """
         # If any blocking rules matched, block the operation
         if blocking_rules:
-            messages = [f"**[{r.name}]**\n{r.message}" for r in blocking_rules]
+            messages = [_format_match(r, i) for r, i in blocking_rules]
             combined_message = "\n\n".join(messages)
 
             # Use appropriate blocking format based on event type
@@ -85,7 +232,7 @@ class RuleEngine:
 
         # If only warnings, show them but allow operation
         if warning_rules:
-            messages = [f"**[{r.name}]**\n{r.message}" for r in warning_rules]
+            messages = [_format_match(r, i) for r, i in warning_rules]
             return {
                 "systemMessage": "\n\n".join(messages)
             }
@@ -93,69 +240,88 @@ class RuleEngine:
         # No matches - allow operation
         return {}
 
-    def _rule_matches(self, rule: Rule, input_data: Dict[str, Any]) -> bool:
-        """Check if rule matches input data.
+    def _add_skip_warnings(self, response: Dict[str, Any], skipped: List[Tuple[str, str, str]],
+                           index: RuleIndex, tool_name: str) -> Dict[str, Any]:
+        """Report regex searches that were skipped or timed out.
 
         Args:
-            rule: Rule to evaluate
-            input_data: Hook input data
+            response: Response built from the matched rules
+            skipped: (field, pattern, reason) for each skipped search
+            index: Compiled rule index being evaluated
+            tool_name: Tool being used
 
         Returns:
-            True if rule matches, False otherwise
+            Response with the warnings appended to systemMessage
         """
-        # Extract tool information
-        tool_name = input_data.get('tool_name', '')
-        tool_input = input_data.get('tool_input', {})
-
-        # Check tool matcher if specified
-        if rule.tool_matcher:
-            if not self._matches_tool(rule.tool_matcher, tool_name):
-                return False
-
-        # If no conditions, don't match
-        # (Rules must have at least one condition to be valid)
-        if not rule.conditions:
-            return False
-
-        # All conditions must match
-        for condition in rule.conditions:
-            if not self._check_condition(condition, tool_name, tool_input, input_data):
-                return False
+        lines = []
+        for field, pattern, reason in skipped:
+            names = [
+                compiled.rule.name
+                for compiled in index.candidates(tool_name)
+                if any(c.field == field and c.operator == 'regex_match' and c.pattern == pattern
+                       for c in compiled.conditions)
+            ]
+            line = f"regex '{pattern}' on {field} not evaluated ({', '.join(names)}): {reason}"
+            print(f"Warning: {line}", file=sys.stderr)
+            lines.append(f"- {line}")
+
+        warning = "**[hookify]** Some conditions were treated as not matching:\n" + "\n".join(lines)
+        response = dict(response)
+        if response.get("systemMessage"):
+            response["systemMessage"] += "\n\n" + warning
+        else:
+            response["systemMessage"] = warning
+        return response
 
-        return True
+    def _check_indexed(self, condition: Condition, fields: 'FieldValues',
+                       index: RuleIndex) -> bool:
+        """Check a condition using per-input extracted fields and literal prefilters.
 
-    def _matches_tool(self, matcher: str, tool_name: str) -> bool:
-        """Check if tool_name matches the matcher pattern.
+        regex_match conditions are rejected without running the regex when a
+        literal they require is absent; literal lookups are shared by every
+        pattern on the field. Transcript conditions are answered by scanning
+        only newly appended content.
 
         Args:
-            matcher: Pattern like "Bash", "Edit|Write", "*"
-            tool_name: Actual tool name
+            condition: Condition to check
+            fields: Extracted field values for the current input
+            index: Compiled rule index being evaluated
 
         Returns:
-            True if matches
+            True if condition matches
         """
-        if matcher == '*':
-            return True
+        if condition.field == 'transcript':
+            streamed = fields.transcript_result(condition, index)
+            if streamed is not None:
+                return streamed
+
+        field_value = fields.get(condition.field)
+        if field_value is None:
+            return False
+
+        if condition.operator == 'regex_match':
+            # Reject without running the regex if a required literal is missing
+            clauses = index.literals(condition.pattern)
+            if clauses and not fields.has_literals(condition.field, clauses):
+                return False
 
-        # Split on | for OR matching
-        patterns = matcher.split('|')
-        return tool_name in patterns
+            return fields.regex_search(condition.field, condition.pattern)
 
-    def _check_condition(self, condition: Condition, tool_name: str,
-                        tool_input: Dict[str, Any], input_data: Dict[str, Any] = None) -> bool:
-        """Check if a single condition matches.
+        return self._check_value(condition, field_value)
+
+    def _check_value(self, condition: Condition, field_value: Optional[str]) -> bool:
+        """Apply a condition's operator to an already extracted field value.
+
+        regex_match conditions are answered by _check_indexed, which shares
+        regex scans between conditions, and never reach this method.
 
         Args:
             condition: Condition to check
-            tool_name: Tool being used
-            tool_input: Tool input dict
-            input_data: Full hook input data (for Stop events, etc.)
+            field_value: Extracted field value, or None if the field is absent
 
         Returns:
             True if condition matches
         """
-        # Extract the field value to check
-        field_value = self._extract_field(condition.field, tool_name, tool_input, input_data)
         if field_value is None:
             return False
 
@@ -163,9 +329,7 @@ class RuleEngine:
         operator = condition.operator
         pattern = condition.pattern
 
-        if operator == 'regex_match':
-            return self._regex_match(pattern, field_value)
-        elif operator == 'contains':
+        if operator == 'contains':
             return pattern in field_value
         elif operator == 'equals':
             return pattern == field_value
@@ -253,25 +417,193 @@ class RuleEngine:
 
         return None
 
-    def _regex_match(self, pattern: str, text: str) -> bool:
-        """Check if pattern matches text using regex.
+
+def _format_match(rule: Rule, edit_index: Optional[int]) -> str:
+    """Format a matched rule's message, noting the MultiEdit edit that triggered it."""
+    if edit_index is None:
+        return f"**[{rule.name}]**\n{rule.message}"
+    return f"**[{rule.name}]** (edits[{edit_index}])\n{rule.message}"
+
+
+class FieldValues:
+    """Lazily extracted field values for one hook input.
+
+    Each field is extracted at most once, however many conditions reference it.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, engine: RuleEngine, tool_name: str,
+                 tool_input: Dict[str, Any], input_data: Dict[str, Any],
+                 extract_as: Optional[str] = None):
+        """Bind the input the fields are extracted from.
+
+        Args:
+            engine: RuleEngine providing _extract_field
+            tool_name: Tool being used
+            tool_input: Tool input dict
+            input_data: Full hook input data
+            extract_as: Tool name to extract fields as (default: tool_name)
+        """
+        self._engine = engine
+        self.tool_name = tool_name
+        self._extract_as = extract_as or tool_name
+        self._tool_input = tool_input
+        self._input_data = input_data
+        self._values: Dict[str, Optional[str]] = {}
+        self._regex_results: Dict[Tuple[str, str], bool] = {}
+        self._folded: Dict[str, str] = {}
+        # field -> literal -> whether the folded field value contains it
+        self._literals_present: Dict[str, Dict[str, bool]] = {}
+        self._transcript_results: Optional[Dict[Tuple[str, str], bool]] = None
+        # (field, pattern, reason) for regex searches that were not run to completion
+        self.skipped: List[Tuple[str, str, str]] = []
+        # Set by RuleEngine when the evaluation is instrumented
+        self.stats: Optional[EvaluationStats] = None
+
+    def get(self, field: str) -> Optional[str]:
+        """Return the field value, extracting it on first use.
+
+        Args:
+            field: Field name like "command" or "new_text"
+
+        Returns:
+            Field value as string, or None if not found
+        """
+        value = self._values.get(field, self._MISSING)
+        if value is self._MISSING:
+            started = time.perf_counter() if self.stats is not None else 0.0
+            value = self._engine._extract_field(
+                field, self._extract_as, self._tool_input, self._input_data
+            )
+            self._values[field] = value
+            if self.stats is not None:
+                self.stats.add_time('extract', time.perf_counter() - started)
+        return value
+
+    def edit_views(self) -> List['FieldValues']:
+        """Return one view per MultiEdit edit, extracted like a single Edit.
+
+        Views read each edit's old_string/new_string directly (nothing is
+        joined) and report skipped regex searches into this object.
+
+        Returns:
+            List of FieldValues, in edit order
+        """
+        views = []
+        file_path = self._tool_input.get('file_path', '')
+        for edit in self._tool_input.get('edits', []):
+            edit_input = {
+                'file_path': file_path,
+                'old_string': edit.get('old_string', ''),
+                'new_string': edit.get('new_string', ''),
+            }
+            view = FieldValues(self._engine, self.tool_name, edit_input,
+                               self._input_data, extract_as='Edit')
+            view.skipped = self.skipped
+            view.stats = self.stats
+            views.append(view)
+        return views
+
+    def regex_search(self, field: str, pattern: str) -> bool:
+        """Search the field for a pattern under the engine's size and time limits.
 
         Args:
+            field: Field name
             pattern: Regex pattern
-            text: Text to match against
 
         Returns:
-            True if pattern matches
+            True if the pattern matches; False if it does not, is invalid,
+            or the search was skipped (recorded in self.skipped)
         """
+        key = (field, pattern)
+        result = self._regex_results.get(key)
+        if result is None:
+            try:
+                compile_guarded(pattern)
+            except re.error as e:
+                print(f"Invalid regex pattern '{pattern}': {e}", file=sys.stderr)
+                return False
+            result = self._guarded_search(field, pattern, self.get(field) or '')
+            self._regex_results[key] = result
+        return result
+
+    def _guarded_search(self, field: str, pattern: str, text: str) -> bool:
+        """Run one guarded search, recording it if it was skipped."""
+        if self.stats is not None:
+            self.stats.regex_searches += 1
         try:
-            # Use cached compiled regex (LRU cache with max 128 patterns)
-            regex = compile_regex(pattern)
-            return bool(regex.search(text))
-
-        except re.error as e:
-            print(f"Invalid regex pattern '{pattern}': {e}", file=sys.stderr)
+            return self._engine._regex_guard.search(compile_guarded(pattern), text)
+        except RegexSkipped as e:
+            self.skipped.append((field, pattern, str(e)))
             return False
 
+    def folded(self, field: str) -> str:
+        """Return the case-folded field value used for literal prefilters.
+
+        Args:
+            field: Field name
+
+        Returns:
+            fold_case() of the field value ('' if absent)
+        """
+        folded = self._folded.get(field)
+        if folded is None:
+            folded = self._folded[field] = fold_case(self.get(field) or '')
+        return folded
+
+    def has_literals(self, field: str, clauses: List[FrozenSet[str]]) -> bool:
+        """Check a literal prefilter against the field.
+
+        Each literal is looked up in the folded field value once per input,
+        however many patterns require it.
+
+        Args:
+            field: Field name
+            clauses: Literal clauses from RuleIndex.literals()
+
+        Returns:
+            True if every clause has a literal present in the field
+        """
+        folded = self.folded(field)
+        present = self._literals_present.setdefault(field, {})
+        for clause in clauses:
+            for literal in clause:
+                found = present.get(literal)
+                if found is None:
+                    found = present[literal] = literal in folded
+                if found:
+                    break
+            else:
+                return False
+        return True
+
+    def transcript_result(self, condition: Condition, index: RuleIndex) -> Optional[bool]:
+        """Evaluate a transcript condition incrementally.
+
+        All transcript conditions of the candidate rules are evaluated in one
+        scan on first use.
+
+        Args:
+            condition: Condition on the transcript field
+            index: Compiled rule index being evaluated
+
+        Returns:
+            Condition result, or None if it needs the full transcript text
+        """
+        if self._transcript_results is None:
+            transcript_path = (self._input_data or {}).get('transcript_path')
+            results = None
+            if transcript_path and 'transcript' not in self._tool_input:
+                started = time.perf_counter()
+                conditions = index.conditions('transcript', self.tool_name)
+                results = self._engine._transcripts.evaluate(transcript_path, conditions)
+                if self.stats is not None:
+                    self.stats.add_time('transcript', time.perf_counter() - started)
+            self._transcript_results = results or {}
+
+        return self._transcript_results.get((condition.operator, condition.pattern))
+
 
 # For testing
 if __name__ == '__main__':
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Compiled rule index for hookify plugin.
+
+RuleEngine used to walk every rule for every hook call, re-splitting each
+rule's tool_matcher and re-extracting fields per condition. A RuleIndex is
+built once per rule list and answers "which rules can apply to this tool and
+event" with a dict lookup, preserving the original rule order.
+
+Within a rule, conditions are ordered cheapest first so that a failing
+equals/starts_with/contains check rejects the rule before any regex runs.
+"""
+
+from typing import List, Dict, Optional, Tuple, FrozenSet
+
+from core.config_loader import Rule, Condition
+from core.literals import required_literals
+
+# Rule event that applies to every hook event
+ALL_EVENTS = 'all'
+
+# Relative cost of evaluating a condition, by operator
+OPERATOR_COSTS = {
+    'equals': 1,
+    'starts_with': 1,
+    'ends_with': 1,
+    'contains': 2,
+    'not_contains': 2,
+    'regex_match': 8,
+}
+
+# Extra cost for fields that are expensive to extract (transcript reads a file)
+FIELD_COSTS = {
+    'transcript': 100,
+}
+
+
+# Fields that come from a single edit when MultiEdit edits are evaluated one by one
+EDIT_FIELDS = frozenset(['new_text', 'new_string', 'content', 'old_text', 'old_string'])
+
+
+def condition_cost(condition: Condition) -> int:
+    """Estimate the cost of checking a condition.
+
+    Args:
+        condition: Condition to estimate
+
+    Returns:
+        Relative cost; unknown operators are free (they never match)
+    """
+    return OPERATOR_COSTS.get(condition.operator, 0) + FIELD_COSTS.get(condition.field, 0)
+
+
+class CompiledRule:
+    """A rule with its tool matcher pre-parsed."""
+
+    __slots__ = ('rule', 'position', 'tools', 'conditions', 'uses_edit_fields')
+
+    def __init__(self, rule: Rule, position: int):
+        """Compile a rule.
+
+        Args:
+            rule: Rule to compile
+            position: Index of the rule in the original list (keeps output order stable)
+        """
+        self.rule = rule
+        self.position = position
+        self.tools = parse_tool_matcher(rule.tool_matcher)
+        # Cheapest first; all conditions must match so order does not change the result
+        self.conditions: List[Condition] = sorted(rule.conditions, key=condition_cost)
+        self.uses_edit_fields = any(c.field in EDIT_FIELDS for c in self.conditions)
+
+    def matches_tool(self, tool_name: str) -> bool:
+        """Check the pre-parsed tool matcher against a tool name.
+
+        Args:
+            tool_name: Actual tool name
+
+        Returns:
+            True if the rule applies to the tool
+        """
+        return self.tools is None or tool_name in self.tools
+
+
+def parse_tool_matcher(matcher: Optional[str]) -> Optional[FrozenSet[str]]:
+    """Parse a tool matcher like "Edit|Write" once.
+
+    Args:
+        matcher: Tool matcher string, "*" or None
+
+    Returns:
+        Set of tool names, or None if the rule applies to every tool
+    """
+    if not matcher or matcher == '*':
+        return None
+    return frozenset(matcher.split('|'))
+
+
+class RuleIndex:
+    """Rules bucketed by event and tool name, plus per-field condition buckets.
+
+    Attributes:
+        rules: All compiled rules that can ever match, in original order
+        fields: Field name -> list of (compiled rule, condition) referencing it
+    """
+
+    def __init__(self, rules: List[Rule]):
+        """Build the index.
+
+        Rules without conditions never match and are left out.
+
+        Args:
+            rules: Rules to index
+        """
+        self.rules: List[CompiledRule] = [
+            CompiledRule(rule, position)
+            for position, rule in enumerate(rules)
+            if rule.conditions
+        ]
+
+        # event -> tool name -> rules; None tool key holds rules for any tool
+        self._buckets: Dict[str, Dict[Optional[str], List[CompiledRule]]] = {}
+        self.fields: Dict[str, List[Tuple[CompiledRule, Condition]]] = {}
+
+        for compiled in self.rules:
+            by_tool = self._buckets.setdefault(compiled.rule.event, {})
+            if compiled.tools is None:
+                by_tool.setdefault(None, []).append(compiled)
+            else:
+                for tool in compiled.tools:
+                    by_tool.setdefault(tool, []).append(compiled)
+
+            for condition in compiled.conditions:
+                self.fields.setdefault(condition.field, []).append((compiled, condition))
+
+        # (event, tool name) -> merged candidate list
+        self._candidates: Dict[Tuple[Optional[str], str], List[CompiledRule]] = {}
+        # regex pattern -> literal clauses required by any match
+        self._literals: Dict[str, List[FrozenSet[str]]] = {}
+
+    def candidates(self, tool_name: str, event: Optional[str] = None) -> List[CompiledRule]:
+        """Return the rules that can apply to a tool call, in original order.
+
+        Args:
+            tool_name: Tool being used (empty for Stop/UserPromptSubmit)
+            event: Rule event to restrict to ("bash", "file", ...); None for all events
+
+        Returns:
+            List of compiled rules whose event and tool matcher accept the input
+        """
+        key = (event, tool_name)
+        cached = self._candidates.get(key)
+        if cached is not None:
+            return cached
+
+        if event is None:
+            events = list(self._buckets)
+        else:
+            events = [e for e in (event, ALL_EVENTS) if e in self._buckets]
+
+        merged = []
+        for e in events:
+            by_tool = self._buckets[e]
+            merged.extend(by_tool.get(tool_name, ()))
+            merged.extend(by_tool.get(None, ()))
+
+        # A rule lives in exactly one event bucket and at most once per tool
+        merged.sort(key=lambda compiled: compiled.position)
+        self._candidates[key] = merged
+        return merged
+
+    def conditions(self, field: str, tool_name: str,
+                   event: Optional[str] = None) -> List[Condition]:
+        """Return the candidate rules' conditions on a field for a tool call.
+
+        Args:
+            field: Field the conditions test
+            tool_name: Tool being used
+            event: Rule event to restrict to; None for all events
+
+        Returns:
+            List of conditions, in rule order
+        """
+        return [
+            condition
+            for compiled in self.candidates(tool_name, event)
+            for condition in compiled.conditions
+            if condition.field == field
+        ]
+
+    def literals(self, pattern: str) -> List[FrozenSet[str]]:
+        """Return the literal prefilter for a regex_match pattern.
+
+        Args:
+            pattern: Regex pattern
+
+        Returns:
+            Clauses of lowercase literals (see literals.required_literals);
+            text that lacks every literal of some clause cannot match
+        """
+        clauses = self._literals.get(pattern)
+        if clauses is None:
+            clauses = self._literals[pattern] = required_literals(pattern)
+        return clauses
+
+    def __len__(self) -> int:
+        return len(self.rules)
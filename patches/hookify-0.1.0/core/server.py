@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Persistent rule evaluation server for hookify plugin.
+
+Every hook call normally starts a fresh interpreter, re-imports the engine,
+re-parses all .claude/hookify.*.local.md files and starts with a cold regex
+cache. This server keeps loaded rules and compiled regexes in memory and
+answers hook scripts over a Unix domain socket (see core/client.py).
+
+The server is optional: when it is not running, hook scripts evaluate rules
+in-process as before.
+
+Usage:
+    python3 core/server.py [--socket PATH] [--idle-timeout SECONDS]
+
+Protocol:
+    One newline-terminated JSON request per connection:
+        {"event": "bash", "cwd": "/path/to/project", "input": {...hook input...}}
+    answered by one newline-terminated JSON hook response.
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+# Add plugin root so we can import from core/ directly
+PLUGIN_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PLUGIN_ROOT not in sys.path:
+    sys.path.insert(0, PLUGIN_ROOT)
+
+from core import metrics
+from core.client import get_socket_path
+from core.config_loader import Rule
+from core import rule_cache
+from core.rule_cache import load_rules, rule_files_signature
+from core.rule_engine import RuleEngine
+
+# Shut down after this many seconds without requests (0 disables)
+DEFAULT_IDLE_TIMEOUT = 3600
+
+
+class RuleStore:
+    """Loaded rules per project directory and event, reloaded when rule files change."""
+
+    def __init__(self):
+        """Initialize empty store."""
+        self._rules: Dict[Tuple[str, Optional[str]], Tuple[Any, List[Rule]]] = {}
+        # How the last get() got its rules: "memory", or rule_cache.last_load
+        self.last_load: Optional[str] = None
+
+    def get(self, cwd: str, event: Optional[str]) -> List[Rule]:
+        """Return rules for a project, reloading if any rule file changed.
+
+        Must be called with the process working directory set to cwd.
+
+        Args:
+            cwd: Project directory the rules belong to
+            event: Event filter passed to load_rules
+
+        Returns:
+            List of enabled rules for the event
+        """
+        key = (cwd, event)
+        signature = rule_files_signature()
+        cached = self._rules.get(key)
+        if cached is not None and cached[0] == signature:
+            self.last_load = 'memory'
+            return cached[1]
+
+        rules = load_rules(event=event)
+        self.last_load = rule_cache.last_load
+        self._rules[key] = (signature, rules)
+        return rules
+
+
+class HookifyRequestHandler(socketserver.StreamRequestHandler):
+    """Handles a single hook evaluation request."""
+
+    def handle(self):
+        """Read one JSON request and write one JSON response."""
+        try:
+            request = json.loads(self.rfile.readline().decode('utf-8'))
+            response = self.server.evaluate(request)
+        except Exception as e:
+            # Mirror the hook scripts: never block on hookify errors
+            response = {"systemMessage": f"Hookify error: {str(e)}"}
+
+        try:
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+        except OSError:
+            # Client went away (e.g. hook timed out); nothing to report to
+            pass
+
+
+class HookifyServer(socketserver.UnixStreamServer):
+    """Unix socket server holding warm rules and a shared RuleEngine.
+
+    Requests are handled one at a time: load_rules() resolves rule files
+    relative to the working directory, so each request switches into its
+    project directory before loading rules.
+    """
+
+    def __init__(self, socket_path: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """Bind the server socket.
+
+        Args:
+            socket_path: Filesystem path of the Unix socket
+            idle_timeout: Seconds without requests before exiting (0 disables)
+        """
+        self.socket_path = socket_path
+        self.timeout = idle_timeout or None
+        self.idle = False
+        self.store = RuleStore()
+        self.engine = RuleEngine()
+
+        _remove_stale_socket(socket_path)
+        # Socket is only accessible to the current user
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(socket_path, HookifyRequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def evaluate(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Evaluate one hook request.
+
+        Args:
+            request: Dict with "event", "cwd" and "input" keys
+
+        Returns:
+            Hook response dict
+        """
+        input_data = request.get('input') or {}
+        cwd = request.get('cwd') or input_data.get('cwd')
+        if not cwd:
+            raise ValueError("request has no working directory")
+
+        measure = metrics.start('server', request.get('event'), input_data)
+        os.chdir(cwd)
+        if measure is None:
+            rules = self.store.get(cwd, request.get('event'))
+            return self.engine.evaluate_rules(rules, input_data)
+
+        rules = self.store.get(cwd, request.get('event'))
+        measure.add_time('load', time.perf_counter() - measure.started)
+        measure.rules_loaded = len(rules)
+        measure.rule_cache = self.store.last_load
+        response = self.engine.evaluate_rules(rules, input_data, stats=measure.new_stats())
+        measure.emit(response)
+        return response
+
+    def handle_timeout(self):
+        """Stop serving after the idle timeout elapses."""
+        self.idle = True
+
+    def serve_until_idle(self):
+        """Serve requests until the idle timeout elapses."""
+        while not self.idle:
+            self.handle_request()
+
+    def server_close(self):
+        """Close the socket and remove its path."""
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+def _remove_stale_socket(socket_path: str):
+    """Remove a leftover socket file, refusing if a server is still listening.
+
+    Args:
+        socket_path: Filesystem path of the Unix socket
+
+    Raises:
+        RuntimeError: If another server is already accepting connections
+    """
+    if not os.path.exists(socket_path):
+        return
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.unlink(socket_path)
+        return
+    finally:
+        probe.close()
+
+    raise RuntimeError(f"hookify server already running on {socket_path}")
+
+
+def main():
+    """Run the hookify evaluation server."""
+    parser = argparse.ArgumentParser(description="Hookify rule evaluation server")
+    parser.add_argument(
+        "--socket",
+        default=get_socket_path(),
+        help="Unix socket path (default: $HOOKIFY_SOCKET or a private per-user directory)",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="Exit after this many idle seconds, 0 to run forever (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    if not args.socket:
+        sys.exit("Error: no private runtime directory for the socket; use --socket")
+
+    try:
+        server = HookifyServer(args.socket, idle_timeout=args.idle_timeout)
+    except RuntimeError as e:
+        sys.exit(f"Error: {e}")
+
+    # Clean up the socket file when stopped with kill
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    print(f"hookify server listening on {args.socket}", file=sys.stderr)
+    try:
+        server.serve_until_idle()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""Incremental transcript matching for hookify Stop rules.
+
+The transcript field used to be read into one string on every Stop event,
+once per condition. Transcripts only grow during a session, so
+TranscriptScanner scans the file in chunks and keeps, per transcript, the
+byte offset scanned so far, the tail of the scanned text and the conditions
+already known to match. Each Stop then only decodes and searches the newly
+appended content plus a small overlap for matches that span the boundary.
+
+State is kept in memory (for the evaluation server) and persisted to small
+JSON files so separate hook processes can pick up where the last one stopped.
+If the file was truncated, replaced or rewritten, scanning starts over.
+
+Conditions that cannot be answered incrementally are left to the caller,
+which reads the whole transcript as before: equals, invalid regexes, and
+regexes whose matches (with lookaround) can reach further than MAX_OVERLAP
+characters, such as any pattern with an unbounded repeat like ".*", since a
+match spanning a chunk or Stop boundary could be missed.
+"""
+
+import codecs
+import hashlib
+import io
+import json
+import locale
+import os
+import re
+import tempfile
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    # Python 3.11+
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+from core.client import get_runtime_dir
+from core.config_loader import Condition
+
+# Directory for persisted scan state ("off" keeps state in memory only)
+CACHE_ENV = 'HOOKIFY_TRANSCRIPT_CACHE'
+
+# Bytes decoded and searched at a time
+CHUNK_BYTES = 1024 * 1024
+
+# Characters rescanned before new content so boundary-spanning matches are found
+MAX_OVERLAP = 64 * 1024
+
+# Leading characters kept for starts_with
+HEAD_CHARS = 4096
+
+# Raw bytes before the scanned offset used to detect rewritten files
+ANCHOR_BYTES = 64
+
+STATE_VERSION = 1
+
+_REPEATS = {
+    sre_constants.MAX_REPEAT,
+    sre_constants.MIN_REPEAT,
+}
+if hasattr(sre_constants, 'POSSESSIVE_REPEAT'):
+    _REPEATS.add(sre_constants.POSSESSIVE_REPEAT)
+
+_ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)
+
+_KEEP_CHARS = MAX_OVERLAP + 1
+
+
+def get_cache_dir() -> Optional[str]:
+    """Return the directory for persisted transcript state.
+
+    Returns:
+        $HOOKIFY_TRANSCRIPT_CACHE if set, a directory in the private per-user
+        runtime directory otherwise, or None if persistence is disabled (or
+        no private directory is available)
+    """
+    path = os.environ.get(CACHE_ENV)
+    if path:
+        return None if path == 'off' else path
+    runtime_dir = get_runtime_dir()
+    if runtime_dir is None:
+        return None
+    return os.path.join(runtime_dir, 'transcripts')
+
+
+def regex_extent(pattern: str) -> Optional[Tuple[int, int, int]]:
+    """Bound how far a match of pattern can reach.
+
+    Args:
+        pattern: Regex pattern (interpreted with re.IGNORECASE)
+
+    Returns:
+        (maximum match width, lookahead reach, lookbehind reach) in
+        characters, or None if the pattern does not parse
+    """
+    try:
+        parsed = sre_parse.parse(pattern, re.IGNORECASE)
+        width = parsed.getwidth()[1]
+    except (re.error, RecursionError, OverflowError):
+        return None
+
+    ahead = behind = 0
+    stack = [parsed]
+    while stack:
+        for op, av in stack.pop():
+            if op is sre_constants.ASSERT or op is sre_constants.ASSERT_NOT:
+                direction, sub = av
+                if direction == 1:
+                    ahead += sub.getwidth()[1]
+                else:
+                    behind += sub.getwidth()[1]
+                stack.append(sub)
+            elif op is sre_constants.SUBPATTERN:
+                stack.append(av[-1])
+            elif op is sre_constants.BRANCH:
+                stack.extend(av[1])
+            elif op in _REPEATS:
+                stack.append(av[2])
+            elif op is _ATOMIC_GROUP:
+                stack.append(av)
+            elif op is sre_constants.GROUPREF_EXISTS:
+                stack.extend(sub for sub in av[1:] if sub is not None)
+
+    return width, ahead, behind
+
+
+class _Check:
+    """A condition on the transcript that can be evaluated incrementally.
+
+    Attributes:
+        key: State key shared by conditions with the same test
+        regex: Compiled pattern for regex_match, else None
+        literal: Substring for contains/not_contains, else None
+        overlap: Characters before new content that must be rescanned
+        margin: Characters a match must end before the text end to be final
+    """
+
+    __slots__ = ('key', 'regex', 'literal', 'overlap', 'margin')
+
+    def __init__(self, key: str, regex: Optional[re.Pattern] = None,
+                 literal: Optional[str] = None, overlap: int = 0, margin: int = 0):
+        self.key = key
+        self.regex = regex
+        self.literal = literal
+        self.overlap = overlap
+        self.margin = margin
+
+    def search(self, buffer: str, pos: int) -> Optional[int]:
+        """Return the end of the first match at or after pos, or None."""
+        if self.regex is not None:
+            match = self.regex.search(buffer, pos)
+            return match.end() if match else None
+        index = buffer.find(self.literal, pos)
+        return index + len(self.literal) if index >= 0 else None
+
+
+def _build_check(condition: Condition) -> Optional[_Check]:
+    """Create a scan check for a search-type condition, or None."""
+    operator = condition.operator
+    pattern = condition.pattern
+
+    if operator == 'regex_match':
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            # Left to the engine, which reports the invalid pattern
+            return None
+        extent = regex_extent(pattern)
+        if extent is None:
+            return None
+        width, ahead, behind = extent
+        # +2: one character of context for \b, one for $ before a final newline
+        overlap = width + ahead + behind + 2
+        if overlap > MAX_OVERLAP:
+            # A boundary-spanning match might not fit in the overlap
+            return None
+        return _Check(f're:{pattern}', regex=regex, overlap=overlap, margin=ahead + 2)
+
+    if operator in ('contains', 'not_contains') and len(pattern) <= MAX_OVERLAP:
+        return _Check(f'in:{pattern}', literal=pattern, overlap=len(pattern))
+
+    return None
+
+
+class _TranscriptState:
+    """Scan progress for one transcript file."""
+
+    def __init__(self, ident: Tuple[int, int], encoding: str):
+        self.ident = ident
+        self.encoding = encoding
+        # Scanned content ends at a newline: byte offset and character count
+        self.offset = 0
+        self.chars = 0
+        self.anchor = ''
+        self.head = ''
+        self.tail = ''
+        # Keys known to match (final), and keys scanned up to offset without a final match
+        self.hits: Set[str] = set()
+        self.scanned: Set[str] = set()
+        self.dirty = True
+
+    def to_dict(self) -> Dict:
+        return {
+            'version': STATE_VERSION,
+            'ident': list(self.ident),
+            'encoding': self.encoding,
+            'offset': self.offset,
+            'chars': self.chars,
+            'anchor': self.anchor,
+            'head': self.head,
+            'tail': self.tail,
+            'hits': sorted(self.hits),
+            'scanned': sorted(self.scanned),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional['_TranscriptState']:
+        if not isinstance(data, dict) or data.get('version') != STATE_VERSION:
+            return None
+        try:
+            state = cls(tuple(data['ident']), data['encoding'])
+            state.offset = int(data['offset'])
+            state.chars = int(data['chars'])
+            state.anchor = data['anchor']
+            state.head = data['head']
+            state.tail = data['tail']
+            state.hits = set(data['hits'])
+            state.scanned = set(data['scanned'])
+        except (KeyError, TypeError, ValueError):
+            return None
+        state.dirty = False
+        return state
+
+
+class _Pass:
+    """Result of scanning from one offset to the current end of the file."""
+
+    def __init__(self):
+        self.found: Set[str] = set()
+        self.final: Set[str] = set()
+        self.commit_offset = 0
+        self.commit_chars = 0
+        self.commit_tail = ''
+        self.head = ''
+        self.tail = ''
+
+
+class TranscriptScanner:
+    """Evaluates transcript conditions, scanning only appended content."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """Initialize scanner.
+
+        Args:
+            cache_dir: Directory for persisted state (default: get_cache_dir())
+        """
+        self._cache_dir = cache_dir if cache_dir is not None else get_cache_dir()
+        self._states: Dict[str, _TranscriptState] = {}
+
+    def evaluate(self, path: str,
+                 conditions: Iterable[Condition]) -> Optional[Dict[Tuple[str, str], bool]]:
+        """Evaluate the conditions that can be answered incrementally.
+
+        Args:
+            path: Transcript file path
+            conditions: Conditions on the transcript field
+
+        Returns:
+            Dict mapping (operator, pattern) to the result for every condition
+            that was evaluated, or None if the file could not be read
+            incrementally (caller falls back to reading it whole)
+        """
+        checks: Dict[str, _Check] = {}
+        wanted: List[Tuple[Condition, Optional[str]]] = []
+        for condition in conditions:
+            if condition.operator in ('starts_with', 'ends_with'):
+                if len(condition.pattern) <= HEAD_CHARS:
+                    wanted.append((condition, None))
+                continue
+            check = _build_check(condition)
+            if check is not None:
+                checks.setdefault(check.key, check)
+                wanted.append((condition, check.key))
+
+        if not wanted:
+            return {}
+
+        encoding = locale.getpreferredencoding(False)
+        try:
+            # Newlines must be single 0x0A bytes to cut the file at line ends
+            if '\n'.encode(encoding) != b'\n':
+                return None
+            with open(path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                state = self._get_state(path, f, st, encoding)
+                found, head, tail = self._scan(f, st.st_size, state, checks)
+        except (OSError, UnicodeDecodeError, LookupError):
+            return None
+
+        if state.dirty:
+            self._save_state(path, state)
+
+        results = {}
+        for condition, key in wanted:
+            operator = condition.operator
+            pattern = condition.pattern
+            if operator == 'starts_with':
+                results[(operator, pattern)] = head.startswith(pattern)
+            elif operator == 'ends_with':
+                results[(operator, pattern)] = tail.endswith(pattern)
+            else:
+                matched = key in found
+                if operator == 'not_contains':
+                    matched = not matched
+                results[(operator, pattern)] = matched
+        return results
+
+    def _scan(self, f, size: int, state: _TranscriptState,
+              checks: Dict[str, _Check]) -> Tuple[Set[str], str, str]:
+        """Bring state up to date and search for every pending check.
+
+        Returns:
+            (keys matching now, text head, text tail)
+        """
+        found = {key for key in checks if key in state.hits}
+        pending = [check for key, check in checks.items() if key not in state.hits]
+        warm = [check for check in pending if check.key in state.scanned or state.offset == 0]
+        cold = [check for check in pending if check not in warm]
+
+        # New content since the last scan; context is the tail already scanned
+        base = state.chars - len(state.tail)
+        result = self._pass(f, state.encoding, state.offset, size, state.tail, base, warm)
+
+        if cold:
+            # Conditions added since the last scan start from the beginning
+            result_cold = self._pass(f, state.encoding, 0, size, '', 0, cold)
+            result.found |= result_cold.found
+            result.final |= result_cold.final
+
+        found |= result.found
+        head = result.head if base == 0 else state.head
+
+        if result.commit_offset != state.offset:
+            state.offset = result.commit_offset
+            state.chars = result.commit_chars
+            state.tail = result.commit_tail
+            if len(state.head) < HEAD_CHARS:
+                state.head = head[:min(HEAD_CHARS, state.chars)]
+            f.seek(max(state.offset - ANCHOR_BYTES, 0))
+            state.anchor = f.read(min(state.offset, ANCHOR_BYTES)).hex()
+            state.dirty = True
+
+        # Only keys searched in this scan are up to date with the new offset
+        scanned = {check.key for check in pending} - result.final
+        if result.final or scanned != state.scanned:
+            state.hits |= result.final
+            state.scanned = scanned
+            state.dirty = True
+
+        return found, head, result.tail
+
+    def _pass(self, f, encoding: str, start: int, size: int, context: str,
+              base: int, checks: List[_Check]) -> _Pass:
+        """Decode and search the file from start to size.
+
+        Args:
+            f: Transcript opened in binary mode
+            encoding: Text encoding of the transcript
+            start: Byte offset to start at (just after a newline, or 0)
+            size: File size to scan up to
+            context: Text immediately before start, kept for overlap
+            base: Character index of context[0] in the whole transcript
+            checks: Checks to search for
+
+        Returns:
+            _Pass with matches and the new committed position
+        """
+        result = _Pass()
+        result.commit_offset = start
+        result.commit_chars = base + len(context)
+        result.commit_tail = context
+
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(), translate=True
+        )
+        pending = list(checks)
+        match_ends: Dict[str, int] = {}
+        f.seek(start)
+        position = start
+
+        while True:
+            data = f.read(min(CHUNK_BYTES, size - position)) if position < size else b''
+            position += len(data)
+            final = position >= size or not data
+
+            # Split at the last newline so the committed part ends on a line boundary
+            newline = data.rfind(b'\n')
+            committed = decoder.decode(data[:newline + 1]) if newline >= 0 else ''
+            rest = decoder.decode(data[newline + 1:], final=final)
+
+            buffer = context + committed + rest
+            commit_index = len(context) + len(committed)
+            if newline >= 0:
+                result.commit_offset = position - len(data) + newline + 1
+                result.commit_chars = base + commit_index
+                result.commit_tail = buffer[:commit_index][-_KEEP_CHARS:]
+            if base == 0 and len(result.head) < HEAD_CHARS:
+                result.head = buffer[:HEAD_CHARS]
+
+            new_start = len(context)
+            floor = 0 if base == 0 else 1
+            for check in list(pending):
+                end = check.search(buffer, max(new_start - check.overlap, floor))
+                if end is None:
+                    continue
+                # A match too close to the end may depend on text not read yet
+                if final or end + check.margin <= len(buffer):
+                    result.found.add(check.key)
+                    pending.remove(check)
+                    match_ends[check.key] = base + end
+
+            if final:
+                # Matches inside the committed text cannot change as the file grows
+                result.final = {
+                    check.key for check in checks
+                    if check.key in match_ends
+                    and match_ends[check.key] + check.margin <= result.commit_chars
+                }
+                result.tail = buffer[-_KEEP_CHARS:]
+                return result
+
+            base += max(len(buffer) - _KEEP_CHARS, 0)
+            context = buffer[-_KEEP_CHARS:]
+
+    def _get_state(self, path: str, f, st: os.stat_result,
+                   encoding: str) -> _TranscriptState:
+        """Return the saved state for path if it still describes the file."""
+        ident = (st.st_dev, st.st_ino)
+        state = self._states.get(path)
+        if state is None:
+            state = self._load_state(path)
+
+        if (state is None or state.ident != ident or state.encoding != encoding
+                or st.st_size < state.offset):
+            state = None
+        elif state.offset:
+            anchor_len = min(state.offset, ANCHOR_BYTES)
+            f.seek(state.offset - anchor_len)
+            if f.read(anchor_len).hex() != state.anchor:
+                state = None
+
+        if state is None:
+            state = _TranscriptState(ident, encoding)
+        self._states[path] = state
+        return state
+
+    def _state_file(self, path: str) -> Optional[str]:
+        if not self._cache_dir:
+            return None
+        digest = hashlib.sha256(os.path.abspath(path).encode('utf-8', 'surrogateescape'))
+        return os.path.join(self._cache_dir, digest.hexdigest()[:32] + '.json')
+
+    def _load_state(self, path: str) -> Optional[_TranscriptState]:
+        state_file = self._state_file(path)
+        if not state_file:
+            return None
+        try:
+            fd = os.open(state_file, os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+            with os.fdopen(fd, 'r', encoding='utf-8') as f:
+                # Planted state could mark conditions as matched or skip content
+                if os.fstat(f.fileno()).st_uid != os.getuid():
+                    return None
+                return _TranscriptState.from_dict(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def _save_state(self, path: str, state: _TranscriptState):
+        """Persist state atomically; failures only cost a rescan next time."""
+        state.dirty = False
+        state_file = self._state_file(path)
+        if not state_file:
+            return
+        try:
+            os.makedirs(self._cache_dir, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(state.to_dict(), f)
+                os.replace(tmp_path, state_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
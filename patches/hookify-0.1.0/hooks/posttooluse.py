@@ -19,8 +19,8 @@ if PLUGIN_ROOT not in sys.path:
     sys.path.insert(0, PLUGIN_ROOT)
 
 try:
-    from core.config_loader import load_rules
-    from core.rule_engine import RuleEngine
+    # Thin client: rule engine is only imported if no hookify server is running
+    from core.client import evaluate
 except ImportError as e:
     error_msg = {"systemMessage": f"Hookify import error: {e}"}
     print(json.dumps(error_msg), file=sys.stdout)
@@ -41,12 +41,8 @@ def main():
         elif tool_name in ['Edit', 'Write', 'MultiEdit']:
             event = 'file'
 
-        # Load rules
-        rules = load_rules(event=event)
-
-        # Evaluate rules
-        engine = RuleEngine()
-        result = engine.evaluate_rules(rules, input_data)
+        # Evaluate rules (on the hookify server if running, else in-process)
+        result = evaluate(event, input_data)
 
         # Always output JSON (even if empty)
         print(json.dumps(result), file=sys.stdout)
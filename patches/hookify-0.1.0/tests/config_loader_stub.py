@@ -0,0 +1,141 @@
+"""
+Minimal stand-in for hookify's core/config_loader.py.
+
+The patch only ships the modules it adds; config_loader comes from the
+installed plugin. conftest.py registers this module as core.config_loader
+when the real one is not importable, so the tests also run in-repo. It
+mirrors the upstream Rule/Condition dataclasses and the frontmatter subset
+the tests write (flat key: value pairs and simple condition lists).
+"""
+
+import glob
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class Condition:
+    """A single condition for matching."""
+    field: str
+    operator: str
+    pattern: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Condition':
+        return cls(
+            field=data.get('field', ''),
+            operator=data.get('operator', 'regex_match'),
+            pattern=data.get('pattern', ''),
+        )
+
+
+@dataclass
+class Rule:
+    """A hookify rule."""
+    name: str
+    enabled: bool
+    event: str
+    pattern: Optional[str] = None
+    conditions: List[Condition] = field(default_factory=list)
+    action: str = 'warn'
+    tool_matcher: Optional[str] = None
+    message: str = ''
+
+    @classmethod
+    def from_dict(cls, frontmatter: Dict[str, Any], message: str) -> 'Rule':
+        conditions = [Condition.from_dict(c) for c in frontmatter.get('conditions') or []]
+        pattern = frontmatter.get('pattern')
+        event = frontmatter.get('event', 'all')
+        if pattern and not conditions:
+            if event == 'bash':
+                field_name = 'command'
+            elif event == 'file':
+                field_name = 'new_text'
+            else:
+                field_name = 'content'
+            conditions = [Condition(field=field_name, operator='regex_match', pattern=pattern)]
+        return cls(
+            name=frontmatter.get('name', 'unnamed'),
+            enabled=frontmatter.get('enabled', True),
+            event=event,
+            pattern=pattern,
+            conditions=conditions,
+            action=frontmatter.get('action', 'warn'),
+            tool_matcher=frontmatter.get('tool_matcher'),
+            message=message.strip(),
+        )
+
+
+def extract_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
+    """Split a rule file into frontmatter values and the message body."""
+    if not content.startswith('---'):
+        return {}, content
+    parts = content.split('---', 2)
+    if len(parts) < 3:
+        return {}, content
+
+    frontmatter: Dict[str, Any] = {}
+    current_list = None
+    for line in parts[1].split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith('- ') and current_list is not None:
+            key, value = stripped[2:].split(':', 1)
+            frontmatter[current_list].append({key.strip(): value.strip().strip('"\'')})
+            continue
+        if line.startswith(' ') and current_list is not None and frontmatter[current_list]:
+            key, value = stripped.split(':', 1)
+            frontmatter[current_list][-1][key.strip()] = value.strip().strip('"\'')
+            continue
+        key, value = line.split(':', 1)
+        key = key.strip()
+        value = value.strip()
+        if not value:
+            frontmatter[key] = []
+            current_list = key
+            continue
+        current_list = None
+        value = value.strip('"\'')
+        if value.lower() in ('true', 'false'):
+            value = value.lower() == 'true'
+        frontmatter[key] = value
+    return frontmatter, parts[2]
+
+
+def load_rules(event: Optional[str] = None) -> List[Rule]:
+    """Load enabled rules for an event from .claude/hookify.*.local.md."""
+    rules = []
+    for file_path in glob.glob(os.path.join('.claude', 'hookify.*.local.md')):
+        try:
+            rule = load_rule_file(file_path)
+            if not rule:
+                continue
+            if event and rule.event != 'all' and rule.event != event:
+                continue
+            if rule.enabled:
+                rules.append(rule)
+        except (IOError, OSError, PermissionError) as e:
+            print(f"Warning: Failed to read {file_path}: {e}", file=sys.stderr)
+            continue
+        except (ValueError, KeyError, AttributeError, TypeError) as e:
+            print(f"Warning: Failed to parse {file_path}: {e}", file=sys.stderr)
+            continue
+        except Exception as e:
+            print(f"Warning: Unexpected error loading {file_path} ({type(e).__name__}): {e}",
+                  file=sys.stderr)
+            continue
+    return rules
+
+
+def load_rule_file(file_path: str) -> Optional[Rule]:
+    """Parse one rule file, or return None if it has no frontmatter."""
+    with open(file_path, 'r') as f:
+        content = f.read()
+    frontmatter, message = extract_frontmatter(content)
+    if not frontmatter:
+        print(f"Warning: {file_path} missing YAML frontmatter", file=sys.stderr)
+        return None
+    return Rule.from_dict(frontmatter, message)
@@ -0,0 +1,23 @@
+"""
+Shared test setup: make core/ importable and provide core.config_loader.
+
+core/config_loader.py belongs to the installed plugin, not this patch. When
+it cannot be imported (running from the repository), the minimal stand-in in
+config_loader_stub.py is registered in its place.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent
+if str(PLUGIN_ROOT) not in sys.path:
+    sys.path.insert(0, str(PLUGIN_ROOT))
+
+if importlib.util.find_spec("core.config_loader") is None:
+    spec = importlib.util.spec_from_file_location(
+        "core.config_loader", Path(__file__).parent / "config_loader_stub.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["core.config_loader"] = module
+    spec.loader.exec_module(module)
@@ -0,0 +1,155 @@
+"""
+Tests for core/client.py
+
+Run with: pytest tests/test_client.py -v
+(uses the plugin's core/config_loader.py if installed, else the stand-in in
+tests/config_loader_stub.py; see conftest.py)
+"""
+
+import os
+import socket
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add plugin root to path to import core/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import client
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+BASH_INPUT = {
+    "hook_event_name": "PreToolUse",
+    "tool_name": "Bash",
+    "tool_input": {"command": "ls"},
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_environment(tmp_path, monkeypatch):
+    """Run without a configured socket, metrics or daemon switch."""
+    for name in (client.SOCKET_ENV, client.DISABLE_ENV, "HOOKIFY_METRICS"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def listening_socket(tmp_path):
+    """A socket in tmp_path that answers one request with {"answered": true}."""
+    path = str(tmp_path / "server.sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen(1)
+
+    def answer():
+        conn, _ = listener.accept()
+        with conn:
+            if conn.makefile("rb").readline():
+                conn.sendall(b'{"answered": true}\n')
+
+    thread = threading.Thread(target=answer, daemon=True)
+    thread.start()
+    yield path
+    # Release the accept() if the test never connected
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+    thread.join()
+    listener.close()
+
+
+@pytest.fixture
+def local_calls(monkeypatch):
+    """Record fallbacks to in-process evaluation."""
+    calls = []
+
+    def local(event, input_data, measure=None):
+        calls.append(event)
+        return {"local": True}
+
+    monkeypatch.setattr(client, "evaluate_local", local)
+    return calls
+
+
+class TestRuntimeDir:
+    """The socket and scan state only live in a private per-user directory."""
+
+    def test_created_private(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        path = client.get_runtime_dir()
+
+        assert path == str(tmp_path / f"hookify-{os.getuid()}")
+        assert os.stat(path).st_mode & 0o777 == 0o700
+        assert client.get_socket_path() == os.path.join(path, "server.sock")
+
+    def test_non_private_dir_refused(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        shared = tmp_path / f"hookify-{os.getuid()}"
+        shared.mkdir(mode=0o755)
+        shared.chmod(0o755)
+
+        assert client.get_runtime_dir() is None
+        assert client.get_socket_path() is None
+
+    def test_symlinked_dir_refused(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        target = tmp_path / "elsewhere"
+        target.mkdir(mode=0o700)
+        (tmp_path / f"hookify-{os.getuid()}").symlink_to(target)
+
+        assert client.get_runtime_dir() is None
+
+    def test_socket_env_overrides(self, monkeypatch):
+        monkeypatch.setenv(client.SOCKET_ENV, "/run/custom.sock")
+        assert client.get_socket_path() == "/run/custom.sock"
+
+
+class TestUntrustedSocket:
+    """Sockets that another user could control are never connected to."""
+
+    def test_socket_owned_by_someone_else(self, listening_socket, monkeypatch):
+        monkeypatch.setattr(client.os, "getuid", lambda: os.geteuid() + 1)
+        monkeypatch.setattr(client, "_peer_is_current_user", lambda sock: True)
+        assert client.evaluate_remote("bash", BASH_INPUT, socket_path=listening_socket) is None
+
+    def test_peer_run_by_someone_else(self, listening_socket, monkeypatch):
+        monkeypatch.setattr(client, "_peer_is_current_user", lambda sock: False)
+        assert client.evaluate_remote("bash", BASH_INPUT, socket_path=listening_socket) is None
+
+    def test_regular_file_is_not_a_socket(self, tmp_path):
+        path = tmp_path / "server.sock"
+        path.write_text("")
+        assert client.evaluate_remote("bash", BASH_INPUT, socket_path=str(path)) is None
+
+    def test_own_socket_used(self, listening_socket):
+        response = client.evaluate_remote("bash", BASH_INPUT, socket_path=listening_socket)
+        assert response == {"answered": True}
+
+
+class TestFallback:
+    """Without a usable server, rules are evaluated in-process."""
+
+    def test_nothing_listening(self, tmp_path, monkeypatch, local_calls):
+        path = str(tmp_path / "server.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+        monkeypatch.setenv(client.SOCKET_ENV, path)
+
+        assert client.evaluate("bash", BASH_INPUT) == {"local": True}
+        assert local_calls == ["bash"]
+
+    def test_no_socket_file(self, tmp_path, monkeypatch, local_calls):
+        monkeypatch.setenv(client.SOCKET_ENV, str(tmp_path / "missing.sock"))
+
+        assert client.evaluate("bash", BASH_INPUT) == {"local": True}
+        assert local_calls == ["bash"]
+
+    def test_disabled_by_environment(self, listening_socket, monkeypatch, local_calls):
+        monkeypatch.setenv(client.SOCKET_ENV, listening_socket)
+        monkeypatch.setenv(client.DISABLE_ENV, "1")
+
+        assert client.evaluate("bash", BASH_INPUT) == {"local": True}
+        assert local_calls == ["bash"]
@@ -0,0 +1,137 @@
+"""
+Tests for core/regex_guard.py
+
+Run with: pytest tests/test_regex_guard.py -v
+"""
+
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add plugin root to path to import core/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import regex_guard
+from core.regex_guard import GuardedRegex, RegexGuard, RegexSkipped, compile_guarded
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(signal, "setitimer"), reason="SIGALRM timers not available"
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_alarm():
+    """Leave SIGALRM, its timer and the guard's module state as they were."""
+    handler = signal.getsignal(signal.SIGALRM)
+    previous = regex_guard._previous_handler
+    yield
+    signal.setitimer(signal.ITIMER_REAL, 0)
+    signal.signal(signal.SIGALRM, handler)
+    regex_guard._previous_handler = previous
+    regex_guard._deadline_armed = False
+
+
+def backtracking(pattern):
+    """A risky pattern forced onto the backtracking engine even if re2 is installed."""
+    guarded = GuardedRegex(pattern)
+    guarded.linear = None
+    return guarded
+
+
+class TestSizeCap:
+    """Fields over the size cap are not searched."""
+
+    def test_over_cap_raises(self):
+        guard = RegexGuard(max_input=10, timeout=0)
+        with pytest.raises(RegexSkipped, match="11 characters"):
+            guard.search(compile_guarded("a"), "a" * 11)
+
+    def test_at_cap_is_searched(self):
+        guard = RegexGuard(max_input=10, timeout=0)
+        assert guard.search(compile_guarded("a"), "a" * 10)
+
+    def test_zero_disables_cap(self):
+        guard = RegexGuard(max_input=0, timeout=0)
+        assert guard.search(compile_guarded("b"), "a" * 100 + "b")
+
+
+class TestTimeout:
+    """Runaway searches are interrupted within the budget."""
+
+    def test_catastrophic_pattern_interrupted(self):
+        guarded = backtracking(r"(a+)+$")
+        assert guarded.risk == "nested quantifiers"
+        guard = RegexGuard(max_input=0, timeout=0.1)
+
+        start = time.monotonic()
+        with pytest.raises(RegexSkipped, match="timed out after 0.1s .*nested quantifiers"):
+            guard.search(guarded, "a" * 40 + "b")
+        assert time.monotonic() - start < 2
+
+    def test_fast_search_unaffected(self):
+        guard = RegexGuard(max_input=0, timeout=0.1)
+        assert guard.search(compile_guarded(r"rm\s+-rf"), "sudo rm  -rf /")
+        assert not guard.search(compile_guarded(r"rm\s+-rf"), "ls")
+
+
+class TestSignalState:
+    """The guard leaves other users of SIGALRM undisturbed."""
+
+    def test_timer_disarmed_after_search(self):
+        guard = RegexGuard(max_input=0, timeout=5)
+        guard.search(compile_guarded("x"), "xyz")
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+        with pytest.raises(RegexSkipped):
+            RegexGuard(max_input=0, timeout=0.05).search(
+                backtracking(r"(a+)+$"), "a" * 40 + "b"
+            )
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+    def test_previous_handler_restored_and_called(self):
+        calls = []
+
+        def handler(signum, frame):
+            calls.append(signum)
+
+        signal.signal(signal.SIGALRM, handler)
+        RegexGuard(max_input=0, timeout=5).search(compile_guarded("x"), "x")
+
+        # An alarm outside a search goes to the original handler, which is put back
+        signal.setitimer(signal.ITIMER_REAL, 0.01)
+        deadline = time.monotonic() + 2
+        while not calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert calls == [signal.SIGALRM]
+        assert signal.getsignal(signal.SIGALRM) is handler
+
+    def test_running_timer_left_alone(self, monkeypatch):
+        def fail(*args):
+            raise AssertionError("guarded search armed the timer")
+
+        monkeypatch.setattr(RegexGuard, "_search_with_deadline", fail)
+        signal.signal(signal.SIGALRM, lambda signum, frame: None)
+        signal.setitimer(signal.ITIMER_REAL, 100)
+
+        assert RegexGuard(max_input=0, timeout=1).search(compile_guarded("x"), "x")
+        assert signal.getitimer(signal.ITIMER_REAL)[0] > 90
+
+    def test_unguarded_off_main_thread(self, monkeypatch):
+        def fail(*args):
+            raise AssertionError("guarded search armed the timer")
+
+        monkeypatch.setattr(RegexGuard, "_search_with_deadline", fail)
+        results = []
+
+        def worker():
+            guard = RegexGuard(max_input=0, timeout=1)
+            results.append(guard.search(compile_guarded("b"), "ab"))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert results == [True]
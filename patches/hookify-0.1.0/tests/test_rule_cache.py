@@ -0,0 +1,196 @@
+"""
+Tests for core/rule_cache.py
+
+Run with: pytest tests/test_rule_cache.py -v
+(uses the plugin's core/config_loader.py if installed, else the stand-in in
+tests/config_loader_stub.py; see conftest.py)
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add plugin root to path to import core/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import rule_cache
+from core.rule_cache import CACHE_FILE, load_rules
+
+
+def write_rule(name, event="bash", pattern="rm -rf", enabled=True, age=60):
+    """Write a rule file and backdate it so the cache may be written."""
+    path = Path(".claude") / f"hookify.{name}.local.md"
+    path.write_text(
+        "---\n"
+        f"name: {name}\n"
+        f"enabled: {str(enabled).lower()}\n"
+        f"event: {event}\n"
+        f"pattern: {pattern}\n"
+        "---\n"
+        f"Message for {name}\n"
+    )
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Empty project directory with a .claude folder as the working directory."""
+    (tmp_path / ".claude").mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(rule_cache.DISABLE_ENV, raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    """Count calls to the markdown rule parser."""
+    calls = []
+    original = rule_cache.load_rule_file
+
+    def counting(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(rule_cache, "load_rule_file", counting)
+    return calls
+
+
+def names(rules):
+    return sorted(rule.name for rule in rules)
+
+
+class TestWarmRuns:
+    """Cache hits skip parsing."""
+
+    def test_cache_written_and_reused(self, project, parse_counter):
+        write_rule("one")
+        write_rule("two", pattern="sudo")
+
+        assert names(load_rules()) == ["one", "two"]
+        assert len(parse_counter) == 2
+        assert Path(CACHE_FILE).exists()
+
+        parse_counter.clear()
+        rules = load_rules()
+        assert names(rules) == ["one", "two"]
+        assert parse_counter == []
+        assert rules[0].conditions[0].pattern in ("rm -rf", "sudo")
+
+    def test_event_and_enabled_filters_apply_to_cached_rules(self, project, parse_counter):
+        write_rule("bash-rule", event="bash")
+        write_rule("file-rule", event="file")
+        write_rule("any-rule", event="all")
+        write_rule("off-rule", event="bash", enabled=False)
+
+        assert names(load_rules(event="bash")) == ["any-rule", "bash-rule"]
+        parse_counter.clear()
+        assert names(load_rules(event="file")) == ["any-rule", "file-rule"]
+        assert names(load_rules()) == ["any-rule", "bash-rule", "file-rule"]
+        assert parse_counter == []
+
+    def test_no_rule_files(self, project, parse_counter):
+        assert load_rules() == []
+        assert not Path(CACHE_FILE).exists()
+
+
+class TestInvalidation:
+    """Edits, additions and deletions of rule files invalidate the cache."""
+
+    def test_edit_invalidates(self, project, parse_counter):
+        path = write_rule("one", pattern="rm -rf")
+        load_rules()
+
+        write_rule("one", pattern="git push --force", age=30)
+        rules = load_rules()
+        assert rules[0].conditions[0].pattern == "git push --force"
+        assert parse_counter == [str(path)] * 2
+
+    def test_same_size_edit_with_new_mtime_invalidates(self, project, parse_counter):
+        write_rule("one", pattern="aaaa")
+        load_rules()
+
+        write_rule("one", pattern="bbbb", age=30)
+        assert load_rules()[0].conditions[0].pattern == "bbbb"
+
+    def test_addition_invalidates(self, project, parse_counter):
+        write_rule("one")
+        load_rules()
+
+        write_rule("two")
+        assert names(load_rules()) == ["one", "two"]
+        # Fresh cache after the re-parse is used again
+        parse_counter.clear()
+        assert names(load_rules()) == ["one", "two"]
+        assert parse_counter == []
+
+    def test_deletion_invalidates(self, project, parse_counter):
+        write_rule("one")
+        two = write_rule("two")
+        load_rules()
+
+        two.unlink()
+        assert names(load_rules()) == ["one"]
+
+    def test_deleting_all_rules(self, project, parse_counter):
+        path = write_rule("one")
+        load_rules()
+
+        path.unlink()
+        assert load_rules() == []
+
+
+class TestRobustness:
+    """Unsafe or unusable caches are never trusted."""
+
+    def test_recently_modified_files_not_cached(self, project, parse_counter):
+        write_rule("one", age=0)
+        load_rules()
+        assert not Path(CACHE_FILE).exists()
+
+    def test_corrupt_cache_is_ignored(self, project, parse_counter):
+        write_rule("one")
+        load_rules()
+        Path(CACHE_FILE).write_text("{not json")
+
+        assert names(load_rules()) == ["one"]
+        # Re-parsed and rewritten
+        assert json.loads(Path(CACHE_FILE).read_text())["version"] == rule_cache.CACHE_VERSION
+
+    def test_broken_rule_file_is_not_cached(self, project, parse_counter):
+        write_rule("one")
+        broken = Path(".claude") / "hookify.broken.local.md"
+        broken.write_text("no frontmatter here\n")
+        stamp = time.time() - 60
+        os.utime(broken, (stamp, stamp))
+
+        assert names(load_rules()) == ["one"]
+        assert not Path(CACHE_FILE).exists()
+
+    def test_rule_file_parse_error_is_skipped(self, project, monkeypatch, capsys):
+        write_rule("one")
+        write_rule("bad")
+        original = rule_cache.load_rule_file
+
+        def failing(path):
+            if "bad" in path:
+                raise ValueError("bad frontmatter")
+            return original(path)
+
+        monkeypatch.setattr(rule_cache, "load_rule_file", failing)
+
+        assert names(load_rules()) == ["one"]
+        assert "Failed to parse" in capsys.readouterr().err
+        assert not Path(CACHE_FILE).exists()
+
+    def test_disabled_by_environment(self, project, parse_counter, monkeypatch):
+        write_rule("one")
+        monkeypatch.setenv(rule_cache.DISABLE_ENV, "1")
+
+        assert names(load_rules()) == ["one"]
+        assert not Path(CACHE_FILE).exists()
@@ -0,0 +1,96 @@
+"""
+Tests for core/rule_engine.py
+
+Run with: pytest tests/test_rule_engine.py -v
+(uses the plugin's core/config_loader.py if installed, else the stand-in in
+tests/config_loader_stub.py; see conftest.py)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add plugin root to path to import core/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.config_loader import Condition, Rule
+from core.rule_engine import MULTIEDIT_MODE_ENV, RuleEngine
+
+
+def file_rule(name, *conditions, action="warn"):
+    """A file rule with (field, operator, pattern) conditions."""
+    return Rule(
+        name=name,
+        enabled=True,
+        event="file",
+        conditions=[Condition(field=f, operator=op, pattern=p) for f, op, p in conditions],
+        action=action,
+        message=f"Message for {name}",
+    )
+
+
+def multiedit(*new_strings, file_path="src/app.py"):
+    return {
+        "hook_event_name": "PreToolUse",
+        "tool_name": "MultiEdit",
+        "tool_input": {
+            "file_path": file_path,
+            "edits": [{"old_string": "x", "new_string": s} for s in new_strings],
+        },
+    }
+
+
+@pytest.fixture
+def per_edit_engine(monkeypatch):
+    monkeypatch.setenv(MULTIEDIT_MODE_ENV, "per-edit")
+    return RuleEngine()
+
+
+@pytest.fixture
+def joined_engine(monkeypatch):
+    monkeypatch.delenv(MULTIEDIT_MODE_ENV, raising=False)
+    return RuleEngine()
+
+
+class TestMultiEditPerEdit:
+    """HOOKIFY_MULTIEDIT=per-edit checks each edit on its own."""
+
+    def test_reports_index_of_matching_edit(self, per_edit_engine):
+        rule = file_rule("no-eval", ("new_text", "regex_match", r"eval\("))
+        input_data = multiedit("print(x)", "eval(user_input)", "return x")
+
+        assert per_edit_engine.matching_rules([rule], input_data) == [(rule, 1)]
+        response = per_edit_engine.evaluate_rules([rule], input_data)
+        assert response["systemMessage"] == "**[no-eval]** (edits[1])\nMessage for no-eval"
+
+    def test_conditions_must_hold_in_the_same_edit(self, per_edit_engine, joined_engine):
+        rule = file_rule(
+            "debug-print",
+            ("new_text", "contains", "print("),
+            ("new_text", "contains", "DEBUG"),
+        )
+        input_data = multiedit("print(x)", "DEBUG = True")
+
+        assert per_edit_engine.matching_rules([rule], input_data) == []
+        # Joined mode sees both strings in one text
+        assert joined_engine.matching_rules([rule], input_data) == [(rule, None)]
+
+    def test_non_edit_fields_still_checked(self, per_edit_engine):
+        rule = file_rule(
+            "tests-only",
+            ("file_path", "contains", "tests/"),
+            ("new_text", "contains", "sleep("),
+        )
+        input_data = multiedit("a = 1", "time.sleep(5)")
+
+        assert per_edit_engine.matching_rules([rule], input_data) == []
+        input_data["tool_input"]["file_path"] = "tests/test_app.py"
+        assert per_edit_engine.matching_rules([rule], input_data) == [(rule, 1)]
+
+    def test_blocking_match_denies(self, per_edit_engine):
+        rule = file_rule("no-secret", ("new_text", "contains", "API_KEY"), action="block")
+        response = per_edit_engine.evaluate_rules([rule], multiedit("ok", "API_KEY = 1"))
+
+        assert response["hookSpecificOutput"]["permissionDecision"] == "deny"
+        assert "(edits[1])" in response["systemMessage"]
@@ -0,0 +1,107 @@
+"""
+Tests for core/server.py
+
+Run with: pytest tests/test_server.py -v
+(uses the plugin's core/config_loader.py if installed, else the stand-in in
+tests/config_loader_stub.py; see conftest.py)
+"""
+
+import socket
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add plugin root to path to import core/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import client
+from core.server import HookifyServer
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+BASH_INPUT = {
+    "hook_event_name": "PreToolUse",
+    "tool_name": "Bash",
+    "tool_input": {"command": "rm -rf build"},
+}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project with one blocking bash rule as the working directory."""
+    (tmp_path / ".claude").mkdir()
+    (tmp_path / ".claude" / "hookify.no-rm.local.md").write_text(
+        "---\n"
+        "name: no-rm\n"
+        "enabled: true\n"
+        "event: bash\n"
+        "pattern: rm -rf\n"
+        "action: block\n"
+        "---\n"
+        "Do not delete recursively\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(client.DISABLE_ENV, raising=False)
+    monkeypatch.delenv("HOOKIFY_METRICS", raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Server on a socket in tmp_path, serving from a background thread."""
+    server = HookifyServer(str(tmp_path / "server.sock"), idle_timeout=0)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestRoundTrip:
+    """Requests sent by the client are evaluated by the server."""
+
+    def test_response_matches_local_evaluation(self, project, server):
+        remote = client.evaluate_remote("bash", BASH_INPUT, socket_path=server.socket_path)
+
+        assert remote == client.evaluate_local("bash", BASH_INPUT)
+        assert remote["hookSpecificOutput"]["permissionDecision"] == "deny"
+        assert "no-rm" in remote["systemMessage"]
+
+    def test_rules_kept_in_memory(self, project, server):
+        client.evaluate_remote("bash", BASH_INPUT, socket_path=server.socket_path)
+        client.evaluate_remote("bash", BASH_INPUT, socket_path=server.socket_path)
+        assert server.store.last_load == "memory"
+
+    def test_bad_request_answered_with_message(self, project, server):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(server.socket_path)
+            sock.sendall(b"not json\n")
+            reply = sock.makefile("rb").readline()
+        assert b"Hookify error" in reply
+
+    def test_socket_private_and_removed_on_close(self, tmp_path):
+        path = tmp_path / "server.sock"
+        server = HookifyServer(str(path), idle_timeout=0)
+        assert path.stat().st_mode & 0o077 == 0
+        server.server_close()
+        assert not path.exists()
+
+
+class TestStartup:
+    """A leftover socket is replaced, a live one is not."""
+
+    def test_stale_socket_replaced(self, tmp_path):
+        path = str(tmp_path / "server.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+
+        server = HookifyServer(path, idle_timeout=0)
+        server.server_close()
+
+    def test_refuses_while_another_server_listens(self, server):
+        with pytest.raises(RuntimeError, match="already running"):
+            HookifyServer(server.socket_path, idle_timeout=0)
@@ -0,0 +1,237 @@
+"""
+Tests for core/transcript.py
+
+Run with: pytest tests/test_transcript.py -v
+(uses the plugin's core/config_loader.py if installed, else the stand-in in
+tests/config_loader_stub.py; see conftest.py)
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add plugin root to path to import core/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import transcript
+from core.config_loader import Condition
+from core.transcript import TranscriptScanner
+
+
+def conditions(*specs):
+    """Build transcript conditions from (operator, pattern) pairs."""
+    return [Condition(field="transcript", operator=op, pattern=p) for op, p in specs]
+
+
+def full_read(text, conds):
+    """What the engine computes when it reads the whole transcript."""
+    results = {}
+    for cond in conds:
+        if cond.operator == "regex_match":
+            matched = re.search(cond.pattern, text, re.IGNORECASE) is not None
+        elif cond.operator == "contains":
+            matched = cond.pattern in text
+        else:
+            matched = cond.pattern not in text
+        results[(cond.operator, cond.pattern)] = matched
+    return results
+
+
+@pytest.fixture
+def transcript_file(tmp_path):
+    return tmp_path / "transcript.jsonl"
+
+
+@pytest.fixture
+def scanner():
+    """Scanner keeping its state in memory only."""
+    return TranscriptScanner(cache_dir="")
+
+
+@pytest.fixture
+def pass_starts(monkeypatch):
+    """Record the byte offset every scan pass starts at."""
+    starts = []
+    original = TranscriptScanner._pass
+
+    def recording(self, f, encoding, start, *args):
+        starts.append(start)
+        return original(self, f, encoding, start, *args)
+
+    monkeypatch.setattr(TranscriptScanner, "_pass", recording)
+    return starts
+
+
+def append(path, text):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+class TestAppends:
+    """Stop events after appends only scan the new content."""
+
+    def test_results_follow_appends(self, transcript_file, scanner, pass_starts):
+        conds = conditions(
+            ("regex_match", r"rm\s{1,4}-rf"),
+            ("contains", "DONE"),
+            ("not_contains", "error"),
+        )
+        text = ""
+        for line in ['{"text": "start"}\n', '{"text": "rm  -rf build"}\n',
+                     '{"text": "an error"}\n', '{"text": "DONE"}\n']:
+            text += line
+            append(transcript_file, line)
+            before = len(text.encode()) - len(line.encode())
+
+            assert scanner.evaluate(str(transcript_file), conds) == full_read(text, conds)
+            assert pass_starts[-1] == before
+
+    def test_condition_added_later_scans_from_start(self, transcript_file, scanner):
+        append(transcript_file, "deploy to prod\n")
+        scanner.evaluate(str(transcript_file), conditions(("contains", "prod")))
+        append(transcript_file, "later\n")
+
+        conds = conditions(("contains", "prod"), ("regex_match", r"deploy\s{1,4}to"))
+        assert scanner.evaluate(str(transcript_file), conds) == {
+            ("contains", "prod"): True,
+            ("regex_match", r"deploy\s{1,4}to"): True,
+        }
+
+    def test_missing_file_returns_none(self, tmp_path, scanner):
+        conds = conditions(("contains", "x"))
+        assert scanner.evaluate(str(tmp_path / "missing.jsonl"), conds) is None
+
+    def test_unbounded_pattern_left_to_caller(self, transcript_file, scanner):
+        append(transcript_file, "abc\n")
+        conds = conditions(("regex_match", "a.*c"), ("contains", "b"))
+        assert scanner.evaluate(str(transcript_file), conds) == {("contains", "b"): True}
+
+
+class TestBoundaries:
+    """Matches spanning chunk and Stop boundaries are found exactly once."""
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        # Tiny chunks and overlap so every boundary falls inside the test text
+        monkeypatch.setattr(transcript, "CHUNK_BYTES", 8)
+        monkeypatch.setattr(transcript, "MAX_OVERLAP", 16)
+        monkeypatch.setattr(transcript, "_KEEP_CHARS", 17)
+
+    def test_match_across_chunk_boundary(self, transcript_file, scanner):
+        # "secret token" straddles bytes 8..20 of the first chunk read
+        append(transcript_file, "xxxxxx secret token\nok\n")
+        conds = conditions(("regex_match", r"secret\s?token"), ("contains", "secret token"))
+        assert scanner.evaluate(str(transcript_file), conds) == {
+            ("regex_match", r"secret\s?token"): True,
+            ("contains", "secret token"): True,
+        }
+
+    @pytest.mark.parametrize("pattern", [
+        r"^start",
+        r"^line",
+        r"done$",
+        r"foo(?=bar)",
+        r"foo(?!bar)",
+        r"(?<=abc)def",
+        r"(?<!abc)def",
+        r"\bbar\b",
+    ])
+    def test_anchors_and_lookaround_match_full_read(self, transcript_file, scanner, pattern):
+        pieces = ["start x\n", "abc", "def\n", "line foo", "bar\n", "foo", " done", "\n",
+                  "xyzdef foo\n", "done"]
+        conds = conditions(("regex_match", pattern))
+        text = ""
+        for piece in pieces:
+            text += piece
+            append(transcript_file, piece)
+            assert scanner.evaluate(str(transcript_file), conds) == full_read(text, conds), text
+
+    def test_contains_across_stop_boundary(self, transcript_file, scanner):
+        conds = conditions(("contains", "force push"), ("not_contains", "force push"))
+        append(transcript_file, "about to force")
+        assert scanner.evaluate(str(transcript_file), conds) == {
+            ("contains", "force push"): False,
+            ("not_contains", "force push"): True,
+        }
+        append(transcript_file, " push\n")
+        assert scanner.evaluate(str(transcript_file), conds) == {
+            ("contains", "force push"): True,
+            ("not_contains", "force push"): False,
+        }
+
+
+class TestReset:
+    """Truncated, rewritten or replaced transcripts are scanned from scratch."""
+
+    conds = conditions(("contains", "danger"), ("not_contains", "danger"))
+
+    def test_truncated_file(self, transcript_file, scanner):
+        append(transcript_file, "safe\ndanger\n")
+        assert scanner.evaluate(str(transcript_file), self.conds)[("contains", "danger")]
+
+        transcript_file.write_text("safe\n")
+        assert scanner.evaluate(str(transcript_file), self.conds) == {
+            ("contains", "danger"): False,
+            ("not_contains", "danger"): True,
+        }
+
+    def test_rewritten_in_place(self, transcript_file, scanner):
+        append(transcript_file, "danger here\n")
+        assert scanner.evaluate(str(transcript_file), self.conds)[("contains", "danger")]
+
+        # Same inode, same size, new content, then an append
+        with open(transcript_file, "r+", encoding="utf-8") as f:
+            f.write("nothing now\n")
+        append(transcript_file, "more\n")
+        assert not scanner.evaluate(str(transcript_file), self.conds)[("contains", "danger")]
+
+    def test_replaced_file(self, transcript_file, tmp_path, scanner):
+        append(transcript_file, "danger\n")
+        assert scanner.evaluate(str(transcript_file), self.conds)[("contains", "danger")]
+
+        replacement = tmp_path / "new.jsonl"
+        replacement.write_text("all calm\nand longer than before\n")
+        os.replace(replacement, transcript_file)
+        assert not scanner.evaluate(str(transcript_file), self.conds)[("contains", "danger")]
+
+
+class TestPersistence:
+    """State written by one hook process is picked up by the next."""
+
+    def test_new_scanner_resumes_from_saved_offset(self, transcript_file, tmp_path, pass_starts):
+        cache_dir = str(tmp_path / "state")
+        conds = conditions(("regex_match", r"git\s{1,4}push"), ("contains", "sudo"))
+        append(transcript_file, "git  push origin\n")
+        first = TranscriptScanner(cache_dir=cache_dir).evaluate(str(transcript_file), conds)
+        assert first == {("regex_match", r"git\s{1,4}push"): True, ("contains", "sudo"): False}
+        size = transcript_file.stat().st_size
+
+        append(transcript_file, "sudo make install\n")
+        pass_starts.clear()
+        second = TranscriptScanner(cache_dir=cache_dir).evaluate(str(transcript_file), conds)
+        assert second == {("regex_match", r"git\s{1,4}push"): True, ("contains", "sudo"): True}
+        assert pass_starts == [size]
+
+    def test_corrupt_state_rescans(self, transcript_file, tmp_path, pass_starts):
+        cache_dir = tmp_path / "state"
+        conds = conditions(("contains", "x"))
+        append(transcript_file, "x\n")
+        TranscriptScanner(cache_dir=str(cache_dir)).evaluate(str(transcript_file), conds)
+        for state_file in cache_dir.glob("*.json"):
+            state_file.write_text("{broken")
+
+        pass_starts.clear()
+        result = TranscriptScanner(cache_dir=str(cache_dir)).evaluate(str(transcript_file), conds)
+        assert result == {("contains", "x"): True}
+        assert pass_starts == [0]
+
+    def test_disabled_persistence(self, transcript_file, tmp_path, monkeypatch):
+        monkeypatch.setenv(transcript.CACHE_ENV, "off")
+        assert transcript.get_cache_dir() is None
+
+        append(transcript_file, "x\n")
+        TranscriptScanner().evaluate(str(transcript_file), conditions(("contains", "x")))
+        assert not any(tmp_path.glob("**/*.json"))
@@ -7,25 +7,92 @@ Example usage:
 """
 
 import argparse
-import shutil
+import os
 import subprocess
 import sys
 import tempfile
+import xml.dom.minidom
+import xml.parsers.expat
 import defusedxml.minidom
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Parts that are already compressed; deflating them again only costs time
+STORED_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".tif",
+    ".tiff",
+    ".wdp",
+    ".jxr",
+    ".mp3",
+    ".m4a",
+    ".mp4",
+    ".m4v",
+    ".mov",
+    ".wmv",
+    ".wma",
+    ".avi",
+    ".zip",
+    ".docx",
+    ".docm",
+    ".xlsx",
+    ".xlsm",
+    ".pptx",
+    ".pptm",
+}
+
+
+def _minidom_escapes():
+    """Return the (text, attribute) escape tables of this Python's minidom.
+
+    Probed rather than hard-coded because minidom's escaping differs between
+    Python versions, and condensed output must match it exactly.
+    """
+    document = xml.dom.minidom.Document()
+    text_escapes = {}
+    attribute_escapes = {}
+    for char in '&<>"\r\n\t':
+        escaped = document.createTextNode(char).toxml()
+        if escaped != char:
+            text_escapes[ord(char)] = escaped
+        element = document.createElement("a")
+        element.setAttribute("b", char)
+        escaped = element.toxml()[len('<a b="') : -len('"/>')]
+        if escaped != char:
+            attribute_escapes[ord(char)] = escaped
+    return text_escapes, attribute_escapes
+
+
+# Escapes applied by minidom when it writes text and attribute values
+TEXT_ESCAPES, ATTRIBUTE_ESCAPES = _minidom_escapes()
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for condensing XML parts (0 = one per CPU, default: 1)",
+    )
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or greater")
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            jobs=args.jobs,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +109,19 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, jobs=1):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    XML parts are condensed in memory and written straight into the archive;
+    the input directory is not modified. Already-compressed media is stored
+    without deflating it again.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        jobs: Worker processes for condensing XML parts; 0 means one per CPU
+            (default: 1, condense in this process)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,28 +134,46 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+    files = [f for f in input_dir.rglob("*") if f.is_file()]
+    xml_files = [f for f in files if f.name.endswith((".xml", ".rels"))]
 
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
+    # Create final Office file as zip archive
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    executor = None
+    if (jobs == 0 or jobs > 1) and len(xml_files) > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs or os.cpu_count())
+    try:
+        if executor:
+            condensed = executor.map(_condense_file, xml_files, chunksize=4)
+        else:
+            condensed = map(_condense_file, xml_files)
 
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
         with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+            # Parts are written in the same order as before; condensed XML
+            # arrives in xml_files order
+            for f in files:
+                arcname = f.relative_to(input_dir)
+                if f.name.endswith((".xml", ".rels")):
+                    zinfo = zipfile.ZipInfo.from_file(f, arcname)
+                    zf.writestr(zinfo, next(condensed), zipfile.ZIP_DEFLATED)
+                elif f.suffix.lower() in STORED_EXTENSIONS:
+                    zf.write(f, arcname, zipfile.ZIP_STORED)
+                else:
+                    zf.write(f, arcname)
+    except BaseException:
+        # Parts are condensed while the archive is written; don't leave a
+        # partial archive behind when one of them fails
+        output_file.unlink(missing_ok=True)
+        raise
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
@@ -132,8 +223,131 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+    Path(xml_file).write_bytes(_condense_file(xml_file))
+
+
+def condense_xml_bytes(data):
+    """Strip unnecessary whitespace and remove comments from an XML part.
+
+    Streams the part through expat and serializes it as it is parsed. The
+    result is byte for byte what the minidom round-trip in
+    _condense_xml_with_minidom() produces: whitespace-only text and comments
+    are dropped inside elements (except in *:t elements), everything else is
+    written the way minidom's toxml(encoding="UTF-8") writes it.
+
+    Args:
+        data: Raw bytes of a UTF-8 XML part
+
+    Returns:
+        bytes: The condensed part
+    """
+    text = data.decode("utf-8")
+    out = ['<?xml version="1.0" encoding="UTF-8"?>']
+    # One [name, keep whitespace, start tag still open] entry per open element
+    stack = []
+    text_run = []
+    cdata_start = []
+    namespace_decls = []
+
+    def close_start_tag():
+        if stack and stack[-1][2]:
+            out.append(">")
+            stack[-1][2] = False
+
+    def flush_text():
+        # Contiguous character data is one minidom text node
+        if text_run:
+            run = "".join(text_run)
+            text_run.clear()
+            if stack[-1][1] or run.strip():
+                close_start_tag()
+                out.append(run.translate(TEXT_ESCAPES))
+
+    def start_element(name, attributes):
+        flush_text()
+        close_start_tag()
+        name = qualified_name(name)
+        # minidom puts namespace declarations before the other attributes
+        tag = ["<", name]
+        for prefix, uri in namespace_decls:
+            tag += [" xmlns:" + prefix if prefix else " xmlns", '="']
+            tag += [(uri or "").translate(ATTRIBUTE_ESCAPES), '"']
+        namespace_decls.clear()
+        for i in range(0, len(attributes), 2):
+            tag += [" ", qualified_name(attributes[i]), '="']
+            tag += [attributes[i + 1].translate(ATTRIBUTE_ESCAPES), '"']
+        out.append("".join(tag))
+        stack.append([name, name.endswith(":t"), True])
+
+    def end_element(name):
+        flush_text()
+        name, _, start_tag_open = stack.pop()
+        out.append("/>" if start_tag_open else f"</{name}>")
+
+    def start_cdata():
+        cdata_start.append(len(text_run))
+
+    def end_cdata():
+        # CDATA content arrives as character data and becomes its own node,
+        # kept as is; an empty section creates no node, so the text around it
+        # stays one text node
+        start = cdata_start.pop()
+        cdata = "".join(text_run[start:])
+        if cdata:
+            del text_run[start:]
+            flush_text()
+            close_start_tag()
+            out.append(f"<![CDATA[{cdata}]]>")
+
+    def comment(data):
+        flush_text()
+        # Comments are removed inside elements other than *:t, kept outside
+        # the root
+        if not stack or stack[-1][1]:
+            close_start_tag()
+            out.append(f"<!--{data}-->")
+
+    def processing_instruction(target, data):
+        flush_text()
+        close_start_tag()
+        out.append(f"<?{target} {data}?>")
+
+    def start_doctype(*args):
+        raise _DoctypeFound()
+
+    parser = xml.parsers.expat.ParserCreate(namespace_separator=" ")
+    parser.namespace_prefixes = True
+    parser.ordered_attributes = True
+    parser.specified_attributes = True
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = text_run.append
+    parser.StartCdataSectionHandler = start_cdata
+    parser.EndCdataSectionHandler = end_cdata
+    parser.CommentHandler = comment
+    parser.ProcessingInstructionHandler = processing_instruction
+    parser.StartNamespaceDeclHandler = lambda prefix, uri: namespace_decls.append(
+        (prefix, uri)
+    )
+    parser.StartDoctypeDeclHandler = start_doctype
+    try:
+        parser.Parse(text, True)
+    except _DoctypeFound:
+        # DTDs never occur in OOXML parts; leave them to the DOM round-trip,
+        # which also rejects entity declarations
+        return _condense_xml_with_minidom(text)
+    return "".join(out).encode("utf-8")
+
+
+def _condense_file(xml_file):
+    """Condense one XML file (top-level so it can run in worker processes)."""
+    return condense_xml_bytes(Path(xml_file).read_bytes())
+
+
+def _condense_xml_with_minidom(text):
+    """Condense an XML part via a DOM round-trip."""
+    dom = defusedxml.minidom.parseString(text)
 
     # Process each element to remove whitespace and comments
     for element in dom.getElementsByTagName("*"):
@@ -150,9 +364,17 @@ def condense_xml(xml_file):
             ) or child.nodeType == child.COMMENT_NODE:
                 element.removeChild(child)
 
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    return dom.toxml(encoding="UTF-8")
+
+
+def qualified_name(name):
+    """Turn an expat "uri local prefix" name back into "prefix:local"."""
+    parts = name.split(" ")
+    return f"{parts[2]}:{parts[1]}" if len(parts) == 3 else parts[-1]
+
+
+class _DoctypeFound(Exception):
+    """Raised by condense_xml_bytes() to fall back to the DOM round-trip."""
 
 
 if __name__ == "__main__":
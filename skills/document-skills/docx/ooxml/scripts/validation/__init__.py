@@ -4,12 +4,15 @@ Validation modules for Word document processing.
 
 from .base import BaseSchemaValidator
 from .docx import DOCXSchemaValidator
+from .package import PackageInventory, Relationship
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
 
 __all__ = [
     "BaseSchemaValidator",
     "DOCXSchemaValidator",
+    "PackageInventory",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "Relationship",
 ]
@@ -2,11 +2,183 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
+import hashlib
+import io
+import json
+import os
 import re
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+from .package import CONTENT_TYPES_PART, PackageInventory
+
+SCHEMAS_DIR = Path(__file__).parent.parent.parent / "schemas"
+
+# Directory where XSD errors of original documents are persisted, keyed by the
+# original's and the schemas' content hashes. Persisted errors are subtracted
+# from the errors reported for the edited document, so the directory is private
+# to the user and files owned by anyone else are ignored. Set
+# OOXML_BASELINE_CACHE to another directory, or to "off" to keep them in memory
+# only.
+BASELINE_CACHE_ENV = "OOXML_BASELINE_CACHE"
+DEFAULT_BASELINE_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "ooxml-baseline-errors"
+)
+
+# Bump when validation changes in a way that makes persisted errors stale
+BASELINE_CACHE_VERSION = 1
+
+# XSD errors per member of original documents: cache key -> {member: [errors]}
+_BASELINE_ERRORS = {}
+
+# Content hash of each schemas directory, part of the baseline cache key
+_SCHEMA_DIGESTS = {}
+
+# Compiled XSD schemas (or the error compiling them) keyed by resolved schema
+# path. Compiling the WordprocessingML/PresentationML schemas dominates
+# validation time, so they are shared by every validator in the process.
+_SCHEMA_CACHE = {}
+
+
+def load_schema(schema_path):
+    """Return the compiled XMLSchema for an XSD file, compiling it once per process.
+
+    Args:
+        schema_path: Path to the .xsd file
+
+    Returns:
+        lxml.etree.XMLSchema: The compiled schema
+
+    Raises:
+        Exception: The error from parsing or compiling the schema (cached and
+            raised again on every call)
+    """
+    key = str(Path(schema_path).resolve())
+    cached = _SCHEMA_CACHE.get(key)
+    if cached is None:
+        try:
+            with open(key, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=key)
+                cached = lxml.etree.XMLSchema(xsd_doc)
+        except Exception as e:
+            cached = e
+        _SCHEMA_CACHE[key] = cached
+    if isinstance(cached, Exception):
+        raise cached
+    return cached
+
+
+# Validator owned by an XSD worker process (see validate_against_xsd)
+_worker_validator = None
+
+
+def _init_xsd_worker(validator_class, unpacked_dir, original_file):
+    """Create the validator used by an XSD worker process."""
+    global _worker_validator
+    _worker_validator = validator_class(unpacked_dir, original_file)
+
+
+def _validate_file_in_worker(xml_file):
+    """Validate one file against XSD in an XSD worker process."""
+    return _worker_validator.validate_file_against_xsd(xml_file, verbose=False)
+
+
+def schema_digest(schemas_dir):
+    """Return a hash of every schema file in a directory, computed once per process.
+
+    Args:
+        schemas_dir: Directory containing the XSD files
+
+    Returns:
+        str: Hex digest of the schema file names and contents
+    """
+    key = str(Path(schemas_dir).resolve())
+    digest = _SCHEMA_DIGESTS.get(key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        for path in sorted(Path(key).rglob("*.xsd")):
+            hasher.update(path.relative_to(key).as_posix().encode("utf-8") + b"\0")
+            hasher.update(hashlib.sha256(path.read_bytes()).digest())
+        digest = _SCHEMA_DIGESTS[key] = hasher.hexdigest()
+    return digest
+
+
+def _baseline_cache_file(key):
+    """Return the file persisting baseline errors for a key (None if disabled)."""
+    cache_dir = os.environ.get(BASELINE_CACHE_ENV, str(DEFAULT_BASELINE_CACHE_DIR))
+    if not cache_dir or cache_dir.lower() == "off":
+        return None
+    return Path(cache_dir) / f"{key}.json"
+
+
+def _read_baseline_file(cache_file):
+    """Read persisted baseline errors, refusing files another user could have planted.
+
+    Raises:
+        OSError: If the file is missing, a symlink, or not owned by the current user
+        ValueError: If the file does not hold a mapping of part names to error lists
+    """
+    fd = os.open(cache_file, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    with os.fdopen(fd, "r", encoding="utf-8") as f:
+        if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+            raise OSError(f"{cache_file} is not owned by the current user")
+        baseline = json.load(f)
+    if not isinstance(baseline, dict) or not all(
+        isinstance(errors, list) for errors in baseline.values()
+    ):
+        raise ValueError(f"{cache_file} is not a baseline error file")
+    return baseline
+
+
+def _load_baseline_errors(key):
+    """Return the baseline errors for a cache key from memory or disk."""
+    baseline = _BASELINE_ERRORS.get(key)
+    if baseline is None:
+        baseline = {}
+        cache_file = _baseline_cache_file(key)
+        if cache_file is not None:
+            try:
+                baseline = _read_baseline_file(cache_file)
+            except (OSError, ValueError):
+                baseline = {}
+        _BASELINE_ERRORS[key] = baseline
+    return baseline
+
+
+def _save_baseline_errors(key, baseline):
+    """Persist the baseline errors for a cache key; failures are ignored.
+
+    Entries already on disk are kept, so processes validating different parts
+    of the same original (see validate_against_xsd) don't drop each other's.
+    """
+    cache_file = _baseline_cache_file(key)
+    if cache_file is None:
+        return
+    try:
+        persisted = _read_baseline_file(cache_file)
+        baseline.update(
+            (member, errors)
+            for member, errors in persisted.items()
+            if member not in baseline
+        )
+    except (OSError, ValueError):
+        pass
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(baseline, f)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        pass
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,13 +275,18 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self, unpacked_dir, original_file, verbose=False, jobs=1, changed_parts=None
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
 
+        # Worker processes for XSD validation (0 = one per CPU)
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+
         # Set schemas directory
-        self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
+        self.schemas_dir = SCHEMAS_DIR
 
         # Get all XML and .rels files
         patterns = ["*.xml", "*.rels"]
@@ -120,6 +297,105 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Files checked by per-part checks (well-formedness, namespaces, XSD,
+        # ...). When changed_parts is given (part names such as
+        # "word/comments.xml"), parts outside it passed these checks before and
+        # are skipped. Checks relating parts to each other (references,
+        # relationships, content types, unique IDs) always see every part.
+        if changed_parts is None:
+            self.changed_files = self.xml_files
+        else:
+            changed_parts = set(changed_parts)
+            self.changed_files = [
+                f
+                for f in self.xml_files
+                if f.relative_to(self.unpacked_dir).as_posix() in changed_parts
+            ]
+
+        # Parsed trees (or parse errors) for files in unpacked_dir, shared by
+        # every check of this validator so each part is parsed only once
+        self._xml_trees = {}
+
+        # Cache key of the original file's baseline XSD errors (computed lazily)
+        self._baseline_key = None
+
+        # Parts, relationships and content types (built by the package property)
+        self._package = None
+
+    @classmethod
+    def preload_schemas(cls):
+        """Compile all schemas in SCHEMA_MAPPINGS now instead of on first use.
+
+        Long-running callers (e.g. a session that saves a Document several
+        times) can call this once up front; every validator created later in
+        the process reuses the compiled schemas. Schemas that fail to compile
+        are reported when a file that needs them is validated.
+
+        Returns:
+            int: Number of distinct schemas compiled
+        """
+        schema_paths = {SCHEMAS_DIR / name for name in cls.SCHEMA_MAPPINGS.values()}
+        for schema_path in schema_paths:
+            try:
+                load_schema(schema_path)
+            except Exception:
+                pass
+        return len(schema_paths)
+
+    def parse_xml(self, xml_file):
+        """Parse an XML file in the unpacked directory, once per validator.
+
+        The returned tree is shared by all checks and must not be modified;
+        use parse_xml_copy() for checks that need to change it.
+
+        Args:
+            xml_file: Path to an XML file inside unpacked_dir
+
+        Returns:
+            lxml.etree._ElementTree
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed (on every call)
+            OSError: If the file cannot be read (on every call)
+        """
+        key = str(xml_file)
+        tree = self._xml_trees.get(key)
+        if tree is None:
+            try:
+                tree = lxml.etree.parse(key)
+            except Exception as e:
+                tree = e
+            self._xml_trees[key] = tree
+        if isinstance(tree, Exception):
+            raise tree
+        return tree
+
+    @property
+    def package(self):
+        """Inventory of the unpacked package, built once per validator.
+
+        Shared by the reference, relationship ID and content type checks.
+
+        Returns:
+            PackageInventory
+        """
+        if self._package is None:
+            self._package = PackageInventory(self.unpacked_dir, self.parse_xml)
+        return self._package
+
+    def parse_xml_copy(self, xml_file):
+        """Return a private, modifiable copy of a parsed XML file.
+
+        Copying the cached tree is much cheaper than parsing the file again.
+
+        Args:
+            xml_file: Path to an XML file inside unpacked_dir
+
+        Returns:
+            lxml.etree._ElementTree
+        """
+        return lxml.etree.ElementTree(copy.deepcopy(self.parse_xml(xml_file).getroot()))
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
@@ -128,10 +404,10 @@ class BaseSchemaValidator:
         """Validate that all XML files are well-formed."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.changed_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self.parse_xml(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -157,9 +433,9 @@ class BaseSchemaValidator:
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.changed_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.parse_xml(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -187,82 +463,50 @@ class BaseSchemaValidator:
         """Validate that specific IDs are unique according to OOXML requirements."""
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
+        # Requirement lookups by qualified tag and attribute name, filled as
+        # names are first seen so each distinct name is split only once
+        requirements = {}
+        attribute_names = {}
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
-
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
+                found = list(
+                    self._iter_unique_ids(xml_file, requirements, attribute_names)
                 )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
-                    )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
                 )
+                continue
+
+            file_ids = {}  # Track IDs that must be unique within this file
+            for tag, attr_name, scope, id_value, line in found:
+                if scope == "global":
+                    # Check global uniqueness
+                    if id_value in global_ids:
+                        prev_file, prev_line, prev_tag = global_ids[id_value]
+                        errors.append(
+                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                            f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                            f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                        )
+                    else:
+                        global_ids[id_value] = (
+                            xml_file.relative_to(self.unpacked_dir),
+                            line,
+                            tag,
+                        )
+                elif scope == "file":
+                    # Check file-level uniqueness
+                    seen = file_ids.setdefault((tag, attr_name), {})
+                    if id_value in seen:
+                        errors.append(
+                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                            f"Line {line}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                            f"(first occurrence at line {seen[id_value]})"
+                        )
+                    else:
+                        seen[id_value] = line
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -274,99 +518,122 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _iter_unique_ids(self, xml_file, requirements, attribute_names):
+        """Yield the IDs in a file that UNIQUE_ID_REQUIREMENTS applies to.
+
+        Uses the cached tree when the file was already parsed and otherwise
+        streams it with iterparse, freeing elements once they are read so
+        memory stays flat for large parts. mc:AlternateContent subtrees are
+        skipped without modifying the tree.
+
+        Args:
+            xml_file: Path to an XML file inside unpacked_dir
+            requirements: Dict memoizing qualified tag -> (tag, attribute name,
+                scope), or None for tags without requirements
+            attribute_names: Dict memoizing qualified attribute -> lowercase
+                local name
+
+        Yields:
+            tuple: (tag, attribute name, scope, ID value, line number)
+        """
+        tree = self._xml_trees.get(str(xml_file))
+        if isinstance(tree, Exception):
+            raise tree
+        streaming = tree is None
+        if streaming:
+            events = lxml.etree.iterparse(str(xml_file), events=("start", "end"))
+        else:
+            events = lxml.etree.iterwalk(tree.getroot(), events=("start", "end"))
+
+        alternate_content_tag = f"{{{self.MC_NAMESPACE}}}AlternateContent"
+        depth = 0
+        skipped_depth = None  # Depth of the AlternateContent being skipped
+        for event, elem in events:
+            if event == "end":
+                depth -= 1
+                if depth == skipped_depth:
+                    skipped_depth = None
+                if streaming:
+                    # Drop finished elements; their IDs have been read
+                    elem.clear(keep_tail=True)
+                    # The root has no parent; its previous siblings are
+                    # comments or processing instructions before it
+                    parent = elem.getparent()
+                    if parent is not None:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+                continue
+
+            depth += 1
+            if skipped_depth is not None:
+                continue
+            if elem.tag == alternate_content_tag and depth > 1:
+                skipped_depth = depth - 1
+                continue
+
+            try:
+                requirement = requirements[elem.tag]
+            except KeyError:
+                # Element name without namespace, matched case-insensitively
+                tag = elem.tag.split("}")[-1].lower()
+                requirement = self.UNIQUE_ID_REQUIREMENTS.get(tag)
+                if requirement is not None:
+                    requirement = (tag, *requirement)
+                requirements[elem.tag] = requirement
+            if requirement is None:
+                continue
+
+            tag, attr_name, scope = requirement
+            for attr, value in elem.attrib.items():
+                attr_local = attribute_names.get(attr)
+                if attr_local is None:
+                    attr_local = attribute_names[attr] = attr.split("}")[-1].lower()
+                if attr_local == attr_name:
+                    yield tag, attr_name, scope, value, elem.sourceline
+                    break
+
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
         """
         errors = []
+        package = self.package
 
-        # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
-
-        if not rels_files:
+        rels_parts = package.rels_parts
+        if not rels_parts:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
-
-        # Track all files that are referenced by any .rels file
-        all_referenced_files = set()
+        # All parts except reference files, which are not referenced by .rels
+        all_parts = [
+            name
+            for name in package.parts
+            if name != CONTENT_TYPES_PART and not name.endswith(".rels")
+        ]
 
         if self.verbose:
             print(
-                f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
+                f"Found {len(rels_parts)} .rels files and {len(all_parts)} target files"
             )
 
         # Check each .rels file
-        for rels_file in rels_files:
-            try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
-
-                # Find all relationships and their targets
-                referenced_files = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
-                        else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
-
-            except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+        for rels_part in rels_parts:
+            if rels_part in package.rels_errors:
+                errors.append(
+                    f"  Error parsing {rels_part}: {package.rels_errors[rels_part]}"
+                )
+                continue
+            for rel in package.get_relationships(package.source_part(rels_part)):
+                if rel.rels_part == rels_part and rel.is_broken:
+                    errors.append(
+                        f"  {rels_part}: Line {rel.line}: Broken reference to {rel.target}"
+                    )
 
         # Check for unreferenced files (files that exist but are not referenced anywhere)
-        unreferenced_files = set(all_files) - all_referenced_files
-
-        if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+        for part in sorted(all_parts):
+            if not package.referenced_by(part):
+                errors.append(f"  Unreferenced file: {part}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
@@ -390,9 +657,8 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
+        package = self.package
 
         # Process each XML file that might contain r:id references
         for xml_file in self.xml_files:
@@ -400,41 +666,38 @@ class BaseSchemaValidator:
             if xml_file.suffix == ".rels":
                 continue
 
-            # Determine the corresponding .rels file
+            # Relationships come from the corresponding .rels file
             # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
+            part = xml_file.relative_to(self.unpacked_dir).as_posix()
+            rels_part = package.rels_part_for(part)
 
             # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
+            if rels_part not in package.parts:
                 continue
 
             try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
+                if rels_part in package.rels_errors:
+                    raise package.rels_errors[rels_part]
 
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
+                # Valid relationship IDs and their types
+                rid_to_type = {}
+                for rel in package.get_relationships(part):
+                    rid = rel.id
                     if rid:
                         # Check for duplicate rIds
                         if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
                             errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
+                                f"  {rels_part}: Line {rel.line}: "
                                 f"Duplicate relationship ID '{rid}' (IDs must be unique)"
                             )
                         # Extract just the type name from the full URL
                         type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
+                            rel.type.split("/")[-1] if "/" in rel.type else rel.type
                         )
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self.parse_xml(xml_file).getroot()
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -524,32 +787,17 @@ class BaseSchemaValidator:
         errors = []
 
         # Find [Content_Types].xml file
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        package = self.package
+        if CONTENT_TYPES_PART not in package.parts:
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
-            # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts = set()
-            declared_extensions = set()
-
-            # Get Override declarations (specific files)
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
-
-            # Get Default declarations (by extension)
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+            # Declared parts (Override) and extensions (Default)
+            if package.content_types_error is not None:
+                raise package.content_types_error
+            declared_parts = package.overrides
+            declared_extensions = package.defaults
 
             # Root elements that require content type declaration
             declarable_roots = {
@@ -575,9 +823,8 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
+            # All files in the unpacked directory
+            all_files = package.parts.values()
 
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
@@ -593,7 +840,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self.parse_xml(xml_file).getroot().tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -638,6 +885,17 @@ class BaseSchemaValidator:
                 )
             return True
 
+    def _unpacked_path(self, xml_file):
+        """Return the absolute path of a file in unpacked_dir, comparable to it.
+
+        Only the directories are resolved (handles symlinks such as /var vs
+        /private/var on macOS, like unpacked_dir). The file itself is not: it
+        may be a symlink into the original package, e.g. in a copy-on-write
+        working copy, and must still be treated as a part of unpacked_dir.
+        """
+        xml_file = Path(xml_file).absolute()
+        return xml_file.parent.resolve() / xml_file.name
+
     def validate_file_against_xsd(self, xml_file, verbose=False):
         """Validate a single XML file against XSD schema, comparing with original.
 
@@ -648,9 +906,8 @@ class BaseSchemaValidator:
         Returns:
             tuple: (is_valid, new_errors_set) where is_valid is True/False/None (skipped)
         """
-        # Resolve both paths to handle symlinks
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
+        xml_file = self._unpacked_path(xml_file)
+        unpacked_dir = self.unpacked_dir
 
         # Validate current file
         is_valid, current_errors = self._validate_single_file_xsd(
@@ -673,7 +930,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -692,11 +949,9 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        results = self._validate_files_against_xsd()
+        for xml_file, (is_valid, new_file_errors) in zip(self.changed_files, results):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -712,14 +967,14 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
 
         # Print summary
         if self.verbose:
-            print(f"Validated {len(self.xml_files)} files:")
+            print(f"Validated {len(self.changed_files)} files:")
             print(f"  - Valid: {valid_count}")
             print(f"  - Skipped (no schema): {skipped_count}")
             if original_error_count:
@@ -738,6 +993,30 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_files_against_xsd(self):
+        """Run validate_file_against_xsd on every file in changed_files.
+
+        With jobs > 1 the files are spread over worker processes (lxml holds
+        the GIL while validating, so threads would not help). Results are
+        collected in file order, so the report is the same as a serial run.
+
+        Returns:
+            list: (is_valid, new_errors_set) for each file in self.changed_files
+        """
+        jobs = min(self.jobs, len(self.changed_files))
+        if jobs <= 1:
+            return [
+                self.validate_file_against_xsd(xml_file, verbose=False)
+                for xml_file in self.changed_files
+            ]
+
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_xsd_worker,
+            initargs=(type(self), self.unpacked_dir, self.original_file),
+        ) as executor:
+            return list(executor.map(_validate_file_in_worker, self.changed_files))
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -765,8 +1044,7 @@ class BaseSchemaValidator:
     def _clean_ignorable_namespaces(self, xml_doc):
         """Remove attributes and elements not in allowed namespaces."""
         # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        xml_copy = copy.deepcopy(xml_doc.getroot())
 
         # Remove attributes not in allowed namespaces
         for elem in xml_copy.iter():
@@ -825,28 +1103,44 @@ class BaseSchemaValidator:
 
     def _validate_single_file_xsd(self, xml_file, base_path):
         """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
-        schema_path = self._get_schema_path(xml_file)
-        if not schema_path:
+        relative_path = xml_file.relative_to(base_path)
+        if not self._get_schema_path(relative_path):
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            # Parsing works on a copy during preprocessing, so the shared tree
+            # of a file in unpacked_dir can be used directly
+            if Path(base_path) == self.unpacked_dir:
+                xml_doc = self.parse_xml(xml_file)
+            else:
+                xml_doc = lxml.etree.parse(str(xml_file))
+        except Exception as e:
+            return False, {str(e)}
+
+        return self._validate_xml_doc_xsd(xml_doc, relative_path)
+
+    def _validate_xml_doc_xsd(self, xml_doc, relative_path):
+        """Validate a parsed XML document against XSD schema.
+
+        Args:
+            xml_doc: Parsed lxml ElementTree (not modified)
+            relative_path: Path of the part relative to the package root
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+        Returns:
+            tuple: (is_valid, errors_set), or (None, None) if no schema applies
+        """
+        schema_path = self._get_schema_path(relative_path)
+        if not schema_path:
+            return None, None  # Skip file
+
+        try:
+            # Load schema (compiled once per process)
+            schema = load_schema(schema_path)
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
             # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
             if (
                 relative_path.parts
                 and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
@@ -866,42 +1160,65 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
+    def read_original_member(self, member):
+        """Read one part of the original file from the zip archive into memory.
+
+        Args:
+            member: Part name within the archive (e.g. "word/document.xml")
+
+        Returns:
+            bytes: The part's content, or None if the original has no such part
+        """
+        with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+            try:
+                return zip_ref.read(member)
+            except KeyError:
+                return None
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        Errors are computed once per part of the original file, reading the
+        part straight from the archive, and cached by the original's content
+        hash and the schemas' (in memory and on disk, see OOXML_BASELINE_CACHE)
+        so later validations against the same original reuse them.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
-        # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        xml_file = self._unpacked_path(xml_file)
+        member = xml_file.relative_to(self.unpacked_dir).as_posix()
+
+        if self._baseline_key is None:
+            digest = hashlib.sha256(self.original_file.read_bytes()).hexdigest()
+            schemas = schema_digest(self.schemas_dir)[:16]
+            self._baseline_key = (
+                f"{type(self).__name__}-v{BASELINE_CACHE_VERSION}-{schemas}-{digest}"
+            )
+        baseline = _load_baseline_errors(self._baseline_key)
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        if member not in baseline:
+            baseline[member] = sorted(self._validate_original_member(member))
+            _save_baseline_errors(self._baseline_key, baseline)
+        return set(baseline[member])
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+    def _validate_original_member(self, member):
+        """Validate one part of the original file in memory. Returns its errors."""
+        data = self.read_original_member(member)
+        if data is None:
+            # File didn't exist in original, so no original errors
+            return set()
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+        try:
+            xml_doc = lxml.etree.parse(io.BytesIO(data))
+        except Exception as e:
+            return {str(e)}
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        is_valid, errors = self._validate_xml_doc_xsd(xml_doc, Path(member))
+        return errors if errors else set()
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -917,8 +1234,7 @@ class BaseSchemaValidator:
         template_pattern = re.compile(r"\{\{[^}]*\}\}")
 
         # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        xml_copy = copy.deepcopy(xml_doc.getroot())
 
         def process_text_content(text, content_type):
             if not text:
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Side-by-side benchmark of the XMLEditor (minidom) and LxmlXMLEditor backends.
+
+Each backend runs in its own process on the same document.xml: parse, node
+lookups by line and by text, insertions and save. Wall times and the peak
+memory of the process are reported per backend.
+
+Usage (from the skill root):
+    python -m scripts.bench_xml_editor                       # synthetic document
+    python -m scripts.bench_xml_editor --paragraphs 50000
+    python -m scripts.bench_xml_editor unpacked/word/document.xml
+"""
+
+import argparse
+import json
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .utilities import LxmlXMLEditor, XMLEditor
+
+BACKENDS = {"minidom": XMLEditor, "lxml": LxmlXMLEditor}
+
+# Lookups and insertions per run
+LOOKUPS = 20
+
+WORDS = "the party shall agree to pay all fees under this clause within days".split()
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def build_document(path, paragraphs, seed=0):
+    """Write a pretty-printed synthetic document.xml with numbered paragraphs."""
+    rng = random.Random(seed)
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>',
+        f'<w:document xmlns:w="{W_NAMESPACE}">',
+        "  <w:body>",
+    ]
+    for i in range(paragraphs):
+        text = " ".join(rng.choice(WORDS) for _ in range(20))
+        lines += [
+            '    <w:p w:rsidR="00AB12CD">',
+            "      <w:r>",
+            "        <w:rPr>",
+            "          <w:b/>",
+            "        </w:rPr>",
+            f'        <w:t xml:space="preserve">Paragraph {i}: {text}</w:t>',
+            "      </w:r>",
+            "    </w:p>",
+        ]
+    lines += ["  </w:body>", "</w:document>"]
+    Path(path).write_text("\n".join(lines), encoding="utf-8")
+
+
+def _peak_rss_mb():
+    """Peak resident memory of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_backend(backend, xml_path):
+    """Time one backend on xml_path (called in a child process).
+
+    Returns:
+        dict: Seconds per phase and peak memory in MiB
+    """
+    editor_class = BACKENDS[backend]
+    lines = Path(xml_path).read_text(encoding="utf-8").splitlines()
+    paragraph_lines = [
+        number
+        for number, line in enumerate(lines, 1)
+        if line.lstrip().startswith(("<w:p ", "<w:p>"))
+    ]
+    rng = random.Random(0)
+    targets = sorted(rng.sample(paragraph_lines, min(LOOKUPS, len(paragraph_lines))))
+    rss_before = _peak_rss_mb()
+
+    result = {}
+    started = time.perf_counter()
+    editor = editor_class(xml_path)
+    result["parse"] = time.perf_counter() - started
+    result["peak_mb"] = _peak_rss_mb() - rss_before
+
+    started = time.perf_counter()
+    nodes = [editor.get_node(tag="w:p", line_number=line) for line in targets]
+    result["get_node_line"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    count = len(paragraph_lines)
+    for i in rng.sample(range(count), min(5, count)):
+        editor.get_node(tag="w:p", contains=f"Paragraph {i}:")
+    result["get_node_contains"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for node in nodes:
+        editor.insert_after(node, "<w:p><w:r><w:t>Inserted</w:t></w:r></w:p>")
+    result["insert"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    editor.save()
+    result["save"] = time.perf_counter() - started
+
+    result["peak_mb"] = max(result["peak_mb"], _peak_rss_mb() - rss_before)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare XMLEditor backends")
+    parser.add_argument("xml_file", nargs="?", help="document.xml to edit (copied)")
+    parser.add_argument(
+        "--paragraphs",
+        type=int,
+        default=20000,
+        help="Paragraphs in the synthetic document (default: 20000)",
+    )
+    parser.add_argument("--child", choices=sorted(BACKENDS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_backend(args.child, args.xml_file)))
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = Path(temp_dir) / "document.xml"
+        if args.xml_file:
+            shutil.copy(args.xml_file, source)
+        else:
+            build_document(source, args.paragraphs)
+        size_mb = source.stat().st_size / (1024 * 1024)
+        print(f"Document: {args.xml_file or 'synthetic'} ({size_mb:.1f} MiB)")
+
+        results = {}
+        for backend in BACKENDS:
+            # Fresh copy and process per backend so neither sees the other's
+            # edits or memory
+            xml_path = Path(temp_dir) / f"{backend}.xml"
+            shutil.copy(source, xml_path)
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "scripts.bench_xml_editor",
+                    str(xml_path),
+                    "--child",
+                    backend,
+                ],
+                cwd=Path(__file__).parent.parent,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results[backend] = json.loads(output)
+
+    phases = ["parse", "get_node_line", "get_node_contains", "insert", "save"]
+    print(f"{'phase':<18} {'minidom':>10} {'lxml':>10} {'speedup':>8}")
+    for phase in phases:
+        slow, fast = results["minidom"][phase], results["lxml"][phase]
+        ratio = f"{slow / fast:.1f}x" if fast else "-"
+        print(f"{phase:<18} {slow:>9.3f}s {fast:>9.3f}s {ratio:>8}")
+    slow, fast = results["minidom"]["peak_mb"], results["lxml"]["peak_mb"]
+    ratio = f"{slow / fast:.1f}x" if fast else "-"
+    print(f"{'peak memory':<18} {slow:>7.0f}MiB {fast:>7.0f}MiB {ratio:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ Usage:
     # Initialize
     doc = Document('workspace/unpacked')
     doc = Document('workspace/unpacked', author="John Doe", initials="JD")
+    doc = Document('workspace/unpacked', preload_schemas=True)  # Warm XSD cache for repeated saves
 
     # Find nodes
     node = doc["word/document.xml"].get_node(tag="w:del", attrs={"w:id": "1"})
@@ -26,7 +27,9 @@ Usage:
     doc.save()
 """
 
+import hashlib
 import html
+import os
 import random
 import shutil
 import tempfile
@@ -36,6 +39,7 @@ from pathlib import Path
 from defusedxml import minidom
 from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
+from ooxml.scripts.validation.package import PackageInventory
 from ooxml.scripts.validation.redlining import RedliningValidator
 
 from .utilities import XMLEditor
@@ -337,6 +341,8 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+        # Re-index the rewritten subtree for later get_node() lookups
+        self._track_inserted([elem])
         return [elem]
 
     def revert_deletion(self, elem):
@@ -528,6 +534,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
+            self._track_inserted([del_wrapper])
 
             return del_wrapper
 
@@ -586,6 +593,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
+            self._track_inserted([elem])
 
             return elem
 
@@ -609,6 +617,23 @@ def _generate_rsid() -> str:
     return "".join(random.choices("0123456789ABCDEF", k=8))
 
 
+def _ignore_non_xml_parts(directory, names):
+    """copytree ignore function that keeps only XML parts (and directories)."""
+    return [
+        name
+        for name in names
+        if not name.endswith((".xml", ".rels"))
+        and os.path.isfile(os.path.join(directory, name))
+    ]
+
+
+def _copy_unless_same(src, dst):
+    """Copy src to dst, skipping files that are already the same file (links)."""
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return dst
+    return shutil.copy2(src, dst)
+
+
 class Document:
     """Manages comments in unpacked Word documents."""
 
@@ -619,6 +644,8 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        preload_schemas=False,
+        copy_on_write=False,
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,6 +657,12 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            preload_schemas: If True, compile the XSD schemas now so that every
+                save(validate=True) in this process reuses them (default: False)
+            copy_on_write: If True, hardlink (or symlink) the working copy to the
+                original files instead of copying them; XML parts are copied when
+                first opened for editing. Saves time and disk for media-heavy
+                documents (default: False)
         """
         self.original_path = Path(unpacked_dir)
 
@@ -639,11 +672,20 @@ class Document:
         # Create temporary directory with subdirectories for unpacked content and baseline
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Working copy files that are still links to the original files; each is
+        # replaced by a private copy before an editor is created for it
+        self._linked_parts = set()
+        if copy_on_write:
+            shutil.copytree(
+                self.original_path, self.unpacked_path, copy_function=self._link_part
+            )
+        else:
+            shutil.copytree(self.original_path, self.unpacked_path)
+
+        # Validation baseline: the original XML parts packed into a temporary
+        # .docx (outside unpacked dir), created by the original_docx property
+        self._original_docx = None
 
         self.word_path = self.unpacked_path / "word"
 
@@ -658,6 +700,14 @@ class Document:
         # Cache for lazy-loaded editors
         self._editors = {}
 
+        # Inventory of the working copy as on disk (built by the package
+        # property, replaced by the one validation builds)
+        self._package = None
+
+        # Content hashes of the XML parts as they were when validation last
+        # passed (None until then), so later saves validate only changed parts
+        self._validated_hashes = None
+
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
@@ -677,6 +727,11 @@ class Document:
         # Add author to people.xml
         self._add_author_to_people(author)
 
+        # Compiled schemas are cached for the life of the process; compiling
+        # them up front keeps the cost out of the first save()
+        if preload_schemas:
+            DOCXSchemaValidator.preload_schemas()
+
     def __getitem__(self, xml_path: str) -> DocxXMLEditor:
         """
         Get or create a DocxXMLEditor for the specified XML file.
@@ -704,12 +759,39 @@ class Document:
             file_path = self.unpacked_path / xml_path
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
+            self._unlink_part(file_path)
             # Use DocxXMLEditor with RSID, author, and initials for all editors
             self._editors[xml_path] = DocxXMLEditor(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
         return self._editors[xml_path]
 
+    @property
+    def original_docx(self) -> Path:
+        """
+        Path to the original XML parts packed as .docx, the validation baseline.
+
+        Packed on first access, so sessions that never validate skip it.
+        """
+        return self._pack_original()
+
+    @property
+    def package(self) -> PackageInventory:
+        """
+        Parts, relationships and content types of the working copy.
+
+        Reflects the parts as written to disk; changes made through editors are
+        included after save(). Built on first access and reused until then.
+
+        Example:
+            for rel in doc.package.get_relationships("word/document.xml"):
+                print(rel.id, rel.type, rel.target_part)
+            doc.package.referenced_by("word/media/image1.png")
+        """
+        if self._package is None:
+            self._package = PackageInventory(self.unpacked_path)
+        return self._package
+
     def add_comment(self, start, end, text: str) -> int:
         """
         Add a comment spanning from one element to another.
@@ -835,19 +917,42 @@ class Document:
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
-    def validate(self) -> None:
+    def validate(self, full=False) -> None:
         """
         Validate the document against XSD schema and redlining rules.
 
+        After a successful validation, later calls only run the per-part checks
+        on parts whose content changed since then (checks relating parts to each
+        other always cover the whole document).
+
+        Args:
+            full: If True, validate every part even if it is unchanged (default: False).
+
         Raises:
             ValueError: If validation fails.
         """
+        part_hashes = self._hash_parts()
+        if full or self._validated_hashes is None:
+            changed_parts = None
+        else:
+            changed_parts = {
+                part
+                for part, digest in part_hashes.items()
+                if self._validated_hashes.get(part) != digest
+            }
+
         # Create validators with current state
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.original_docx,
+            verbose=False,
+            changed_parts=changed_parts,
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.original_docx,
+            verbose=False,
+            changed_parts=changed_parts,
         )
 
         # Run validations
@@ -856,6 +961,10 @@ class Document:
         if not redlining_validator.validate():
             raise ValueError("Redlining validation failed")
 
+        self._validated_hashes = part_hashes
+        # The schema checks built an inventory of the parts as validated
+        self._package = schema_validator.package
+
     def save(self, destination=None, validate=True) -> None:
         """
         Save all modified XML files to disk and copy to destination directory.
@@ -874,6 +983,7 @@ class Document:
         # Save all modified XML files in temp directory
         for editor in self._editors.values():
             editor.save()
+        self._package = None
 
         # Validate by default
         if validate:
@@ -881,10 +991,71 @@ class Document:
 
         # Copy contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if target_path.resolve() == self.original_path.resolve():
+            # The baseline cannot be packed once the original is overwritten
+            self._pack_original()
+        shutil.copytree(
+            self.unpacked_path,
+            target_path,
+            copy_function=_copy_unless_same,
+            dirs_exist_ok=True,
+        )
 
     # ==================== Private: Initialization ====================
 
+    def _hash_parts(self):
+        """Return {part name: content hash} for all XML parts in the working copy."""
+        return {
+            path.relative_to(self.unpacked_path).as_posix(): hashlib.sha256(
+                path.read_bytes()
+            ).hexdigest()
+            for pattern in ("*.xml", "*.rels")
+            for path in self.unpacked_path.rglob(pattern)
+        }
+
+    def _pack_original(self):
+        """
+        Pack the original directory as the validation baseline, once.
+
+        Validation only reads XML parts from the baseline, so media and other
+        binary parts are left out of it.
+        """
+        if self._original_docx is None:
+            original_docx = Path(self.temp_dir) / "original.docx"
+            with tempfile.TemporaryDirectory() as parts_dir:
+                parts_path = Path(parts_dir) / "original"
+                shutil.copytree(
+                    self.original_path, parts_path, ignore=_ignore_non_xml_parts
+                )
+                pack_document(parts_path, original_docx, validate=False)
+            self._original_docx = original_docx
+        return self._original_docx
+
+    def _link_part(self, src, dst):
+        """
+        Copy function for a copy-on-write working copy: link dst to src.
+
+        Tries a hardlink, then a symlink (e.g. across filesystems), then falls
+        back to copying.
+        """
+        try:
+            os.link(src, dst)
+        except OSError:
+            try:
+                os.symlink(os.path.abspath(src), dst)
+            except OSError:
+                return shutil.copy2(src, dst)
+        self._linked_parts.add(Path(dst))
+        return dst
+
+    def _unlink_part(self, path):
+        """Replace a working copy file linked to the original with a private copy."""
+        if path in self._linked_parts:
+            content = path.read_bytes()
+            path.unlink()
+            path.write_bytes(content)
+            self._linked_parts.discard(path)
+
     def _get_next_comment_id(self):
         """Get the next available comment ID."""
         if not self.comments_path.exists():
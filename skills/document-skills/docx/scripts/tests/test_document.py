@@ -0,0 +1,108 @@
+"""
+Tests for document.py (Document working copies)
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add skill root so scripts/ and ooxml/ import as packages
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.document import Document
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+PACKAGE = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '<Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+        "</Relationships>"
+    ),
+    "word/_rels/document.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/>'
+        "</Relationships>"
+    ),
+    "word/document.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W}"><w:body>'
+        "<w:p><w:r><w:t>The quick brown fox</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>jumps over the lazy dog</w:t></w:r></w:p>"
+        "<w:sectPr/></w:body></w:document>"
+    ),
+    "word/settings.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:settings xmlns:w="{W}"><w:defaultTabStop w:val="720"/></w:settings>'
+    ),
+}
+
+
+@pytest.fixture
+def unpacked(tmp_path, monkeypatch):
+    """Minimal unpacked .docx directory."""
+    # Keep validation baselines in memory
+    monkeypatch.setenv("OOXML_BASELINE_CACHE", "off")
+    root = tmp_path / "unpacked"
+    for name, content in PACKAGE.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return root
+
+
+def snapshot(directory):
+    """Map of relative path -> bytes for every file under directory."""
+    return {
+        path.relative_to(directory).as_posix(): path.read_bytes()
+        for path in sorted(directory.rglob("*"))
+        if path.is_file()
+    }
+
+
+class TestCopyOnWrite:
+    """Test copy-on-write working copies."""
+
+    @pytest.mark.parametrize("hardlinks", [True, False])
+    def test_edit_and_save(self, unpacked, tmp_path, monkeypatch, hardlinks):
+        """Test that an edited copy-on-write document validates and saves.
+
+        Without hardlinks (e.g. across filesystems) the working copy is
+        symlinked to the original files.
+        """
+        if not hardlinks:
+
+            def no_link(src, dst):
+                raise OSError("Invalid cross-device link")
+
+            monkeypatch.setattr(os, "link", no_link)
+        original = snapshot(unpacked)
+
+        doc = Document(unpacked, rsid="00AA11BB", copy_on_write=True)
+        if not hardlinks:
+            assert any(path.is_symlink() for path in doc.unpacked_path.rglob("*"))
+
+        editor = doc["word/document.xml"]
+        editor.suggest_deletion(editor.get_node(tag="w:r", contains="lazy dog"))
+        assert snapshot(unpacked) == original
+
+        destination = tmp_path / "saved"
+        doc.save(destination)
+
+        assert snapshot(unpacked) == original
+        saved = (destination / "word" / "document.xml").read_text(encoding="utf-8")
+        assert "<w:delText>jumps over the lazy dog</w:delText>" in saved
+        assert not any(path.is_symlink() for path in destination.rglob("*"))
@@ -3,14 +3,19 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N]
 """
 
 import argparse
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
 
 
 def main():
@@ -30,6 +35,13 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for XSD validation of document parts (0 = one per CPU, default: 1)",
+    )
     args = parser.parse_args()
 
     # Validate paths
@@ -38,6 +50,7 @@ def main():
     file_extension = original_file.suffix.lower()
     assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
     assert original_file.is_file(), f"Error: {original_file} is not a file"
+    assert args.jobs >= 0, f"Error: --jobs must be 0 or more, got {args.jobs}"
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
@@ -55,7 +68,12 @@ def main():
     # Run validators
     success = True
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        if issubclass(V, BaseSchemaValidator):
+            validator = V(
+                unpacked_dir, original_file, verbose=args.verbose, jobs=args.jobs
+            )
+        else:
+            validator = V(unpacked_dir, original_file, verbose=args.verbose)
         if not validator.validate():
             success = False
 
@@ -0,0 +1,234 @@
+"""
+Inventory of the parts, relationships and content types of an unpacked package.
+"""
+
+import posixpath
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import lxml.etree
+
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+
+@dataclass
+class Relationship:
+    """A relationship declared in a .rels part."""
+
+    id: Optional[str]
+    type: str
+    target: str
+    target_mode: Optional[str]
+    source: str  # Part the relationship belongs to ("" for the package itself)
+    rels_part: str  # .rels part declaring it, e.g. "word/_rels/document.xml.rels"
+    line: int  # Line of the <Relationship> element in rels_part
+    target_part: Optional[str]  # Resolved part name of an internal target
+
+    @property
+    def is_external(self):
+        """True for targets outside the package (URLs or TargetMode="External")."""
+        return self.target_mode == "External" or self.target.startswith(
+            ("http", "mailto:")
+        )
+
+    @property
+    def is_broken(self):
+        """True for internal targets that are not a part of the package."""
+        return bool(self.target) and not self.is_external and self.target_part is None
+
+
+class PackageInventory:
+    """Parts, relationships and content types of an unpacked Office package.
+
+    Built with one walk of the directory and one parse of each .rels part and
+    [Content_Types].xml, so checks and scripts that need to know how parts
+    relate to each other can share it instead of rescanning the package. It
+    reflects the files on disk when it was created.
+
+    Part names are relative POSIX paths such as "word/document.xml".
+
+    Attributes:
+        unpacked_dir (Path): The unpacked package directory
+        parts (dict): Part name -> Path of every file in the package
+        relationships (dict): Source part name ("" for the package) -> list of
+            Relationship, in document order
+        rels_errors (dict): .rels part name -> exception for .rels parts that
+            could not be parsed
+        content_types_error (Exception): Error parsing [Content_Types].xml, or
+            None
+        defaults (dict): Lowercase extension -> content type (<Default>)
+        overrides (dict): Part name -> content type (<Override>)
+    """
+
+    def __init__(self, unpacked_dir, parse_xml=None):
+        """Scan an unpacked package.
+
+        Args:
+            unpacked_dir: Path to the unpacked package directory
+            parse_xml: Optional callable returning the parsed lxml tree of a
+                file, to share a parse cache (default: lxml.etree.parse)
+        """
+        self.unpacked_dir = Path(unpacked_dir)
+        parse_xml = parse_xml or (lambda path: lxml.etree.parse(str(path)))
+
+        self.parts = {
+            path.relative_to(self.unpacked_dir).as_posix(): path
+            for path in self.unpacked_dir.rglob("*")
+            if path.is_file()
+        }
+
+        self.relationships = {}
+        self.rels_errors = {}
+        self._referenced_by = {}
+        for rels_part in self.rels_parts:
+            try:
+                rels_root = parse_xml(self.parts[rels_part]).getroot()
+            except Exception as e:
+                self.rels_errors[rels_part] = e
+                continue
+            source = self.source_part(rels_part)
+            relationships = self.relationships.setdefault(source, [])
+            for rel in rels_root.findall(
+                f".//{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+            ):
+                relationship = Relationship(
+                    id=rel.get("Id"),
+                    type=rel.get("Type", ""),
+                    target=rel.get("Target") or "",
+                    target_mode=rel.get("TargetMode"),
+                    source=source,
+                    rels_part=rels_part,
+                    line=rel.sourceline,
+                    target_part=None,
+                )
+                if relationship.target and not relationship.is_external:
+                    target_part = self.resolve_target(source, relationship.target)
+                    if target_part in self.parts:
+                        relationship.target_part = target_part
+                        self._referenced_by.setdefault(target_part, []).append(
+                            relationship
+                        )
+                relationships.append(relationship)
+
+        self.content_types_error = None
+        self.defaults = {}
+        self.overrides = {}
+        if CONTENT_TYPES_PART in self.parts:
+            try:
+                root = parse_xml(self.parts[CONTENT_TYPES_PART]).getroot()
+            except Exception as e:
+                self.content_types_error = e
+            else:
+                for default in root.findall(f".//{{{CONTENT_TYPES_NAMESPACE}}}Default"):
+                    extension = default.get("Extension")
+                    if extension is not None:
+                        self.defaults[extension.lower()] = default.get("ContentType")
+                for override in root.findall(
+                    f".//{{{CONTENT_TYPES_NAMESPACE}}}Override"
+                ):
+                    part_name = override.get("PartName")
+                    if part_name is not None:
+                        self.overrides[part_name.lstrip("/")] = override.get(
+                            "ContentType"
+                        )
+
+    @property
+    def rels_parts(self):
+        """Names of the .rels parts, in directory walk order."""
+        return [name for name in self.parts if name.endswith(".rels")]
+
+    @staticmethod
+    def rels_part_for(part):
+        """Name of the .rels part holding the relationships of a part.
+
+        Args:
+            part: Part name, or "" for the package relationships
+
+        Returns:
+            str: e.g. "word/_rels/document.xml.rels" for "word/document.xml"
+        """
+        directory, name = posixpath.split(part)
+        return posixpath.join(directory, "_rels", f"{name}.rels")
+
+    @staticmethod
+    def source_part(rels_part):
+        """Name of the part whose relationships a .rels part holds.
+
+        Args:
+            rels_part: .rels part name, e.g. "word/_rels/document.xml.rels"
+
+        Returns:
+            str: e.g. "word/document.xml", or "" for "_rels/.rels"
+        """
+        rels_dir, name = posixpath.split(rels_part)
+        return posixpath.join(posixpath.dirname(rels_dir), name[: -len(".rels")])
+
+    @staticmethod
+    def resolve_target(source, target):
+        """Resolve a relationship target to a part name.
+
+        Args:
+            source: Part the relationship belongs to ("" for the package)
+            target: Target attribute of the relationship
+
+        Returns:
+            str: Part name, or None if the target points outside the package
+        """
+        if target.startswith("/"):
+            path = target.lstrip("/")
+        else:
+            path = posixpath.join(posixpath.dirname(source), target)
+        path = posixpath.normpath(path)
+        if path == "." or path == ".." or path.startswith("../"):
+            return None
+        return path
+
+    def get_relationships(self, part):
+        """Relationships of a part, in document order.
+
+        Args:
+            part: Part name, or "" for the package relationships
+
+        Returns:
+            list: Relationship objects (empty if the part has none)
+        """
+        return self.relationships.get(part, [])
+
+    def get_relationship(self, part, rel_id):
+        """The relationship of a part with the given Id, or None."""
+        for relationship in self.get_relationships(part):
+            if relationship.id == rel_id:
+                return relationship
+        return None
+
+    def referenced_by(self, part):
+        """Relationships whose target is the given part.
+
+        Args:
+            part: Part name, e.g. "word/media/image1.png"
+
+        Returns:
+            list: Relationship objects from every .rels part (empty if none)
+        """
+        return self._referenced_by.get(part, [])
+
+    def content_type(self, part):
+        """Content type of a part from its <Override> or extension <Default>.
+
+        Returns:
+            str: The content type, or None if the part is not declared
+        """
+        if part in self.overrides:
+            return self.overrides[part]
+        extension = posixpath.splitext(part)[1].lstrip(".").lower()
+        return self.defaults.get(extension)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
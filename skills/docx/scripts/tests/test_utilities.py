@@ -0,0 +1,87 @@
+"""
+Tests for utilities.py (XMLEditor lookups)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add skill root so scripts/ imports as a package
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.utilities import XMLEditor
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml">
+  <w:body>
+    <w:p w14:paraId="00000001"><w:r><w:t>foo one</w:t></w:r></w:p>
+    <w:p w14:paraId="00000002"><w:r><w:t>bar</w:t></w:r></w:p>
+    <w:p w14:paraId="00000003"><w:r><w:t>foo two</w:t></w:r></w:p>
+  </w:body>
+</w:document>
+"""
+
+
+@pytest.fixture
+def editor(tmp_path):
+    """XMLEditor on a three-paragraph document."""
+    path = tmp_path / "document.xml"
+    path.write_text(DOCUMENT, encoding="utf-8")
+    return XMLEditor(path)
+
+
+class TestGetNode:
+    """Test get_node() lookups."""
+
+    def test_attrs(self, editor):
+        """Test lookup by attribute value."""
+        elem = editor.get_node(tag="w:p", attrs={"w14:paraId": "00000002"})
+        assert editor._get_element_text(elem) == "bar"
+
+    def test_contains(self, editor):
+        """Test lookup by text."""
+        elem = editor.get_node(tag="w:p", contains="two")
+        assert elem.getAttribute("w14:paraId") == "00000003"
+
+    def test_multiple_matches(self, editor):
+        """Test that ambiguous lookups raise."""
+        with pytest.raises(ValueError, match="Multiple nodes found"):
+            editor.get_node(tag="w:p", contains="foo")
+
+    def test_inserted_nodes_are_found(self, editor):
+        """Test that nodes inserted through the editor are indexed."""
+        bar = editor.get_node(tag="w:p", contains="bar")
+        editor.insert_after(
+            bar, '<w:p w14:paraId="00000004"><w:r><w:t>baz</w:t></w:r></w:p>'
+        )
+        elem = editor.get_node(tag="w:p", attrs={"w14:paraId": "00000004"})
+        assert editor.get_node(tag="w:p", contains="baz") is elem
+
+
+class TestInvalidateIndexes:
+    """Test lookups after direct DOM changes."""
+
+    def test_attribute_changed_directly(self, editor):
+        """Test that a directly set attribute is seen after invalidate_indexes()."""
+        editor.get_node(tag="w:p", attrs={"w14:paraId": "00000001"})
+        bar = editor.get_node(tag="w:p", contains="bar")
+        bar.setAttribute("w14:paraId", "00000001")
+        editor.invalidate_indexes()
+
+        with pytest.raises(ValueError, match="Multiple nodes found"):
+            editor.get_node(tag="w:p", attrs={"w14:paraId": "00000001"})
+        with pytest.raises(ValueError, match="Node not found"):
+            editor.get_node(tag="w:p", attrs={"w14:paraId": "00000002"})
+
+    def test_text_moved_directly(self, editor):
+        """Test that text moved between elements without invalidating is found."""
+        editor.get_node(tag="w:p", contains="bar")
+        run = editor.get_node(tag="w:r", contains="foo two")
+        bar = editor.get_node(tag="w:p", contains="bar")
+        run.parentNode.removeChild(run)
+        bar.appendChild(run)
+
+        with pytest.raises(ValueError, match="Multiple nodes found"):
+            editor.get_node(tag="w:p", contains="foo")
+        assert editor.get_node(tag="w:p", contains="two") is bar
@@ -0,0 +1,106 @@
+"""
+Tests for the ooxml validation package
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add skill root so ooxml/ imports as a package
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ooxml.scripts.validation.docx import DOCXSchemaValidator
+from ooxml.scripts.validation.redlining import RedliningValidator
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+BODY = (
+    f'<w:document xmlns:w="{W}"><w:body>'
+    '<w:p><w:bookmarkStart w:id="1" w:name="a"/><w:bookmarkEnd w:id="1"/></w:p>'
+    '<w:p><w:bookmarkStart w:id="2" w:name="b"/><w:bookmarkEnd w:id="2"/></w:p>'
+    "</w:body></w:document>"
+)
+
+
+def make_validator(tmp_path, document):
+    """DOCXSchemaValidator over an unpacked directory holding one document.xml."""
+    unpacked = tmp_path / "unpacked"
+    (unpacked / "word").mkdir(parents=True)
+    (unpacked / "word" / "document.xml").write_text(document, encoding="utf-8")
+    return DOCXSchemaValidator(unpacked, tmp_path / "original.docx")
+
+
+class TestUniqueIds:
+    """Test the unique ID check."""
+
+    @pytest.mark.parametrize(
+        "prolog",
+        [
+            "",
+            "<!-- generated -->",
+            '<?mso-application progid="Word.Document"?>',
+        ],
+        ids=["plain", "leading-comment", "leading-pi"],
+    )
+    def test_ids_read_from_streamed_part(self, tmp_path, prolog):
+        """Test that parts with nodes before the root element are streamed."""
+        document = f'<?xml version="1.0" encoding="UTF-8"?>{prolog}{BODY}'
+        validator = make_validator(tmp_path, document)
+        xml_file = validator.unpacked_dir / "word" / "document.xml"
+
+        ids = list(validator._iter_unique_ids(xml_file, {}, {}))
+
+        assert [(tag, value) for tag, _, _, value, _ in ids] == [
+            ("bookmarkstart", "1"),
+            ("bookmarkend", "1"),
+            ("bookmarkstart", "2"),
+            ("bookmarkend", "2"),
+        ]
+        assert validator.validate_unique_ids()
+
+    def test_duplicate_id_after_leading_comment(self, tmp_path):
+        """Test that duplicates are still reported in such parts."""
+        document = (
+            '<?xml version="1.0" encoding="UTF-8"?><!-- generated -->'
+            + BODY.replace('w:id="2"', 'w:id="1"')
+        )
+        validator = make_validator(tmp_path, document)
+
+        assert not validator.validate_unique_ids()
+
+
+class TestWordDiff:
+    """Test the paragraph-aligned word diff of the redlining validator."""
+
+    def test_duplicate_heavy_document_is_bounded(self, tmp_path):
+        """Test that thousands of repeated paragraphs do not make the diff crawl."""
+        validator = RedliningValidator(tmp_path, tmp_path / "original.docx")
+        rng = random.Random(0)
+        boilerplate = ["Signature", "Date:", "See attached."]
+        original = [rng.choice(boilerplate) for _ in range(8000)]
+        modified = [rng.choice(boilerplate) for _ in range(8000)]
+
+        start = time.perf_counter()
+        diff = validator._get_word_diff("\n".join(original), "\n".join(modified))
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2
+        assert diff
+        # Paragraphs paired in order are only listed when they differ
+        assert all("[-" in line or "{+" in line for line in diff.splitlines())
+
+    def test_edit_among_repeated_paragraphs(self, tmp_path):
+        """Test that unique paragraphs still anchor the diff of a large document."""
+        validator = RedliningValidator(tmp_path, tmp_path / "original.docx")
+        original = []
+        for i in range(5000):
+            original += [f"Clause {i} applies.", "Signature"]
+        modified = list(original)
+        modified[5000] = "Clause 2500 applies in full."
+
+        diff = validator._get_word_diff("\n".join(original), "\n".join(modified))
+
+        assert diff == "Clause 2500 applies{+ in full+}."
@@ -28,14 +28,36 @@ Example usage:
 
     # Save changes
     editor.save()
+
+LxmlXMLEditor has the same API backed by lxml (elements are lxml.etree._Element
+and line numbers come from their sourceline). It parses large files several
+times faster and with far less memory; use it for scripts that don't need the
+minidom DOM:
+
+    editor = LxmlXMLEditor("document.xml")
+    elem = editor.get_node(tag="w:p", contains="specific text")
 """
 
 import html
+import io
+from bisect import bisect_right
+import xml.parsers.expat
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+# libxml2 stores element line numbers in 16 bits; sourceline is only an
+# estimate from this line on
+LIBXML2_MAX_LINE = 65535
+
+# Inserted nodes searched directly by contains= lookups before the text map is
+# rebuilt
+TEXT_MAP_MAX_DIRTY = 200
 
 
 class XMLEditor:
@@ -46,6 +68,10 @@ class XMLEditor:
     of each element. This enables finding nodes by their line number in the original
     file, which is useful when working with Read tool output.
 
+    get_node() uses indexes that track changes made through the editor's own
+    methods. After changing `dom` directly (moving nodes, setting attributes,
+    editing text), call invalidate_indexes() before the next get_node().
+
     Attributes:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
@@ -73,6 +99,26 @@ class XMLEditor:
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
 
+        # Lookup indexes for get_node(), built on first use:
+        #   tag -> {element: None}, line -> {element: None} and
+        #   (tag, attribute) -> value -> {element: None}
+        # Mutation methods queue the nodes they insert; these are indexed on
+        # the next lookup (after subclasses have set their attributes).
+        # Entries for removed or changed nodes are filtered out when used.
+        self._tag_index = None
+        self._line_index = None
+        self._attr_index = {}
+        self._pending_nodes = []
+
+        # Text map for contains= lookups, built on first use:
+        # (text, starts, text_nodes, spans) where text joins all non-whitespace
+        # text nodes in document order, starts[i] is the offset of
+        # text_nodes[i] in it, and spans maps each element to the (start, end)
+        # extent of its own text. Nodes inserted since it was built are
+        # searched directly until there are too many of them.
+        self._text_map = None
+        self._text_dirty = []
+
     def get_node(
         self,
         tag: str,
@@ -84,7 +130,8 @@ class XMLEditor:
         Get a DOM element by tag and identifier.
 
         Finds an element by either its line number in the original file or by
-        matching attribute values. Exactly one match must be found.
+        matching attribute values. Exactly one match must be found. Call
+        invalidate_indexes() first if the DOM was changed directly.
 
         Args:
             tag: The XML tag name (e.g., "w:del", "w:ins", "w:r")
@@ -109,76 +156,268 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and ""Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        matches = [
+            elem
+            for elem in self._get_candidates(
+                tag, attrs, line_number, normalized_contains
+            )
+            if self._is_attached(elem)
+            and self._matches(elem, tag, attrs, line_number, normalized_contains)
+        ]
 
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
+        if not matches:
+            # Nodes created by direct DOM manipulation are not indexed; scan the
+            # whole tree before reporting that nothing matched
+            matches = [
+                elem
+                for elem in self.dom.getElementsByTagName(tag)
+                if self._matches(elem, tag, attrs, line_number, normalized_contains)
+            ]
+            if matches:
+                self.invalidate_indexes()
+
+        return _single_match(matches, tag, attrs, line_number, contains)
+
+    def _matches(self, elem, tag, attrs, line_number, normalized_contains):
+        """Check an element against all get_node() filters."""
+        if elem.tagName != tag:
+            return False
+
+        # Check line_number filter
+        if line_number is not None:
+            parse_pos = getattr(elem, "parse_position", (None,))
+            elem_line = parse_pos[0]
+
+            # Handle both single line number and range
+            if isinstance(line_number, range):
+                if elem_line not in line_number:
+                    return False
+            else:
+                if elem_line != line_number:
+                    return False
 
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
+        # Check attrs filter
+        if attrs is not None:
+            if not all(
+                elem.getAttribute(attr_name) == attr_value
+                for attr_name, attr_value in attrs.items()
+            ):
+                return False
 
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
+        # Check contains filter
+        if normalized_contains is not None:
+            if normalized_contains not in self._get_element_text(elem):
+                return False
 
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        return True
 
-        if not matches:
-            # Build descriptive error message
-            filters = []
-            if line_number is not None:
-                line_str = (
-                    f"lines {line_number.start}-{line_number.stop - 1}"
-                    if isinstance(line_number, range)
-                    else f"line {line_number}"
-                )
-                filters.append(f"at {line_str}")
-            if attrs is not None:
-                filters.append(f"with attributes {attrs}")
-            if contains is not None:
-                filters.append(f"containing '{contains}'")
-
-            filter_desc = " ".join(filters) if filters else ""
-            base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
-
-            # Add helpful hint based on filters used
-            if contains:
-                hint = "Text may be split across elements or use different wording."
-            elif line_number:
-                hint = "Line numbers may have changed if document was modified."
-            elif attrs:
-                hint = "Verify attribute values are correct."
+    def _get_candidates(self, tag, attrs, line_number, normalized_contains=None):
+        """
+        Return elements that may match get_node() filters, using the indexes.
+
+        The most selective index available is used: an attribute value, then a
+        line number or small line range, then the text map, then the tag.
+        Candidates still have to be checked with _matches() and _is_attached().
+        """
+        self._sync_indexes()
+        if attrs:
+            attr_name, attr_value = next(iter(attrs.items()))
+            key = (tag, attr_name)
+            if key not in self._attr_index:
+                by_value = {}
+                for elem in self._tag_index.get(tag, ()):
+                    by_value.setdefault(elem.getAttribute(attr_name), {})[elem] = None
+                self._attr_index[key] = by_value
+            return list(self._attr_index[key].get(attr_value, ()))
+
+        if isinstance(line_number, int) or (
+            isinstance(line_number, range) and len(line_number) <= 1000
+        ):
+            lines = line_number if isinstance(line_number, range) else (line_number,)
+            return [
+                elem
+                for line in lines
+                for elem in self._line_index.get(line, ())
+                if elem.tagName == tag
+            ]
+
+        if normalized_contains:
+            return self._find_text_owners(tag, normalized_contains)
+
+        return list(self._tag_index.get(tag, ()))
+
+    def _find_text_owners(self, tag, needle):
+        """
+        Return elements with the given tag whose text contains needle.
+
+        Searches the text map once, so matches may span several text nodes
+        (e.g. w:t elements in consecutive runs). For each occurrence, the
+        ancestors of the text nodes it covers are checked against their spans
+        to find the elements that contain the whole occurrence. Elements
+        whose text changed since the map was built are also returned; callers
+        verify every candidate with _matches().
+
+        A text node under an ancestor whose span does not contain it was moved
+        by direct DOM manipulation; the map is then rebuilt and searched again.
+        """
+        if self._text_map is None:
+            self._text_map = self._build_text_map()
+            self._text_dirty = []
+        text, starts, text_nodes, spans = self._text_map
+
+        owners = {}
+        position = text.find(needle)
+        while position != -1:
+            end = position + len(needle)
+            first = bisect_right(starts, position) - 1
+            last = bisect_right(starts, end - 1) - 1
+            for i in range(first, last + 1):
+                text_start = starts[i]
+                text_end = text_start + len(text_nodes[i].data)
+                node = text_nodes[i].parentNode
+                while node is not None and node is not self.dom:
+                    span = spans.get(node)
+                    if span is None:
+                        # Created after the map was built
+                        if node.tagName == tag:
+                            owners[node] = None
+                    elif span[0] > text_start or span[1] < text_end:
+                        self.invalidate_indexes()
+                        return self._find_text_owners(tag, needle)
+                    elif (
+                        node.tagName == tag and span[0] <= position and span[1] >= end
+                    ):
+                        owners[node] = None
+                    node = node.parentNode
+            position = text.find(needle, position + 1)
+
+        # Text changed since the map was built lies within inserted nodes, so
+        # only they and their ancestors can have gained a match
+        for root in self._text_dirty:
+            if root.nodeType == root.ELEMENT_NODE:
+                if root.tagName == tag:
+                    owners[root] = None
+                owners.update(dict.fromkeys(root.getElementsByTagName(tag)))
+            node = root.parentNode
+            while node is not None and node is not self.dom:
+                if node.tagName == tag:
+                    owners[node] = None
+                node = node.parentNode
+        return list(owners)
+
+    def _build_text_map(self):
+        """
+        Collect the document text and the text extent of every element.
+
+        Uses the same text as _get_element_text(): whitespace-only text nodes
+        are skipped, so an element's text is text[start:end] of its span.
+
+        Returns:
+            tuple: (text, starts, text_nodes, spans), see __init__
+        """
+        parts = []
+        starts = []
+        text_nodes = []
+        spans = {}
+        offset = 0
+
+        # (node, start) entries: start is None when a node is first reached
+        # and the element's start offset once its children have been pushed
+        stack = [(self.dom.documentElement, None)]
+        while stack:
+            node, start = stack.pop()
+            if node.nodeType == node.TEXT_NODE:
+                starts.append(offset)
+                text_nodes.append(node)
+                parts.append(node.data)
+                offset += len(node.data)
+            elif start is not None:
+                spans[node] = (start, offset)
             else:
-                hint = "Try adding filters (attrs, line_number, or contains)."
+                stack.append((node, offset))
+                stack.extend(
+                    (child, None)
+                    for child in reversed(node.childNodes)
+                    if child.nodeType == child.ELEMENT_NODE
+                    or (child.nodeType == child.TEXT_NODE and child.data.strip())
+                )
 
-            raise ValueError(f"{base_msg}. {hint}")
-        if len(matches) > 1:
-            raise ValueError(
-                f"Multiple nodes found: <{tag}>. "
-                f"Add more filters (attrs, line_number, or contains) to narrow the search."
+        return "".join(parts), starts, text_nodes, spans
+
+    def _sync_indexes(self):
+        """Build the indexes, or add nodes inserted since the last lookup."""
+        if self._tag_index is None:
+            self._tag_index = {}
+            self._line_index = {}
+            self._attr_index = {}
+            self._pending_nodes = []
+            self._index_subtree(self.dom.documentElement)
+            return
+
+        pending, self._pending_nodes = self._pending_nodes, []
+        for node in pending:
+            if node.nodeType == node.ELEMENT_NODE:
+                self._index_subtree(node)
+
+    def _index_subtree(self, root):
+        """Add an element and its descendants to all built indexes."""
+        stack = [root]
+        while stack:
+            elem = stack.pop()
+            tag = elem.tagName
+            self._tag_index.setdefault(tag, {})[elem] = None
+
+            parse_pos = getattr(elem, "parse_position", None)
+            if parse_pos:
+                self._line_index.setdefault(parse_pos[0], {})[elem] = None
+
+            for (index_tag, attr_name), by_value in self._attr_index.items():
+                if index_tag == tag:
+                    by_value.setdefault(elem.getAttribute(attr_name), {})[elem] = None
+
+            stack.extend(
+                child
+                for child in reversed(elem.childNodes)
+                if child.nodeType == child.ELEMENT_NODE
             )
-        return matches[0]
+
+    def _track_inserted(self, nodes):
+        """Queue nodes inserted into the DOM for indexing on the next lookup."""
+        if self._text_map is not None:
+            self._text_dirty.extend(nodes)
+            if len(self._text_dirty) > TEXT_MAP_MAX_DIRTY:
+                self._text_map = None
+        if self._tag_index is not None:
+            self._pending_nodes.extend(nodes)
+
+    def invalidate_indexes(self):
+        """
+        Drop all get_node() indexes; they are rebuilt on the next lookup.
+
+        Must be called after changing the DOM other than through replace_node(),
+        insert_after(), insert_before() or append_to() (e.g. removeChild(),
+        appendChild() or setAttribute() on existing nodes). Otherwise get_node()
+        can miss elements whose position, attributes or text changed.
+        """
+        self._tag_index = None
+        self._line_index = None
+        self._attr_index = {}
+        self._pending_nodes = []
+        self._text_map = None
+        self._text_dirty = []
+
+    def _is_attached(self, elem):
+        """Check that an element is still part of the document."""
+        node = elem
+        while node is not None:
+            if node is self.dom:
+                return True
+            node = node.parentNode
+        return False
 
     def _get_element_text(self, elem):
         """
@@ -222,6 +461,7 @@ class XMLEditor:
         for node in nodes:
             parent.insertBefore(node, elem)
         parent.removeChild(elem)
+        self._track_inserted(nodes)
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -246,6 +486,7 @@ class XMLEditor:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+        self._track_inserted(nodes)
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -266,6 +507,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self._track_inserted(nodes)
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -285,6 +527,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             elem.appendChild(node)
+        self._track_inserted(nodes)
         return nodes
 
     def get_next_rid(self):
@@ -343,6 +586,401 @@ class XMLEditor:
         return nodes
 
 
+class LxmlXMLEditor:
+    """
+    Editor for manipulating OOXML XML files, backed by lxml.
+
+    Offers the same get_node/replace_node/insert_after/insert_before/append_to/
+    save API as XMLEditor, but works on lxml elements. Line numbers come from
+    each element's sourceline; files longer than 65535 lines get one extra
+    expat pass for exact line numbers past that limit of libxml2. Text between
+    elements lives in .text/.tail rather than in separate text nodes, so the
+    insertion methods return only the inserted elements.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        declaration: The file's XML declaration, written back unchanged on save
+        tree: Parsed lxml.etree._ElementTree
+        root: Root element of the tree
+    """
+
+    def __init__(self, xml_path):
+        """
+        Initialize with path to XML file and parse it with lxml.
+
+        Args:
+            xml_path: Path to XML file to edit (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+
+        data = self.xml_path.read_bytes()
+        header = data[:200].decode("utf-8", errors="ignore")
+        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+        # XML declaration to write back on save (lxml does not keep it verbatim)
+        self.declaration = (
+            header[: header.index("?>") + 2]
+            if header.startswith("<?xml") and "?>" in header
+            else ""
+        )
+
+        self.tree = lxml.etree.parse(io.BytesIO(data), _create_safe_parser())
+        self.root = self.tree.getroot()
+
+        # Exact line numbers of elements whose sourceline is capped
+        self._big_lines = (
+            _expat_element_lines(data, self.root)
+            if data.count(b"\n") >= LIBXML2_MAX_LINE - 1
+            else {}
+        )
+
+    def get_node(
+        self,
+        tag: str,
+        attrs: Optional[dict[str, str]] = None,
+        line_number: Optional[Union[int, range]] = None,
+        contains: Optional[str] = None,
+    ):
+        """
+        Get an element by tag and identifier.
+
+        Same filters and errors as XMLEditor.get_node().
+
+        Args:
+            tag: The XML tag name (e.g., "w:del", "w:ins", "w:r")
+            attrs: Dictionary of attribute name-value pairs to match (e.g., {"w:id": "1"})
+            line_number: Line number (int) or line range (range) in original XML file (1-indexed)
+            contains: Text string that must appear in any text node within the element.
+                      Supports both entity notation (&#8220;) and Unicode characters (“).
+
+        Returns:
+            lxml.etree._Element: The matching element
+
+        Raises:
+            ValueError: If node not found or multiple matches found
+        """
+        resolved_attrs = None
+        if attrs is not None:
+            resolved_attrs = [
+                (self._resolve_name(name, is_attribute=True), value)
+                for name, value in attrs.items()
+            ]
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        matches = []
+        for elem in self._iter_tag(tag):
+            # Check line_number filter
+            if line_number is not None:
+                elem_line = self._get_element_line(elem)
+                if isinstance(line_number, range):
+                    if elem_line not in line_number:
+                        continue
+                elif elem_line != line_number:
+                    continue
+
+            # Check attrs filter (missing attributes compare as "", like minidom)
+            if resolved_attrs is not None:
+                if not all(
+                    elem.get(name, "") == value for name, value in resolved_attrs
+                ):
+                    continue
+
+            # Check contains filter
+            if normalized_contains is not None:
+                if normalized_contains not in self._get_element_text(elem):
+                    continue
+
+            matches.append(elem)
+
+        return _single_match(matches, tag, attrs, line_number, contains)
+
+    def _get_element_line(self, elem):
+        """Line of the element's start tag in the original file (None if inserted)."""
+        line = elem.sourceline
+        if line is not None and line >= LIBXML2_MAX_LINE:
+            return self._big_lines.get(elem, line)
+        return line
+
+    def _iter_tag(self, tag):
+        """Iterate elements with a qualified tag name (e.g. "w:p") in document order."""
+        prefix, _, local = tag.rpartition(":")
+        nsmap = self.root.nsmap
+        if prefix in nsmap or (not prefix and None in nsmap):
+            return self.root.iter(f"{{{nsmap[prefix or None]}}}{local}")
+        if not prefix:
+            return self.root.iter(local)
+        # Prefix only declared below the root: compare qualified names
+        return (
+            elem
+            for elem in self.root.iter(lxml.etree.Element)
+            if elem.prefix == prefix and lxml.etree.QName(elem).localname == local
+        )
+
+    def _resolve_name(self, name, is_attribute=False):
+        """Convert a qualified name (e.g. "w:id") to lxml's {namespace}local form."""
+        prefix, _, local = name.rpartition(":")
+        if not prefix:
+            # Unprefixed attributes are in no namespace
+            if is_attribute or None not in self.root.nsmap:
+                return local
+            return f"{{{self.root.nsmap[None]}}}{local}"
+        if prefix == "xml":
+            return f"{{{XML_NAMESPACE}}}{local}"
+        namespace = self.root.nsmap.get(prefix)
+        return f"{{{namespace}}}{local}" if namespace else name
+
+    def _get_element_text(self, elem):
+        """
+        Extract all text content from an element.
+
+        Skips whitespace-only text (XML formatting), like XMLEditor.
+
+        Args:
+            elem: lxml.etree._Element to extract text from
+
+        Returns:
+            str: Concatenated text from all non-whitespace text within the element
+        """
+        return "".join(text for text in elem.itertext() if text.strip())
+
+    def replace_node(self, elem, new_content):
+        """
+        Replace an element with new XML content.
+
+        Args:
+            elem: lxml.etree._Element to replace
+            new_content: String containing XML to replace the node with
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        tail = elem.tail
+        elements = self.insert_before(elem, new_content)
+        elements[-1].tail = (elements[-1].tail or "") + (tail or "")
+        elem.getparent().remove(elem)
+        return elements
+
+    def insert_after(self, elem, xml_content):
+        """
+        Insert XML content after an element.
+
+        Args:
+            elem: lxml.etree._Element to insert after
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        leading_text, elements = self._parse_fragment(xml_content)
+        tail = elem.tail
+        elem.tail = leading_text
+        anchor = elem
+        for new_elem in elements:
+            anchor.addnext(new_elem)
+            anchor = new_elem
+        elements[-1].tail = (elements[-1].tail or "") + (tail or "")
+        return elements
+
+    def insert_before(self, elem, xml_content):
+        """
+        Insert XML content before an element.
+
+        Args:
+            elem: lxml.etree._Element to insert before
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        leading_text, elements = self._parse_fragment(xml_content)
+        for new_elem in elements:
+            elem.addprevious(new_elem)
+        if leading_text:
+            _append_text_before(elements[0], leading_text)
+        return elements
+
+    def append_to(self, elem, xml_content):
+        """
+        Append XML content as a child of an element.
+
+        Args:
+            elem: lxml.etree._Element to append to
+            xml_content: String containing XML to append
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        leading_text, elements = self._parse_fragment(xml_content)
+        if leading_text:
+            if len(elem):
+                elem[-1].tail = (elem[-1].tail or "") + leading_text
+            else:
+                elem.text = (elem.text or "") + leading_text
+        for new_elem in elements:
+            elem.append(new_elem)
+        return elements
+
+    def get_next_rid(self):
+        """Get the next available rId for relationships files."""
+        max_id = 0
+        for rel_elem in self._iter_tag("Relationship"):
+            rel_id = rel_elem.get("Id", "")
+            if rel_id.startswith("rId"):
+                try:
+                    max_id = max(max_id, int(rel_id[3:]))
+                except ValueError:
+                    pass
+        return f"rId{max_id + 1}"
+
+    def save(self):
+        """
+        Save the edited XML back to the file.
+
+        Keeps the original XML declaration and encoding (ascii or utf-8).
+        """
+        content = lxml.etree.tostring(self.tree, encoding=self.encoding)
+        # tostring() adds its own declaration for non-UTF-8 encodings
+        if content.startswith(b"<?xml"):
+            content = content[content.index(b"?>") + 2 :].lstrip(b"\r\n")
+        self.xml_path.write_bytes(self.declaration.encode("ascii") + content)
+
+    def _parse_fragment(self, xml_content):
+        """
+        Parse XML fragment using the root element's namespace declarations.
+
+        Args:
+            xml_content: String containing XML fragment
+
+        Returns:
+            tuple: (text before the first element or None, list of elements)
+
+        Raises:
+            AssertionError: If fragment contains no element nodes
+        """
+        ns_decl = " ".join(
+            f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in self.root.nsmap.items()
+        )
+        wrapper = lxml.etree.fromstring(
+            f"<root {ns_decl}>{xml_content}</root>".encode("utf-8"),
+            _create_safe_parser(),
+        )
+        # Inserted content has no line in the original file (like XMLEditor)
+        for node in wrapper.iter():
+            node.sourceline = 0
+        elements = list(wrapper)
+        assert any(
+            isinstance(child.tag, str) for child in elements
+        ), "Fragment must contain at least one element"
+        return wrapper.text, elements
+
+
+def _single_match(matches, tag, attrs, line_number, contains):
+    """
+    Return the only element in matches, or raise a descriptive error.
+
+    Args:
+        matches: Elements that passed all filters of get_node()
+        tag, attrs, line_number, contains: The filters, for the error message
+
+    Raises:
+        ValueError: If no or multiple elements matched
+    """
+    if not matches:
+        # Build descriptive error message
+        filters = []
+        if line_number is not None:
+            line_str = (
+                f"lines {line_number.start}-{line_number.stop - 1}"
+                if isinstance(line_number, range)
+                else f"line {line_number}"
+            )
+            filters.append(f"at {line_str}")
+        if attrs is not None:
+            filters.append(f"with attributes {attrs}")
+        if contains is not None:
+            filters.append(f"containing '{contains}'")
+
+        filter_desc = " ".join(filters) if filters else ""
+        base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
+
+        # Add helpful hint based on filters used
+        if contains:
+            hint = "Text may be split across elements or use different wording."
+        elif line_number:
+            hint = "Line numbers may have changed if document was modified."
+        elif attrs:
+            hint = "Verify attribute values are correct."
+        else:
+            hint = "Try adding filters (attrs, line_number, or contains)."
+
+        raise ValueError(f"{base_msg}. {hint}")
+    if len(matches) > 1:
+        raise ValueError(
+            f"Multiple nodes found: <{tag}>. "
+            f"Add more filters (attrs, line_number, or contains) to narrow the search."
+        )
+    return matches[0]
+
+
+def _append_text_before(elem, text):
+    """Append text just before elem (to its previous sibling's tail or the parent's text)."""
+    previous = elem.getprevious()
+    if previous is not None:
+        previous.tail = (previous.tail or "") + text
+    else:
+        parent = elem.getparent()
+        parent.text = (parent.text or "") + text
+
+
+def _create_safe_parser():
+    """
+    Create an lxml parser that, like defusedxml, never expands entities or
+    fetches external resources.
+
+    Returns:
+        lxml.etree.XMLParser: Configured parser
+    """
+    return lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+
+
+def _expat_element_lines(data, root):
+    """
+    Map elements to their exact start tag line where sourceline is capped.
+
+    Args:
+        data: Raw bytes of the XML file root was parsed from
+        root: Root lxml element of the parsed file
+
+    Returns:
+        dict: lxml.etree._Element -> line number, for lines >= LIBXML2_MAX_LINE
+    """
+    lines = []
+    parser = xml.parsers.expat.ParserCreate()
+
+    def start_element(name, attrs):
+        lines.append(parser.CurrentLineNumber)
+
+    def entity_decl(*args):
+        raise ValueError("Entity declarations are not allowed")
+
+    parser.StartElementHandler = start_element
+    parser.EntityDeclHandler = entity_decl
+    parser.Parse(data, True)
+
+    # Both walk elements in document order
+    return {
+        elem: line
+        for elem, line in zip(root.iter(lxml.etree.Element), lines)
+        if line >= LIBXML2_MAX_LINE
+    }
+
+
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
@@ -1,29 +1,323 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Example usage:
+    python unpack.py <office_file> <output_dir>
+    python unpack.py deck.pptx unpacked --parts "ppt/slides/slide12.xml" "*.rels"
+    python unpack.py book.xlsx unpacked --all --jobs 0
+"""
+
+import argparse
+import codecs
+import fnmatch
+import os
 import random
-import sys
+import xml.parsers.expat
 import defusedxml.minidom
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+from pack import ATTRIBUTE_ESCAPES, TEXT_ESCAPES, qualified_name
+
+# Bulk-data parts that are rarely edited by hand; left compact (not
+# pretty-printed) when larger than BULK_PART_MAX_SIZE unless requested
+BULK_PARTS = [
+    "xl/sharedStrings.xml",
+    "xl/calcChain.xml",
+    "xl/pivotCache/pivotCacheRecords*.xml",
+    "xl/externalLinks/externalLink*.xml",
+    "customXml/*.xml",
+]
+BULK_PART_MAX_SIZE = 1024 * 1024
+
+# Characters read per parser call when streaming a part
+CHUNK_SIZE = 1024 * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Unpack an Office file and pretty-print its XML parts"
+    )
+    parser.add_argument("office_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "--parts",
+        nargs="+",
+        metavar="PATTERN",
+        help="Only pretty-print parts matching these names or glob patterns "
+        '(e.g. "ppt/slides/slide3.xml" "*.rels"); other parts are left compact',
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Also pretty-print large bulk-data parts such as xl/sharedStrings.xml",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for pretty-printing (0 = one per CPU, default: 1)",
+    )
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or greater")
+
+    compact_parts = unpack_document(
+        args.office_file,
+        args.output_dir,
+        parts=args.parts,
+        include_bulk=args.all,
+        jobs=args.jobs,
+    )
+    if compact_parts and not args.parts:
+        print("Large parts left compact (use --all to pretty-print them):")
+        for name in compact_parts:
+            print(f"  {name}")
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.office_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(input_file, output_dir, parts=None, include_bulk=False, jobs=1):
+    """Extract an Office file and pretty-print its XML parts.
+
+    Args:
+        input_file: Path to the .docx/.pptx/.xlsx file
+        output_dir: Directory to extract into (created if needed)
+        parts: Optional names or glob patterns of the parts to pretty-print;
+            other parts are extracted as is. Parts named here are formatted
+            even if they are large bulk-data parts (default: all XML parts)
+        include_bulk: If True, also pretty-print bulk-data parts (BULK_PARTS)
+            larger than BULK_PART_MAX_SIZE (default: False)
+        jobs: Worker processes for pretty-printing; 0 means one per CPU
+            (default: 1, format in this process)
+
+    Returns:
+        list: Names of the XML parts that were left compact
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    with zipfile.ZipFile(input_file) as zf:
+        zf.extractall(output_path)
+        members = [
+            info
+            for info in zf.infolist()
+            if not info.is_dir() and info.filename.endswith((".xml", ".rels"))
+        ]
+
+    to_format = []
+    compact_parts = []
+    for info in members:
+        if parts is not None:
+            selected = _matches_any(info.filename, parts)
+        else:
+            selected = (
+                include_bulk
+                or info.file_size <= BULK_PART_MAX_SIZE
+                or not _matches_any(info.filename, BULK_PARTS)
+            )
+        xml_file = output_path / info.filename
+        if not xml_file.is_file():
+            # Unsafe member names are rewritten by extractall
+            continue
+        if selected:
+            to_format.append(xml_file)
+        else:
+            compact_parts.append(info.filename)
+
+    # Largest parts first so they don't end up last on a single worker
+    to_format.sort(key=lambda path: path.stat().st_size, reverse=True)
+    if (jobs == 0 or jobs > 1) and len(to_format) > 1:
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+            list(executor.map(pretty_print_xml, to_format))
+    else:
+        for xml_file in to_format:
+            pretty_print_xml(xml_file)
+
+    return compact_parts
+
+
+def pretty_print_xml(xml_file):
+    """Pretty-print an XML file in place.
+
+    Streams the file through expat and writes the result as it is parsed, so
+    large parts are never held in memory as a DOM. The output is byte for byte
+    what minidom's toprettyxml(indent="  ", encoding="ascii") produces.
+
+    Args:
+        xml_file: Path to the XML file
+    """
+    xml_file = Path(xml_file)
+    temp_file = xml_file.with_name(xml_file.name + ".tmp")
+    try:
+        with open(xml_file, "rb") as source, open(
+            temp_file, "w", encoding="ascii", errors="xmlcharrefreplace", newline="\n"
+        ) as target:
+            _stream_pretty_xml(source, target)
+    except _DoctypeFound:
+        # DTDs never occur in OOXML parts; leave them to the DOM round-trip,
+        # which also rejects entity declarations
+        temp_file.unlink()
+        content = xml_file.read_text(encoding="utf-8")
+        dom = defusedxml.minidom.parseString(content)
+        xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
+        return
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+    os.replace(temp_file, xml_file)
+
+
+def _stream_pretty_xml(source, target):
+    """Write the pretty-printed form of the XML in source to target."""
+    out = []
+    # One [name, indent, state, held child] entry per open element; state is
+    # _EMPTY (no children yet), _HELD (one text or CDATA child held back, as it
+    # is written inline if it stays the only child) or _BLOCK
+    stack = []
+    text_run = []
+    cdata_start = []
+    namespace_decls = []
+
+    def write_block(node, indent):
+        kind, data = node
+        if kind == "text":
+            out.append((indent + data + "\n").translate(TEXT_ESCAPES))
+        elif kind == "cdata":
+            out.append(f"<![CDATA[{data}]]>")
+        elif kind == "comment":
+            out.append(f"{indent}<!--{data}-->\n")
+        else:
+            out.append(f"{indent}<?{data}?>\n")
+
+    def child_indent():
+        """Prepare the open element for another child; return its indent."""
+        if not stack:
+            return ""
+        top = stack[-1]
+        if top[2] == _EMPTY:
+            out.append(">\n")
+        elif top[2] == _HELD:
+            out.append(">\n")
+            write_block(top[3], top[1] + "  ")
+            top[3] = None
+        top[2] = _BLOCK
+        return top[1] + "  "
+
+    def add_child(node):
+        if stack and stack[-1][2] == _EMPTY and node[0] in ("text", "cdata"):
+            stack[-1][2] = _HELD
+            stack[-1][3] = node
+        else:
+            write_block(node, child_indent())
+        if len(out) > 4096:
+            target.write("".join(out))
+            out.clear()
+
+    def flush_text():
+        # Contiguous character data is one minidom text node
+        if text_run:
+            add_child(("text", "".join(text_run)))
+            text_run.clear()
+
+    def start_element(name, attributes):
+        flush_text()
+        indent = child_indent()
+        name = qualified_name(name)
+        # minidom puts namespace declarations before the other attributes
+        tag = [indent, "<", name]
+        for prefix, uri in namespace_decls:
+            tag += [" xmlns:" + prefix if prefix else " xmlns", '="']
+            tag += [(uri or "").translate(ATTRIBUTE_ESCAPES), '"']
+        namespace_decls.clear()
+        for i in range(0, len(attributes), 2):
+            tag += [" ", qualified_name(attributes[i]), '="']
+            tag += [attributes[i + 1].translate(ATTRIBUTE_ESCAPES), '"']
+        out.append("".join(tag))
+        stack.append([name, indent, _EMPTY, None])
+
+    def end_element(name):
+        flush_text()
+        name, indent, state, held = stack.pop()
+        if state == _EMPTY:
+            out.append("/>\n")
+        elif state == _HELD:
+            kind, data = held
+            if kind == "text":
+                out.append(">" + data.translate(TEXT_ESCAPES) + f"</{name}>\n")
+            else:
+                out.append(f"><![CDATA[{data}]]></{name}>\n")
+        else:
+            out.append(f"{indent}</{name}>\n")
+
+    def start_cdata():
+        cdata_start.append(len(text_run))
+
+    def end_cdata():
+        # An empty section creates no node, so the text around it stays one
+        # text node
+        start = cdata_start.pop()
+        cdata = "".join(text_run[start:])
+        if cdata:
+            del text_run[start:]
+            flush_text()
+            add_child(("cdata", cdata))
+
+    def comment(data):
+        flush_text()
+        add_child(("comment", data))
+
+    def processing_instruction(name, data):
+        flush_text()
+        add_child(("pi", f"{name} {data}"))
+
+    def start_doctype(*args):
+        raise _DoctypeFound()
+
+    parser = xml.parsers.expat.ParserCreate(namespace_separator=" ")
+    parser.namespace_prefixes = True
+    parser.ordered_attributes = True
+    parser.specified_attributes = True
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = text_run.append
+    parser.StartCdataSectionHandler = start_cdata
+    parser.EndCdataSectionHandler = end_cdata
+    parser.CommentHandler = comment
+    parser.ProcessingInstructionHandler = processing_instruction
+    parser.StartNamespaceDeclHandler = lambda prefix, uri: namespace_decls.append(
+        (prefix, uri)
+    )
+    parser.StartDoctypeDeclHandler = start_doctype
+
+    # Parts are read as UTF-8 text, whatever their declaration says
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    out.append('<?xml version="1.0" encoding="ascii"?>\n')
+    while chunk := source.read(CHUNK_SIZE):
+        parser.Parse(decoder.decode(chunk), False)
+    parser.Parse(decoder.decode(b"", True), True)
+    target.write("".join(out))
+
+
+def _matches_any(name, patterns):
+    """Check a part name against names and glob patterns."""
+    return any(
+        name == pattern or fnmatch.fnmatchcase(name, pattern) for pattern in patterns
+    )
+
+
+_EMPTY, _HELD, _BLOCK = range(3)
+
+
+class _DoctypeFound(Exception):
+    """Raised while streaming to fall back to the DOM round-trip."""
+
+
+if __name__ == "__main__":
+    main()
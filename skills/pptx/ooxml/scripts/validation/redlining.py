@@ -2,19 +2,36 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
+import difflib
+import re
 import tempfile
 import zipfile
 from pathlib import Path
 
+# Largest len(a) * len(b) diffed token by token; bigger spans fall back to a
+# coarser granularity so the diff stays fast on very large edits
+DIFF_MAX_COMPARISONS = 1_000_000
+
+# Paragraphs of a changed block are paired with their most similar
+# counterpart (at least this similar) unless the block is too large to compare
+PAIRING_MAX_COMPARISONS = 10_000
+PAIRING_MIN_SIMILARITY = 0.5
+
+# Words, runs of whitespace and single punctuation characters
+WORD_PATTERN = re.compile(r"\w+|\s+|[^\w\s]")
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
+    def __init__(
+        self, unpacked_dir, original_docx, verbose=False, changed_parts=None
+    ):
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
+        # Part names changed since the last successful validation (None = unknown)
+        self.changed_parts = None if changed_parts is None else set(changed_parts)
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
@@ -27,6 +44,15 @@ class RedliningValidator:
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
 
+        # Only document.xml is compared, so its previous result still holds
+        if (
+            self.changed_parts is not None
+            and "word/document.xml" not in self.changed_parts
+        ):
+            if self.verbose:
+                print("PASSED - document.xml unchanged since last validation")
+            return True
+
         # First, check if there are any tracked changes by Claude to validate
         try:
             import xml.etree.ElementTree as ET
@@ -112,7 +138,7 @@ class RedliningValidator:
             return True
 
     def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        """Generate detailed word-level differences between the two texts."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,92 +153,140 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
-        else:
-            error_parts.append("Unable to generate word diff (git not available)")
+        error_parts.extend(
+            [
+                "Differences:",
+                "============",
+                self._get_word_diff(original_text, modified_text),
+            ]
+        )
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
+    def _get_word_diff(self, original_text, modified_text):
+        """Generate a word diff of two texts, one paragraph per line.
 
-        return None
+        Paragraphs are aligned first and only changed ones are shown, in the
+        style of git diff --word-diff=plain -U0: removed text in [-...-] and
+        added text in {+...+}. Paired paragraphs are compared character by
+        character, or word by word when they are too long for that.
+        """
+        original_lines = original_text.split("\n")
+        modified_lines = modified_text.split("\n")
+        # Past the budget, let the matcher ignore paragraphs that repeat
+        # throughout the document (empty lines, headings, boilerplate);
+        # aligning on them is what makes long, repetitive documents slow
+        autojunk = len(original_lines) * len(modified_lines) > DIFF_MAX_COMPARISONS
+        matcher = difflib.SequenceMatcher(
+            None, original_lines, modified_lines, autojunk=autojunk
+        )
+
+        diff_lines = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            for old, new in self._pair_paragraphs(
+                original_lines[i1:i2], modified_lines[j1:j2]
+            ):
+                if old == new:
+                    # In-order pairing can line up unchanged paragraphs
+                    continue
+                if new is None:
+                    diff_lines.append(f"[-{old}-]")
+                elif old is None:
+                    diff_lines.append(f"{{+{new}+}}")
+                else:
+                    diff_lines.append(self._diff_paragraph(old, new))
+        return "\n".join(line for line in diff_lines if line.strip())
+
+    def _pair_paragraphs(self, removed, added):
+        """Pair the edited paragraphs of a changed block, keeping their order.
+
+        Each removed paragraph is paired with the most similar of the added
+        paragraphs that follow the previous pair; added paragraphs skipped over
+        and removed paragraphs without a similar match stand alone.
+
+        Returns:
+            list: (old, new) tuples where old or new is None for a paragraph
+                that was only added or only removed
+        """
+        if len(removed) * len(added) > PAIRING_MAX_COMPARISONS:
+            # Too many candidates to compare; pair in order
+            pairs = list(zip(removed, added))
+            pairs += [(old, None) for old in removed[len(added) :]]
+            pairs += [(None, new) for new in added[len(removed) :]]
+            return pairs
+
+        added_words = [WORD_PATTERN.findall(new) for new in added]
+        pairs = []
+        next_added = 0
+        budget = DIFF_MAX_COMPARISONS
+        for old in removed:
+            old_words = WORD_PATTERN.findall(old)
+            matcher = difflib.SequenceMatcher(autojunk=False)
+            matcher.set_seq2(old_words)
+            best, best_ratio = None, PAIRING_MIN_SIMILARITY
+            for index in range(next_added, len(added)):
+                matcher.set_seq1(added_words[index])
+                if matcher.real_quick_ratio() <= best_ratio:
+                    continue
+                ratio = matcher.quick_ratio()
+                # The exact ratio is quadratic, so the block shares one budget
+                # for it and settles for the quick estimate once that runs out
+                cost = len(old_words) * len(added_words[index])
+                if ratio > best_ratio and cost <= budget:
+                    budget -= cost
+                    ratio = matcher.ratio()
+                if ratio > best_ratio:
+                    best, best_ratio = index, ratio
+            if best is None:
+                pairs.append((old, None))
+                continue
+            pairs += [(None, new) for new in added[next_added:best]]
+            pairs.append((old, added[best]))
+            next_added = best + 1
+        pairs += [(None, new) for new in added[next_added:]]
+        return pairs
+
+    def _diff_paragraph(self, old, new):
+        """Mark up the differences between two versions of a paragraph."""
+        # Common prefix and suffix are cheap to strip and keep the span that
+        # needs a real diff small for typical local edits
+        prefix = 0
+        limit = min(len(old), len(new))
+        while prefix < limit and old[prefix] == new[prefix]:
+            prefix += 1
+        suffix = 0
+        limit -= prefix
+        while suffix < limit and old[-1 - suffix] == new[-1 - suffix]:
+            suffix += 1
+        old_middle = old[prefix : len(old) - suffix]
+        new_middle = new[prefix : len(new) - suffix]
+
+        if len(old_middle) * len(new_middle) <= DIFF_MAX_COMPARISONS:
+            middle = self._diff_tokens(list(old_middle), list(new_middle))
+        else:
+            old_words = WORD_PATTERN.findall(old_middle)
+            new_words = WORD_PATTERN.findall(new_middle)
+            if len(old_words) * len(new_words) <= DIFF_MAX_COMPARISONS:
+                middle = self._diff_tokens(old_words, new_words)
+            else:
+                middle = self._diff_tokens([old_middle], [new_middle])
+        return old[:prefix] + middle + old[len(old) - suffix :]
+
+    def _diff_tokens(self, old_tokens, new_tokens):
+        """Join two token lists into one string with [-...-] and {+...+} marks."""
+        matcher = difflib.SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+        parts = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                parts.append("".join(old_tokens[i1:i2]))
+                continue
+            if i2 > i1:
+                parts.append("[-" + "".join(old_tokens[i1:i2]) + "-]")
+            if j2 > j1:
+                parts.append("{+" + "".join(new_tokens[j1:j2]) + "+}")
+        return "".join(parts)
 
     def _remove_claude_tracked_changes(self, root):
         """Remove tracked changes authored by Claude from the XML root."""